@@ -17,6 +17,22 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 MEDIA_ROOT = os.path.join(BASE_DIR, "media")
 MEDIA_URL = "/media/"
 
+# Connections the checks of the audits of one target share, besides the one each audit
+# runs on; an audit runs its checks concurrently over them, 1 runs them one after another
+AUDITIX_POOL_SIZE = 4
+# Seconds a pooled connection may stay idle before it is closed
+AUDITIX_POOL_MAX_IDLE = 300
+# Targets (per login) whose connections are kept, least recently audited dropped first
+AUDITIX_MAX_POOLS = 16
+# Audits submitted as background jobs that run at the same time
+AUDITIX_JOB_WORKERS = 2
+# Audits one ASGI process runs at the same time outside the event loop
+AUDITIX_ASYNC_WORKERS = 8
+# Reports kept under MEDIA_ROOT/reports: for at most this many seconds and bytes altogether,
+# the least recently downloaded removed first
+AUDITIX_REPORT_MAX_AGE = 7 * 24 * 3600
+AUDITIX_REPORT_MAX_BYTES = 512 * 1024 * 1024
+
 
 
 # Quick-start development settings - unsuitable for production
@@ -85,6 +101,9 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        # On a file, so that the job workers' writes wait out the test's reads
+        # instead of failing on the locked tables of a shared in-memory database
+        'TEST': {'NAME': BASE_DIR / 'test_db.sqlite3'},
     }
 }
 
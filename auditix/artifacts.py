@@ -0,0 +1,182 @@
+"""
+Report artifacts kept under MEDIA_ROOT/reports.
+
+Every run writes its report to a temporary file of its own, so concurrent
+audits never write to the same file.  The name the report is downloaded as
+and its content are hashed as it is written and, once complete, it is moved
+to ``reports/<sha256>/<file name>``: the digest is the artifact's id, the
+report is served by it, and an artifact holds that one file.
+
+Artifacts are kept for at most AUDITIX_REPORT_MAX_AGE seconds and
+AUDITIX_REPORT_MAX_BYTES bytes altogether.  Every new artifact prunes the
+ones older than that, then the least recently used ones (written or
+downloaded longest ago) until the rest fit; none used in the last RECENT
+seconds, which another thread may be about to serve.
+"""
+import hashlib
+import os
+import re
+import shutil
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+REPORTS_DIR = "reports"
+
+# Seconds an artifact is kept when the AUDITIX_REPORT_MAX_AGE setting is not set
+MAX_AGE = 7 * 24 * 3600
+
+# Bytes of artifacts kept when the AUDITIX_REPORT_MAX_BYTES setting is not set
+MAX_BYTES = 512 * 1024 * 1024
+
+# Response header carrying the id of the artifact a report was served from
+ARTIFACT_HEADER = "X-Auditix-Report"
+
+# Seconds after its last use during which an artifact is never pruned
+RECENT = 60
+
+ARTIFACT_ID = re.compile(r"[0-9a-f]{64}")
+PART_SUFFIX = ".part"
+
+_prune_lock = threading.Lock()
+
+
+def root():
+    return os.path.join(settings.MEDIA_ROOT, REPORTS_DIR)
+
+
+def max_age():
+    return getattr(settings, "AUDITIX_REPORT_MAX_AGE", MAX_AGE)
+
+
+def max_bytes():
+    return getattr(settings, "AUDITIX_REPORT_MAX_BYTES", MAX_BYTES)
+
+
+class ArtifactWriter:
+    """A report being written to a file of its own and moved to its content address when closed."""
+
+    def __init__(self, file_name):
+        self.file_name = os.path.basename(file_name)
+        self.artifact_id = None
+        self.digest = hashlib.sha256(self.file_name.encode("utf-8") + b"\0")
+        os.makedirs(root(), exist_ok=True)
+        self.temp_path = os.path.join(root(), uuid.uuid4().hex + PART_SUFFIX)
+        self.file = open(self.temp_path, "w", encoding="utf-8")
+
+    def write(self, text):
+        self.file.write(text)
+        self.digest.update(text.encode("utf-8"))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        # What was written is kept even when the audit stopped halfway, as the report file always was
+        self.close()
+        return False
+
+    def close(self):
+        if self.artifact_id is not None:
+            return
+        self.file.close()
+        artifact_id = self.digest.hexdigest()
+        directory = os.path.join(root(), artifact_id)
+        os.makedirs(directory, exist_ok=True)
+        os.replace(self.temp_path, os.path.join(directory, self.file_name))
+        touch(directory)
+        self.artifact_id = artifact_id
+        prune(keep=artifact_id)
+
+    @property
+    def path(self):
+        return os.path.join(root(), self.artifact_id, self.file_name)
+
+
+def touch(directory):
+    # An artifact's last use is the modification time of its directory
+    try:
+        os.utime(directory)
+    except OSError:
+        pass
+
+
+def find(artifact_id):
+    """The path of the report of artifact_id, None when there is no such artifact (any more)."""
+    if not artifact_id or not ARTIFACT_ID.fullmatch(artifact_id):
+        return None
+    directory = os.path.join(root(), artifact_id)
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return None
+    # An artifact holds the one file its id was hashed with
+    return os.path.join(directory, names[0]) if len(names) == 1 else None
+
+
+def open_artifact(artifact_id):
+    """The report of artifact_id opened for reading and its file name, None when it is gone."""
+    path = find(artifact_id)
+    if path is None:
+        return None
+    try:
+        report = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    touch(os.path.dirname(path))
+    return report, os.path.basename(path)
+
+
+def size(path):
+    if not os.path.isdir(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+
+
+def prune(keep=None, now=None):
+    """
+    Remove the artifacts older than max_age(), then the least recently used
+    ones until those left take at most max_bytes(); never the one whose id
+    is ``keep`` nor one used in the last RECENT seconds.  Returns the ids
+    removed.  A prune already running in
+    another thread makes this one return at once.
+    """
+    if not _prune_lock.acquire(blocking=False):
+        return []
+    try:
+        now = time.time() if now is None else now
+        artifacts = []
+        for entry in os.scandir(root()):
+            try:
+                artifacts.append((entry.stat().st_mtime, size(entry.path), entry.name, entry.path))
+            except OSError:
+                # Removed meanwhile
+                continue
+        artifacts.sort()
+        total = sum(artifact[1] for artifact in artifacts)
+        removed = []
+        for used, nbytes, name, path in artifacts:
+            if name == keep or now - used < RECENT:
+                continue
+            if now - used <= max_age():
+                if total <= max_bytes():
+                    break
+                if name.endswith(PART_SUFFIX):
+                    # A report still being written
+                    continue
+            if os.path.isdir(path):
+                shutil.rmtree(path, ignore_errors=True)
+            else:
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+            total -= nbytes
+            removed.append(name)
+        return removed
+    except FileNotFoundError:
+        return []
+    finally:
+        _prune_lock.release()
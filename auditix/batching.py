@@ -0,0 +1,224 @@
+"""
+Round-trip batching of independent statements.
+
+Latency to a remote server dominates an audit, so statements that do not
+depend on each other are sent together, ``BATCH_SIZE`` per round trip, in
+the form each driver can read back:
+
+* SQL Server: one T-SQL batch whose result sets are read in turn with
+  ``nextset()``.
+* PostgreSQL: one SELECT with a ``json_agg`` column per statement, since
+  psycopg2 only returns the last result of a multi-statement string.  Each
+  row comes back as the text form of its values in column order, which the
+  cursor's typecasters turn into what ``fetchall()`` would have returned.
+  That needs the column names and types of the statement, so a statement
+  is batched only once it ran alone on the same server and its columns
+  were all named and distinct.
+* Oracle: one anonymous PL/SQL block opening a ref cursor per statement.
+
+When a batch fails, one statement is usually to blame, so the statements of
+that batch are run again one at a time and only the failing ones keep the
+error.  Dialects without a batcher always run statements one at a time.
+"""
+
+# Statements sent per round trip
+BATCH_SIZE = 32
+
+
+class BatchError(Exception):
+    """The statements cannot be sent as one batch; they are run one at a time instead."""
+
+
+class StatementResult:
+    """Column names and rows of one statement, or the driver error it raised."""
+
+    def __init__(self, columns=(), rows=(), error=None):
+        self.columns = list(columns)
+        self.rows = list(rows)
+        self.error = error
+
+    def fetch(self):
+        if self.error is not None:
+            raise self.error
+        return self.rows
+
+
+def columns_of(cursor):
+    return [column[0] for column in cursor.description or ()]
+
+
+def strip_statement(statement):
+    return statement.strip().rstrip(";").strip()
+
+
+class Batcher:
+    def fetch(self, cursor, statements):
+        """A StatementResult per ``(statement, params)``, from one round trip."""
+        raise NotImplementedError
+
+    def batchable(self, cursor, statement):
+        return True
+
+    def described(self, cursor, statement):
+        # Called after statement ran alone on cursor, with its description
+        pass
+
+    def reset(self, cursor):
+        # Called after a failed batch or statement, before the next one runs
+        pass
+
+
+class TsqlBatcher(Batcher):
+    def fetch(self, cursor, statements):
+        params = []
+        for statement, values in statements:
+            if isinstance(values, dict):
+                raise BatchError("pyodbc binds positional parameters only")
+            params.extend(values or ())
+        batch = "SET NOCOUNT ON;\n" + ";\n".join(strip_statement(statement) for statement, values in statements)
+        if params:
+            cursor.execute(batch, params)
+        else:
+            cursor.execute(batch)
+        results = []
+        for index in range(len(statements)):
+            if index and not cursor.nextset():
+                raise BatchError(f"batch returned {index} result sets for {len(statements)} statements")
+            results.append(StatementResult(columns_of(cursor), cursor.fetchall()))
+        return results
+
+
+class JsonBatcher(Batcher):
+    def __init__(self):
+        # (server, statement) -> [(column name, type oid)] of the statements that can be batched
+        self.columns = {}
+
+    def key(self, cursor, statement):
+        return cursor.connection.dsn, strip_statement(statement)
+
+    def batchable(self, cursor, statement):
+        return self.key(cursor, statement) in self.columns
+
+    def described(self, cursor, statement):
+        columns = [(column[0], column[1]) for column in cursor.description or ()]
+        names = {name for name, oid in columns}
+        # Unnamed (?column?) and repeated names cannot be selected from the statement one by one
+        if columns and len(names) == len(columns) and "?column?" not in names:
+            self.columns[self.key(cursor, statement)] = columns
+
+    def fetch(self, cursor, statements):
+        styles = {isinstance(values, dict) for statement, values in statements if values}
+        if len(styles) > 1:
+            raise BatchError("named and positional parameters cannot be mixed in one statement")
+        params = {} if True in styles else []
+        for statement, values in statements:
+            if isinstance(params, dict):
+                for name, value in (values or {}).items():
+                    if params.get(name, value) != value:
+                        raise BatchError(f"bind variable {name} has different values")
+                    params[name] = value
+            else:
+                params.extend(values or ())
+        described = [self.columns[self.key(cursor, statement)] for statement, values in statements]
+        selects = []
+        for (statement, values), columns in zip(statements, described):
+            statement = strip_statement(statement)
+            if params and not values:
+                # Only statements with parameters of their own have their % escaped already
+                statement = statement.replace("%", "%%")
+            row = ", ".join(f"q.{quote_name(name)}::text" for name, oid in columns)
+            selects.append(f"(SELECT COALESCE(json_agg(json_build_array({row})), '[]'::json) FROM ({statement}) q)")
+        batch = "SELECT " + ",\n       ".join(selects)
+        if params:
+            cursor.execute(batch, params)
+        else:
+            cursor.execute(batch)
+        row = cursor.fetchone()
+        return [StatementResult([name for name, oid in columns],
+                                [tuple(None if value is None else cursor.cast(oid, value)
+                                       for (name, oid), value in zip(columns, found)) for found in rows])
+                for columns, rows in zip(described, row)]
+
+    def reset(self, cursor):
+        # A failed statement aborts the transaction the retries would run in
+        cursor.connection.rollback()
+
+
+def quote_name(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+class RefCursorBatcher(Batcher):
+    def fetch(self, cursor, statements):
+        binds = {}
+        lines = []
+        cursors = []
+        for index, (statement, values) in enumerate(statements):
+            if values is not None and not isinstance(values, dict):
+                raise BatchError("only named bind variables can be shared by one block")
+            for name, value in (values or {}).items():
+                if binds.get(name, value) != value:
+                    raise BatchError(f"bind variable {name} has different values")
+                binds[name] = value
+            ref = cursor.connection.cursor()
+            ref.arraysize = cursor.arraysize
+            binds[f"batch_cursor{index}"] = ref
+            cursors.append(ref)
+            lines.append(f"OPEN :batch_cursor{index} FOR {strip_statement(statement)};")
+        try:
+            cursor.execute("BEGIN\n" + "\n".join(lines) + "\nEND;", binds)
+            return [StatementResult(columns_of(ref), ref.fetchall()) for ref in cursors]
+        finally:
+            for ref in cursors:
+                ref.close()
+
+
+BATCHERS = {
+    "mssql": TsqlBatcher(),
+    "oracle": RefCursorBatcher(),
+    "postgres": JsonBatcher(),
+}
+
+
+def one_by_one(cursor, statements, db_errors, batcher=None):
+    results = []
+    for statement, params in statements:
+        try:
+            if params is None:
+                cursor.execute(statement)
+            else:
+                cursor.execute(statement, params)
+            results.append(StatementResult(columns_of(cursor), cursor.fetchall()))
+            if batcher is not None:
+                batcher.described(cursor, statement)
+        except db_errors as e:
+            results.append(StatementResult(error=e))
+            if batcher is not None:
+                batcher.reset(cursor)
+    return results
+
+
+def fetch_batch(dialect, cursor, statements, db_errors):
+    """A StatementResult for each ``(statement, params)``, in order, in as few round trips as possible."""
+    statements = list(statements)
+    batcher = BATCHERS.get(dialect)
+    results = []
+    for start in range(0, len(statements), BATCH_SIZE):
+        chunk = statements[start:start + BATCH_SIZE]
+        if batcher is None:
+            results.extend(one_by_one(cursor, chunk, db_errors))
+            continue
+        batched = [index for index, (statement, params) in enumerate(chunk) if batcher.batchable(cursor, statement)]
+        if len(batched) < 2:
+            batched = []
+        alone = [index for index in range(len(chunk)) if index not in batched]
+        found = dict(zip(alone, one_by_one(cursor, [chunk[index] for index in alone], db_errors, batcher)))
+        if batched:
+            try:
+                found.update(zip(batched, batcher.fetch(cursor, [chunk[index] for index in batched])))
+            except db_errors + (BatchError,):
+                batcher.reset(cursor)
+                found.update(zip(batched, one_by_one(cursor, [chunk[index] for index in batched], db_errors,
+                                                     batcher)))
+        results.extend(found[index] for index in range(len(chunk)))
+    return results
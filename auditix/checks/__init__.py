@@ -0,0 +1,161 @@
+"""
+Declarative registry of benchmark checks.
+
+Every check names the benchmark item it implements, the dialect and report
+section it belongs to, how its data is collected (a query or a collector
+callable) and how that data is judged (the evaluator).  The engine in
+``auditix.engine`` plans and executes audit runs over this registry.
+"""
+import importlib
+
+# Check scopes
+SERVER = "server"
+DATABASE = "database"
+
+# Check statuses, named after the counters and CSS classes used in the reports
+PASSED = "Passed"
+FAILED = "Failed"
+MANUAL = "Manual"
+NO_PERMISSION = "NoPermission"
+STATUSES = (PASSED, FAILED, MANUAL, NO_PERMISSION)
+
+# Modules that register the checks of each dialect, imported on first use
+DIALECT_MODULES = {
+    "mssql": "auditix.checks.mssql",
+    "oracle": "auditix.checks.oracle",
+    "postgres": "auditix.checks.postgres",
+}
+
+
+class Section:
+    """A report section: the headings written above one table of checks."""
+
+    def __init__(self, dialect, key, headings, standard="CIS"):
+        self.dialect = dialect
+        self.key = key
+        self.headings = tuple(headings)
+        self.standard = standard
+
+    def __repr__(self):
+        return f"<Section {self.dialect} {self.standard} {self.key}>"
+
+
+class Check:
+    """
+    One benchmark item.
+
+    ``query`` is a SQL statement (or a tuple of statements whose rows are
+    concatenated) run by the engine with the bind variables in ``params``,
+    never with values formatted into its text; ``collector`` is a callable taking the
+    run context for anything that is not a plain query.  The collected data
+    is handed to ``evaluator``, which returns a status or a
+    ``(status, note)`` pair.
+
+    ``scope`` is "server" for items judged once per server or cluster and
+    "database" for objects living in each database (tables, policies,
+    installed extensions), which an audit of all databases repeats in
+    every one of them.
+    """
+
+    def __init__(self, dialect, check_id, title, section, evaluator, query=None, params=None,
+                 collector=None, severity="medium", standard="CIS", scope=SERVER):
+        if query is not None and collector is not None:
+            raise ValueError(f"Check {check_id} defines both a query and a collector")
+        self.dialect = dialect
+        self.check_id = check_id
+        self.title = title
+        self.section = section
+        self.evaluator = evaluator
+        self.query = query
+        self.params = params
+        self.collector = collector
+        self.severity = severity
+        self.standard = standard
+        self.scope = scope
+
+    @property
+    def label(self):
+        return f"{self.check_id} {self.title}"
+
+    def collect(self, ctx):
+        if self.collector is not None:
+            return self.collector(ctx)
+        if self.query is not None:
+            return ctx.fetch_all(self.query, self.params)
+        return None
+
+    def evaluate(self, data):
+        outcome = self.evaluator(data)
+        if isinstance(outcome, tuple):
+            status, note = outcome
+        else:
+            status, note = outcome, None
+        if status not in STATUSES:
+            raise ValueError(f"Check {self.check_id} returned unknown status {status!r}")
+        return status, note
+
+    def __repr__(self):
+        return f"<Check {self.dialect} {self.check_id}>"
+
+
+class CheckRegistry:
+    """Sections and checks per dialect and standard, in report order."""
+
+    def __init__(self):
+        self._sections = {}
+        self._checks = {}
+
+    def add_section(self, dialect, key, *headings, standard="CIS"):
+        sections = self._sections.setdefault((dialect, standard), {})
+        if key in sections:
+            raise ValueError(f"Section {key} is already registered for {dialect}")
+        sections[key] = Section(dialect, key, headings, standard)
+        return sections[key]
+
+    def add(self, check):
+        sections = self._sections.get((check.dialect, check.standard), {})
+        if check.section not in sections:
+            raise ValueError(f"Check {check.check_id} refers to unknown section {check.section}")
+        checks = self._checks.setdefault((check.dialect, check.standard), {})
+        if check.check_id in checks:
+            raise ValueError(f"Check {check.check_id} is already registered for {check.dialect}")
+        checks[check.check_id] = check
+        return check
+
+    def check(self, dialect, check_id, title, section, **options):
+        # Decorator form: the decorated function becomes the evaluator
+        def decorator(evaluator):
+            self.add(Check(dialect, check_id, title, section, evaluator, **options))
+            return evaluator
+        return decorator
+
+    def manual(self, dialect, check_id, title, section, **options):
+        return self.add(Check(dialect, check_id, title, section, lambda data: MANUAL, **options))
+
+    def sections(self, dialect, standard="CIS"):
+        return list(self._sections.get((dialect, standard), {}).values())
+
+    def checks(self, dialect, standard="CIS"):
+        return list(self._checks.get((dialect, standard), {}).values())
+
+    def get(self, dialect, check_id, standard="CIS"):
+        return self._checks[(dialect, standard)][check_id]
+
+
+registry = CheckRegistry()
+
+
+def load(dialect):
+    # Importing a dialect module registers its sections and checks
+    importlib.import_module(DIALECT_MODULES[dialect])
+    return registry
+
+
+# Evaluators shared by many checks
+
+def passed_if_empty(rows):
+    return PASSED if not rows else FAILED
+
+
+def passed_if_any(rows):
+    return PASSED if rows else FAILED
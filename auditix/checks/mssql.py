@@ -0,0 +1,284 @@
+"""
+CIS Microsoft SQL Server 2022 Benchmark v1.1.0 checks.
+
+Checks on objects inside the databases read the one database pass of the
+run (see ``auditix.collectors.mssql``) rather than visiting the databases
+themselves; configuration options and registry values are read from the
+snapshots of the run.
+"""
+from functools import partial
+
+from ..collectors.mssql import configurations, database_pass, registry_values
+from . import FAILED, NO_PERMISSION, PASSED, passed_if_empty, registry
+
+section = partial(registry.add_section, "mssql")
+check = partial(registry.check, "mssql")
+manual = partial(registry.manual, "mssql")
+
+
+def in_databases(key):
+    # Collector for one per-database query of the database pass
+    return lambda ctx: database_pass(ctx).findings(key)
+
+
+def none_in_databases(data):
+    """Passes when no database returned rows; names the databases that did or could not be read."""
+    found, errors = data
+    failing = sorted(database for database, rows in found.items() if rows)
+    if failing:
+        return FAILED, ", ".join(failing)
+    if errors:
+        return NO_PERMISSION, f"Could not read {', '.join(sorted(errors))}"
+    return PASSED
+
+
+def configuration_rule(name, expected):
+    """Collector and evaluator for one option; both its configured and running value must be expected."""
+    def collect(ctx):
+        return configurations(ctx).get(name)
+
+    def evaluate(option):
+        return PASSED if option == (expected, expected) else FAILED
+
+    return collect, evaluate
+
+
+def configuration_check(check_id, title, section, name, expected):
+    collector, evaluator = configuration_rule(name, expected)
+    check(check_id, title, section, collector=collector)(evaluator)
+
+
+def registry_value(name):
+    return lambda ctx: registry_values(ctx).get(name)
+
+
+# 2. Surface Area Reduction
+section("2", "2. Surface Area Reduction")
+
+configuration_check("2.1", "Ensure 'Ad Hoc Distributed Queries' Server Configuration Option is set to '0' (Scored)",
+                    "2", "Ad Hoc Distributed Queries", 0)
+
+
+@check("2.2", "Ensure 'CLR Enabled' Server Configuration Option is set to '0' (Automated)", "2",
+       collector=lambda ctx: (configurations(ctx).get("clr enabled"), configurations(ctx).get("clr strict security")))
+def clr_disabled(options):
+    # Not applicable, and so passed, while 'clr strict security' is on
+    enabled, strict = options
+    return PASSED if enabled == (0, 0) or strict == (1, 1) else FAILED
+
+
+configuration_check("2.3", "Ensure 'Cross DB Ownership Chaining' Server Configuration Option is set to '0' (Automated)",
+                    "2", "cross db ownership chaining", 0)
+configuration_check("2.4", "Ensure 'Database Mail XPs' Server Configuration Option is set to '0' (Automated)",
+                    "2", "Database Mail XPs", 0)
+configuration_check("2.5", "Ensure 'Ole Automation Procedures' Server Configuration option is set to '0' (Automated)",
+                    "2", "Ole Automation Procedures", 0)
+configuration_check("2.6", "Ensure 'Remote Access' Server Configuration Option is set to '0' (Automated)",
+                    "2", "remote access", 0)
+
+
+def remote_admin_collector(ctx):
+    clustered = ctx.fetch_all("SELECT CAST(SERVERPROPERTY('IsClustered') AS int)")
+    return configurations(ctx).get("remote admin connections"), clustered[0][0] == 1
+
+
+@check("2.7", "Ensure 'Remote Admin Connections' Server Configuration Option is set to '0' (Automated)", "2",
+       collector=remote_admin_collector)
+def remote_admin_connections(data):
+    # Failover clusters need the dedicated admin connection and are exempt
+    option, clustered = data
+    return PASSED if clustered or option == (0, 0) else FAILED
+
+
+configuration_check("2.8", "Ensure 'Scan For Startup Procs' Server Configuration Option is set to '0' (Automated)",
+                    "2", "scan for startup procs", 0)
+
+check("2.9", "Ensure 'Trustworthy' Database Property is set to 'Off' (Automated)", "2", query="""
+    SELECT name
+    FROM sys.databases
+    WHERE is_trustworthy_on = 1
+    AND name != 'msdb'
+""")(passed_if_empty)
+
+manual("2.10", "Ensure Unnecessary SQL Server Protocols are set to 'Disabled' (Manual)", "2")
+
+
+@check("2.11", "Ensure SQL Server is configured to use non-standard ports (Automated)", "2",
+       collector=registry_value("TcpPort"))
+def non_standard_port(port):
+    return FAILED if port == '1433' else PASSED
+
+
+@check("2.12", "Ensure 'Hide Instance' option is set to 'Yes' for Production SQL Server instances (Automated)", "2",
+       collector=registry_value("HideInstance"))
+def hide_instance(value):
+    return PASSED if value == 1 else FAILED
+
+
+@check("2.13", "Ensure the 'sa' Login Account is set to 'Disabled' (Automated)", "2",
+       query="SELECT name, is_disabled FROM sys.server_principals WHERE sid = 0x01")
+def sa_disabled(rows):
+    return PASSED if rows and rows[0][1] == 1 else FAILED
+
+
+@check("2.14", "Ensure 'sa' Login Account has been renamed (Scored)", "2",
+       query="SELECT name FROM sys.server_principals WHERE sid = 0x01")
+def sa_renamed(rows):
+    return FAILED if rows and rows[0][0] == "sa" else PASSED
+
+
+check("2.15", "Ensure 'AUTO_CLOSE' is set to 'OFF' on contained databases (Automated)", "2", query="""
+    SELECT name, containment, containment_desc, is_auto_close_on
+    FROM sys.databases
+    WHERE containment <> 0 and is_auto_close_on = 1
+""")(passed_if_empty)
+
+check("2.16", "Ensure no login exists with the name 'sa' (Automated)", "2",
+      query="SELECT principal_id, name FROM sys.server_principals WHERE name = 'sa'")(passed_if_empty)
+
+configuration_check("2.17", "Ensure 'clr strict security' Server Configuration Option is set to '1' (Automated)",
+                    "2", "clr strict security", 1)
+
+
+# 3. Authentication and Authorization
+section("3", "3.Authentication and Authorization")
+
+
+@check("3.1", "Ensure 'Server Authentication' Property is set to 'Windows Authentication Mode' (Automated)", "3",
+       query="SELECT CAST(SERVERPROPERTY('IsIntegratedSecurityOnly') as int) as [login_mode]")
+def windows_authentication(rows):
+    return PASSED if rows and rows[0][0] == 1 else FAILED
+
+
+check("3.2", "Ensure CONNECT permissions on the 'guest' user is Revoked within all SQL Server databases (Automated)",
+      "3", collector=in_databases("guest_connect"))(none_in_databases)
+check("3.3", "Ensure 'Orphaned Users' are Dropped From SQL Server Databases (Scored)", "3",
+      collector=in_databases("orphaned_users"))(none_in_databases)
+
+check("3.4", "Ensure SQL Authentication is not used in contained databases (Automated)", "3", query="""
+    SELECT name AS DBUser
+    FROM master.sys.database_principals
+    WHERE name NOT IN ('dbo','Information_Schema','sys','guest')
+    AND type IN ('U','S','G')
+    AND authentication_type = 2
+""")(passed_if_empty)
+
+manual("3.5", "Ensure the SQL Server's MSSQL Service Account is Not an Administrator (Manual)", "3")
+manual("3.6", "Ensure the SQL Server's SQLAgent Service Account is Not an Administrator (Manual)", "3")
+manual("3.7", "Ensure the SQL Server's Full-Text Service Account is Not an Administrator (Manual)", "3")
+
+check("3.8", "Ensure only the default permissions specified by Microsoft are granted to the public server role "
+             "(Automated)", "3", query="""
+    SELECT *
+    FROM master.sys.server_permissions
+    WHERE (grantee_principal_id = SUSER_SID(N'public') and state_desc LIKE 'GRANT%')
+    AND NOT (state_desc = 'GRANT' and [permission_name] = 'VIEW ANY DATABASE' and class_desc = 'SERVER')
+    AND NOT (state_desc = 'GRANT' and [permission_name] = 'CONNECT' and class_desc = 'ENDPOINT' and major_id = 2)
+    AND NOT (state_desc = 'GRANT' and [permission_name] = 'CONNECT' and class_desc = 'ENDPOINT' and major_id = 3)
+    AND NOT (state_desc = 'GRANT' and [permission_name] = 'CONNECT' and class_desc = 'ENDPOINT' and major_id = 4)
+    AND NOT (state_desc = 'GRANT' and [permission_name] = 'CONNECT' and class_desc = 'ENDPOINT' and major_id = 5)
+""")(passed_if_empty)
+
+check("3.9", "Ensure Windows BUILTIN groups are not SQL Logins (Automated)", "3", query="""
+    SELECT pr.[name], pe.[permission_name], pe.[state_desc]
+    FROM sys.server_principals pr
+    JOIN sys.server_permissions pe ON pr.principal_id = pe.grantee_principal_id
+    WHERE pr.name like 'BUILTIN%'
+""")(passed_if_empty)
+
+check("3.10", "Ensure Windows local groups are not SQL Logins (Automated)", "3", query="""
+    SELECT pr.[name], pe.[permission_name], pe.[state_desc]
+    FROM sys.server_principals pr
+    JOIN sys.server_permissions pe ON pr.[principal_id] = pe.[grantee_principal_id]
+    WHERE pr.[type_desc] = 'WINDOWS_GROUP'
+    AND pr.[name] like CAST(SERVERPROPERTY('MachineName') AS nvarchar) + '%'
+""")(passed_if_empty)
+
+check("3.11", "Ensure the public role in the msdb database is not granted access to SQL Agent proxies (Automated)",
+      "3", collector=in_databases("proxy_public"))(none_in_databases)
+
+manual("3.12", "Ensure the 'SYSADMIN' Role is Limited to Administrative or Built-in Accounts (Manual)", "3")
+
+check("3.13", "Ensure membership in admin roles in MSDB database is limited (Automated)", "3",
+      collector=in_databases("admin_role_members"))(none_in_databases)
+
+
+# 4. Password Policies
+section("4", "4. Password Policies")
+
+manual("4.1", "Ensure 'MUST_CHANGE' Option is set to 'ON' for All SQL Authenticated Logins (Manual)", "4")
+
+check("4.2", "Ensure 'CHECK_EXPIRATION' Option is set to 'ON' for All SQL Authenticated Logins Within the Sysadmin "
+             "Role (Automated)", "4", query="""
+    SELECT l.[name], 'sysadmin membership' AS 'Access_Method'
+    FROM sys.sql_logins AS l
+    WHERE IS_SRVROLEMEMBER('sysadmin',name) = 1
+    AND l.is_expiration_checked <> 1
+    UNION ALL
+    SELECT l.[name], 'CONTROL SERVER' AS 'Access_Method'
+    FROM sys.sql_logins AS l
+    JOIN sys.server_permissions AS p ON l.principal_id = p.grantee_principal_id
+    WHERE p.type = 'CL' AND p.state IN ('G', 'W')
+    AND l.is_expiration_checked <> 1
+""")(passed_if_empty)
+
+check("4.3", "Ensure 'CHECK_POLICY' Option is set to 'ON' for All SQL Authenticated Logins (Automated)", "4",
+      query="SELECT name, is_disabled FROM sys.sql_logins WHERE is_policy_checked = 0")(passed_if_empty)
+
+
+# 5. Auditing and Logging
+section("5", "5.Auditing and Logging")
+
+
+@check("5.1", "Ensure 'Maximum number of error log files' is set to greater than or equal to '12' (Automated)", "5",
+       collector=registry_value("NumErrorLogs"))
+def error_log_files(count):
+    # Not set in the registry means the default of 6 files
+    return PASSED if count is not None and count >= 12 else FAILED
+
+
+configuration_check("5.2", "Ensure 'Default Trace Enabled' Server Configuration Option is set to '1' (Automated)",
+                    "5", "default trace enabled", 1)
+
+
+@check("5.3", "Ensure 'Login Auditing' is set to 'failed logins' (Automated)", "5",
+       query="EXEC xp_loginconfig 'audit level'")
+def login_auditing(rows):
+    return PASSED if rows and rows[0][1] == "failure" else FAILED
+
+
+# 6. Application Development
+section("6", "6.Application Development")
+
+manual("6.1", "Ensure Database and Application User Input is Sanitized (Manual)", "6")
+check("6.2", "Ensure 'CLR Assembly Permission Set' is set to 'SAFE_ACCESS' for All CLR Assemblies (Automated)", "6",
+      collector=in_databases("unsafe_assemblies"))(none_in_databases)
+
+
+# 7. Encryption
+section("7", "7.Encryption")
+
+check("7.1", "Ensure 'Symmetric Key encryption algorithm' is set to 'AES_128' or higher in non-system databases "
+             "(Automated)", "7", collector=in_databases("weak_symmetric_keys"))(none_in_databases)
+check("7.2", "Ensure Asymmetric Key Size is set to 'greater than or equal to 2048' in non-system databases "
+             "(Automated)", "7", collector=in_databases("short_asymmetric_keys"))(none_in_databases)
+
+check("7.3", "Ensure Database Backups are Encrypted (Automated)", "7", query="""
+    SELECT b.key_algorithm, b.encryptor_type, d.is_encrypted, b.database_name, b.server_name
+    FROM msdb.dbo.backupset b
+    INNER JOIN sys.databases d ON b.database_name = d.name
+    WHERE b.key_algorithm IS NULL AND b.encryptor_type IS NULL AND d.is_encrypted = 0
+""")(passed_if_empty)
+
+
+@check("7.4", "Ensure Network Encryption is Configured and Enabled (Automated)", "7",
+       query="SELECT DISTINCT encrypt_option FROM sys.dm_exec_connections")
+def network_encryption(rows):
+    # Every current connection must be encrypted
+    return PASSED if rows and all(option == "TRUE" for option, in rows) else FAILED
+
+
+# 8. Appendix: Additional Considerations
+section("8", "8 Appendix: Additional Considerations")
+
+manual("8.1", "Ensure 'SQL Server Browser Service' is configured correctly (Manual)", "8")
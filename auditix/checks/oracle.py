@@ -0,0 +1,485 @@
+"""
+CIS Oracle Database 19c Benchmark v1.2.0 checks.
+
+Sections are registered in report order; the checks of each section are
+registered in benchmark order below its section.
+"""
+from functools import partial
+
+from ..collectors.oracle import (AUDIT_COLUMNS, SENSITIVE_TABLES, by_container, parameters, privileges, profile_limits,
+                                snapshot, unified_audit)
+from ..collectors.netconfig import admin_file
+from . import FAILED, PASSED, passed_if_any, passed_if_empty, registry
+
+section = partial(registry.add_section, "oracle")
+check = partial(registry.check, "oracle")
+manual = partial(registry.manual, "oracle")
+
+
+def failed_in_containers(rows):
+    # On a CDB the finding names the containers the offending rows come from
+    if not rows:
+        return PASSED
+    containers = [name for name, found in by_container(rows).items() if found[0]["CON_ID"] is not None]
+    return FAILED, ", ".join(sorted(containers)) or None
+
+
+def parameter_rule(name, accept, required=True):
+    """
+    Collector and evaluator for one initialization parameter.
+
+    The parameter must be accepted in every container it is set in; when it
+    is not listed at all the check fails if ``required``, else passes.
+    """
+    def collect(ctx):
+        matrix = parameters(ctx)
+        return matrix.values(name), matrix.names
+
+    def evaluate(found):
+        values, names = found
+        if not values:
+            return FAILED if required else PASSED
+        failing = [con_id for con_id, value in values.items() if not accept(value)]
+        if not failing:
+            return PASSED
+        return FAILED, ", ".join(names(failing)) if len(values) > 1 else None
+
+    return collect, evaluate
+
+
+def one_of(*accepted):
+    return lambda value: value in accepted
+
+
+def limit_value(limit):
+    # UNLIMITED counts as 9999 as in the benchmark queries; anything else non-numeric is None
+    if limit == 'UNLIMITED':
+        return 9999
+    try:
+        return float(limit)
+    except (TypeError, ValueError):
+        return None
+
+
+def at_most(bound):
+    return lambda limit: limit_value(limit) is not None and limit_value(limit) <= bound
+
+
+def at_least(bound):
+    return lambda limit: limit_value(limit) is not None and limit_value(limit) >= bound
+
+
+def failed_with_holders(rows):
+    # The finding names the users holding the offending grants, per container on a CDB
+    if not rows:
+        return PASSED
+    holders = {}
+    for row in rows:
+        container = row["CON_NAME"] if row["CON_ID"] is not None else None
+        holders.setdefault(container, set()).update(row["HOLDERS"])
+    parts = [(f"{container}: " if container else "") + ", ".join(sorted(users))
+             for container, users in sorted(holders.items(), key=lambda item: item[0] or "") if users]
+    return FAILED, f"held by {'; '.join(parts)}" if parts else None
+
+
+# Collectors over the catalog snapshot, each returning the offending rows
+
+def rows_where(view, predicate):
+    def collect(ctx):
+        return [row for row in snapshot(ctx).rows(view) if predicate(row)]
+    return collect
+
+
+def default_password_users(ctx):
+    catalog = snapshot(ctx)
+    open_users = {(row["CON_ID"], row["USERNAME"]) for row in catalog.rows("USERS")
+                  if row["ACCOUNT_STATUS"] == 'OPEN'}
+    return [row for row in catalog.rows("USERS_WITH_DEFPWD") if (row["CON_ID"], row["USERNAME"]) in open_users]
+
+
+def public_execute(*packages):
+    return rows_where("TAB_PRIVS", lambda row: row["GRANTEE"] == 'PUBLIC' and row["PRIVILEGE"] == 'EXECUTE'
+                      and row["TABLE_NAME"] in packages)
+
+
+def unauthorized(view, predicate):
+    # Grants matching predicate to users and roles not maintained by Oracle
+    def collect(ctx):
+        return privileges(ctx).grants(snapshot(ctx).rows(view), predicate)
+    return collect
+
+
+def sys_priv(privilege):
+    return unauthorized("SYS_PRIVS", lambda row: row["PRIVILEGE"] == privilege)
+
+
+def role_and_proxies(role):
+    # Direct grants of the role plus proxies connecting as a user that holds it
+    def collect(ctx):
+        catalog = snapshot(ctx)
+        grants = [row for row in catalog.rows("ROLE_PRIVS") if row["GRANTED_ROLE"] == role]
+        holders = {(row["CON_ID"], row["GRANTEE"]) for row in grants}
+        return ([row for row in grants if row["GRANTEE"] not in ('SYS', 'SYSTEM')]
+                + [row for row in catalog.rows("PROXIES") if (row["CON_ID"], row["CLIENT"]) in holders])
+    return collect
+
+
+def audited_by_access(option):
+    return rows_where("STMT_AUDIT_OPTS", lambda row: row["AUDIT_OPTION"] == option
+                      and row["USER_NAME"] is None and row["PROXY_NAME"] is None
+                      and row["SUCCESS"] == 'BY ACCESS' and row["FAILURE"] == 'BY ACCESS')
+
+
+def profile_violations(resource, accept):
+    # Profiles in use whose effective limit for resource is not accepted
+    def collect(ctx):
+        return [row for row in profile_limits(ctx).resource(resource) if not accept(row["LIMIT"])]
+    return collect
+
+
+def net_rule(name, evaluate):
+    """
+    Collector and evaluator for one rule over an Oracle Net file.
+
+    The file is parsed once per run (and reused across runs while it is
+    unchanged); a file that cannot be read fails the rule with the reason.
+    """
+    def collect(ctx):
+        return ctx.cached(f"oracle.net.{name}", lambda ctx: admin_file(name))
+
+    def evaluator(data):
+        config, problem = data
+        if config is None:
+            return FAILED, problem
+        return evaluate(config)
+
+    return collect, evaluator
+
+
+def set_to(name, expected):
+    def evaluate(config):
+        value = config.get(name)
+        if isinstance(value, str) and value.upper() == expected:
+            return PASSED
+        return FAILED, f"{name} is {value or 'not set'}, it should be set to '{expected}'"
+    return evaluate
+
+
+def no_extproc(config):
+    return (FAILED, "extproc found in listener.ora. It should be removed") if config.contains('EXTPROC') else PASSED
+
+
+def admin_restrictions(config):
+    # Every listener needs ADMIN_RESTRICTIONS_<listener> = ON; without any
+    # listener definition at least one such setting must be present
+    names = [f"ADMIN_RESTRICTIONS_{listener}" for listener in config.listeners()] or config.names("ADMIN_RESTRICTIONS_")
+    if not names:
+        return FAILED, "ADMIN_RESTRICTIONS_ not present in listener.ora"
+    failing = [name for name in names if str(config.get(name, '')).upper() != 'ON']
+    if failing:
+        return FAILED, f"{', '.join(failing)} not set to ON"
+    return PASSED
+
+
+def unified_audit_missing(*options, option_type='STANDARD ACTION', obj=None):
+    # The options not covered by an enabled unified audit policy
+    def collect(ctx):
+        return unified_audit(ctx).missing(options, option_type, obj)
+    return collect
+
+
+# 1. Oracle Database Installation and Patching Requirements
+section("1", "1. Oracle Database Installation and Patching Requirements")
+
+manual("1.1", "Ensure the Appropriate Version/Patches for Oracle Software Is Installed (Manual)", "1")
+
+
+# 2. Oracle Parameter Settings
+section("2.1", "2.Oracle Parameter Settings", "2.1 Listener Settings")
+
+for check_id, title, evaluate in (
+    ("2.1.1", "Ensure 'extproc' Is Not Present in 'listener.ora' (Automated)", no_extproc),
+    ("2.1.2", "Ensure 'ADMIN_RESTRICTIONS_<listener_name>' is Set to ON for All Listeners (Automated)",
+     admin_restrictions),
+):
+    collector, evaluator = net_rule("listener.ora", evaluate)
+    check(check_id, title, "2.1", collector=collector)(evaluator)
+
+
+# 2.2 Database Settings, all evaluated from one parameter matrix
+section("2.2", "2.2 Database Settings")
+
+PARAMETER_RULES = (
+    ("2.2.1", "Ensure 'AUDIT_SYS_OPERATIONS' Is Set to 'TRUE'(Automated)",
+     "AUDIT_SYS_OPERATIONS", one_of('TRUE'), True),
+    ("2.2.2", "Ensure 'AUDIT_TRAIL' Is Set to 'DB', 'XML', 'OS', 'DB,EXTENDED', or 'XML,EXTENDED' (Automated)",
+     "AUDIT_TRAIL", one_of('DB', 'XML', 'OS', 'DB,EXTENDED', 'XML,EXTENDED'), True),
+    ("2.2.3", "Ensure 'GLOBAL_NAMES' Is Set to 'TRUE' (Automated)",
+     "GLOBAL_NAMES", one_of('TRUE'), True),
+    ("2.2.4", "Ensure 'OS_ROLES' Is Set to 'FALSE' (Automated)",
+     "OS_ROLES", one_of('FALSE'), True),
+    ("2.2.5", "Ensure 'REMOTE_LISTENER' Is Empty (Automated)",
+     "REMOTE_LISTENER", one_of(None), False),
+    ("2.2.6", "Ensure 'REMOTE_LOGIN_PASSWORDFILE' Is Set to 'NONE' (Automated)",
+     "REMOTE_LOGIN_PASSWORDFILE", one_of('NONE', 'EXCLUSIVE'), True),
+    ("2.2.7", "Ensure 'REMOTE_OS_AUTHENT' Is Set to 'FALSE' (Automated)",
+     "REMOTE_OS_AUTHENT", one_of('FALSE'), True),
+    ("2.2.8", "Ensure 'REMOTE_OS_ROLES' Is Set to 'FALSE' (Automated)",
+     "REMOTE_OS_ROLES", one_of('FALSE'), True),
+    ("2.2.9", "Ensure 'SEC_CASE_SENSITIVE_LOGON' Is Set to 'TRUE' (Automated)",
+     "SEC_CASE_SENSITIVE_LOGON", one_of('TRUE'), True),
+    ("2.2.10", "Ensure 'SEC_MAX_FAILED_LOGIN_ATTEMPTS' Is '3' or Less (Automated)",
+     "SEC_MAX_FAILED_LOGIN_ATTEMPTS", lambda value: value is not None and value.isdigit() and int(value) <= 3, True),
+    ("2.2.11", "Ensure 'SEC_PROTOCOL_ERROR_FURTHER_ACTION' Is Set to Audit (Automated)",
+     "SEC_PROTOCOL_ERROR_FURTHER_ACTION", one_of('(DROP,3)', '(DROP, 3)'), True),
+    ("2.2.12", "Ensure 'SEC_PROTOCOL_ERROR_TRACE_ACTION' Is Set to 'LOG' (Automated)",
+     "SEC_PROTOCOL_ERROR_TRACE_ACTION", one_of('LOG'), True),
+    ("2.2.13", "Ensure 'SEC_RETURN_SERVER_RELEASE_BANNER' Is Set to 'FALSE' (Automated)",
+     "SEC_RETURN_SERVER_RELEASE_BANNER", one_of('FALSE'), True),
+    ("2.2.14", "Ensure 'SQL92_SECURITY' Is Set to 'TRUE' (Automated)",
+     "SQL92_SECURITY", one_of('TRUE'), False),
+    ("2.2.15", "Ensure '_trace_files_public' Is Set to 'FALSE' (Automated)",
+     "_TRACE_FILES_PUBLIC", one_of('FALSE'), True),
+    ("2.2.16", "Ensure 'RESOURCE_LIMIT' Is Set to 'TRUE' (Automated)",
+     "RESOURCE_LIMIT", one_of('TRUE'), False),
+    ("2.2.17", "Ensure 'PDB_OS_CREDENTIAL' is NOT null (Automated)",
+     "PDB_OS_CREDENTIAL", one_of(None), False),
+)
+
+for check_id, title, name, accept, required in PARAMETER_RULES:
+    collector, evaluator = parameter_rule(name, accept, required)
+    check(check_id, title, "2.2", collector=collector)(evaluator)
+
+
+section("2.3", "2.3 SQLNET.ORA Settings")
+
+for check_id, title, name in (
+    ("2.3.1", "Ensure 'ENCRYPTION_SERVER' Is Set to 'REQUIRED' (Automated)", "SQLNET.ENCRYPTION_SERVER"),
+    ("2.3.2", "Ensure 'SQLNET.CRYPTO_CHECKSUM_SERVER' Is Set to 'REQUIRED' (Automated)",
+     "SQLNET.CRYPTO_CHECKSUM_SERVER"),
+):
+    collector, evaluator = net_rule("sqlnet.ora", set_to(name, 'REQUIRED'))
+    check(check_id, title, "2.3", collector=collector)(evaluator)
+
+
+# 3. Oracle Connection and Login Restrictions, evaluated on the effective profile limits
+section("3", "3. Oracle Connection and Login Restrictions")
+
+PROFILE_RULES = (
+    ("3.1", "Ensure 'FAILED_LOGIN_ATTEMPTS' Is Less than or Equal to '5' (Automated)",
+     "FAILED_LOGIN_ATTEMPTS", at_most(5)),
+    ("3.2", "Ensure 'PASSWORD_LOCK_TIME' Is Greater than or Equal to '1' (Automated)",
+     "PASSWORD_LOCK_TIME", at_least(1)),
+    ("3.3", "Ensure 'PASSWORD_LIFE_TIME' Is Less than or Equal to '90' (Automated)",
+     "PASSWORD_LIFE_TIME", at_most(90)),
+    ("3.4", "Ensure 'PASSWORD_REUSE_MAX' Is Greater than or Equal to '20' (Automated)",
+     "PASSWORD_REUSE_MAX", at_least(20)),
+    ("3.5", "Ensure 'PASSWORD_REUSE_TIME' Is Greater than or Equal to '365' (Automated)",
+     "PASSWORD_REUSE_TIME", at_least(365)),
+    ("3.6", "Ensure 'PASSWORD_GRACE_TIME' Is Less than or Equal to '5' (Automated)",
+     "PASSWORD_GRACE_TIME", at_most(5)),
+    ("3.7", "Ensure 'PASSWORD_VERIFY_FUNCTION' Is Set for All Profiles (Automated)",
+     "PASSWORD_VERIFY_FUNCTION", lambda limit: limit not in (None, 'NULL')),
+    ("3.8", "Ensure 'SESSIONS_PER_USER' Is Less than or Equal to '10' (Automated)",
+     "SESSIONS_PER_USER", at_most(10)),
+    ("3.9", "Ensure 'INACTIVE_ACCOUNT_TIME' Is Less than or Equal to '120' (Automated)",
+     "INACTIVE_ACCOUNT_TIME", at_most(120)),
+)
+
+for check_id, title, resource, accept in PROFILE_RULES:
+    check(check_id, title, "3", collector=profile_violations(resource, accept))(failed_in_containers)
+
+
+# 4. Users
+section("4", "4. Users")
+
+check("4.1", "Ensure All Default Passwords Are Changed (Automated)", "4",
+      collector=default_password_users, severity="high")(failed_in_containers)
+
+check("4.2", "Ensure All Sample Data And Users Have Been Removed (Automated)", "4", collector=rows_where(
+    "USERS", lambda row: row["USERNAME"] in ('BI', 'HR', 'IX', 'OE', 'PM', 'SCOTT', 'SH')))(failed_in_containers)
+
+check("4.3", "Ensure 'DBA_USERS.AUTHENTICATION_TYPE' Is Not Set to 'EXTERNAL' for Any User (Automated)", "4",
+      collector=rows_where("USERS", lambda row: row["AUTHENTICATION_TYPE"] == 'EXTERNAL'),
+      severity="high")(failed_in_containers)
+
+check("4.4", "Ensure No Users Are Assigned the 'DEFAULT' Profile (Automated)", "4", collector=rows_where(
+    "USERS", lambda row: row["PROFILE"] == 'DEFAULT' and row["ACCOUNT_STATUS"] == 'OPEN'
+    and row["ORACLE_MAINTAINED"] == 'N'))(failed_in_containers)
+
+check("4.5", "Ensure 'SYS.USER$MIG' Has Been Dropped (Automated)", "4",
+      collector=rows_where("TABLES", lambda row: True))(failed_in_containers)
+
+check("4.6", "Ensure No Public Database Links Exist (Automated)", "4",
+      collector=rows_where("DB_LINKS", lambda row: row["OWNER"] == 'PUBLIC'))(failed_in_containers)
+
+
+# 5. Privileges & Grants & ACLs
+section("5.1.1", "5. Privileges & Grants & ACLs", "5.1 Excessive Table, View and Package Privileges",
+        "5.1.1 Public Privileges")
+
+check("5.1.1.1", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "Network" Packages', "5.1.1", collector=public_execute(
+    'DBMS_LDAP', 'UTL_INADDR', 'UTL_TCP', 'UTL_MAIL', 'UTL_SMTP', 'UTL_DBWS', 'UTL_ORAMTS', 'UTL_HTTP', 'HTTPURITYPE'
+))(failed_in_containers)
+
+check("5.1.1.2", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "File System" Packages', "5.1.1",
+      collector=public_execute('DBMS_ADVISOR', 'DBMS_LOB', 'UTL_FILE'))(failed_in_containers)
+
+check("5.1.1.3", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "Encryption" Packages', "5.1.1",
+      collector=public_execute('DBMS_CRYPTO', 'DBMS_OBFUSCATION_TOOLKIT', 'DBMS_RANDOM'))(failed_in_containers)
+
+check("5.1.1.4", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "Java" Packages', "5.1.1",
+      collector=public_execute('DBMS_JAVA', 'DBMS_JAVA_TEST'))(failed_in_containers)
+
+check("5.1.1.5", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "Job Scheduler" Packages', "5.1.1",
+      collector=public_execute('DBMS_SCHEDULER', 'DBMS_JOB'))(failed_in_containers)
+
+check("5.1.1.6", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "SQL Injection Helper" Packages', "5.1.1",
+      collector=public_execute('DBMS_SQL', 'DBMS_XMLGEN', 'DBMS_XMLQUERY', 'DBMS_XMLSTORE',
+                               'DBMS_XMLSAVE', 'DBMS_AW', 'OWA_UTIL', 'DBMS_REDIRECT'))(failed_in_containers)
+
+check("5.1.1.7", 'Ensure "EXECUTE" is revoked from "PUBLIC" on "DBMS_CREDENTIAL" Package', "5.1.1",
+      collector=public_execute('DBMS_CREDENTIAL'))(failed_in_containers)
+
+section("5.1.2", "5.1.2 Non-Default Privileges")
+
+check("5.1.2.1", 'Ensure "EXECUTE" is not granted to "PUBLIC" on "Non-default" Packages', "5.1.2",
+      collector=public_execute('DBMS_BACKUP_RESTORE', 'DBMS_FILE_TRANSFER', 'DBMS_SYS_SQL', 'DBMS_REPCAT_SQL_UTL',
+                               'INITJVMAUX', 'DBMS_AQADM_SYS', 'DBMS_STREAMS_RPC', 'DBMS_PRVTAQIM', 'LTADM',
+                               'DBMS_IJOB', 'DBMS_PDB_EXEC_SQL'))(failed_in_containers)
+
+section("5.1.3", "5.1.3 Other Privileges")
+
+check("5.1.3.1", 'Ensure "ALL" Is Revoked from Unauthorized "GRANTEE" on "AUD$"', "5.1.3", collector=rows_where(
+    "TAB_PRIVS", lambda row: row["OWNER"] == 'SYS' and row["TABLE_NAME"] == 'AUD$'))(failed_in_containers)
+
+check("5.1.3.2", 'Ensure "ALL" Is Revoked from Unauthorized "GRANTEE" on "DBA_%"', "5.1.3", collector=unauthorized(
+    "TAB_PRIVS", lambda row: row["OWNER"] == 'SYS' and row["TABLE_NAME"].startswith('DBA_')))(failed_with_holders)
+
+check("5.1.3.3", 'Ensure "ALL" Is Revoked on "Sensitive" Tables', "5.1.3", collector=unauthorized(
+    "TAB_PRIVS", lambda row: row["OWNER"] == 'SYS' and row["TABLE_NAME"] in SENSITIVE_TABLES))(failed_with_holders)
+
+section("5.2", "5.2 Excessive System Privileges")
+
+check("5.2.1", 'Ensure "%ANY%" Is Revoked from Unauthorized "GRANTEE"', "5.2",
+      collector=unauthorized("SYS_PRIVS", lambda row: 'ANY' in row["PRIVILEGE"]))(failed_with_holders)
+
+check("5.2.2", 'Ensure "DBA_SYS_PRIVS.%" Is Revoked from Unauthorized "GRANTEE" with "ADMIN_OPTION" Set to "YES"',
+      "5.2", collector=unauthorized("SYS_PRIVS", lambda row: row["ADMIN_OPTION"] == 'YES'))(failed_with_holders)
+
+check("5.2.3", 'Ensure "EXECUTE ANY PROCEDURE" Is Not Granted to "OUTLN"', "5.2", collector=rows_where(
+    "SYS_PRIVS", lambda row: row["PRIVILEGE"] == 'EXECUTE ANY PROCEDURE' and row["GRANTEE"] == 'OUTLN'
+))(failed_in_containers)
+
+check("5.2.4", 'Ensure "EXECUTE ANY PROCEDURE" Is Not Granted to "DBSNMP"', "5.2", collector=rows_where(
+    "SYS_PRIVS", lambda row: row["PRIVILEGE"] == 'EXECUTE ANY PROCEDURE' and row["GRANTEE"] == 'DBSNMP'
+))(failed_in_containers)
+
+for check_id, privilege in (
+    ("5.2.5", "SELECT ANY DICTIONARY"),
+    ("5.2.6", "SELECT ANY TABLE"),
+    ("5.2.7", "AUDIT SYSTEM"),
+    ("5.2.8", "EXEMPT ACCESS POLICY"),
+    ("5.2.9", "BECOME USER"),
+    ("5.2.10", "CREATE PROCEDURE"),
+    ("5.2.11", "ALTER SYSTEM"),
+    ("5.2.12", "CREATE ANY LIBRARY"),
+    ("5.2.13", "CREATE LIBRARY"),
+    ("5.2.14", "GRANT ANY OBJECT PRIVILEGE"),
+    ("5.2.15", "GRANT ANY ROLE"),
+    ("5.2.16", "GRANT ANY PRIVILEGE"),
+):
+    check(check_id, f'Ensure "{privilege}" Is Revoked from Unauthorized "GRANTEE"', "5.2",
+          collector=sys_priv(privilege))(failed_with_holders)
+
+section("5.3", "5.3 Excessive Role Privileges")
+
+check("5.3.1", 'Ensure "SELECT_CATALOG_ROLE" Is Revoked from Unauthorized "GRANTEE"', "5.3", collector=unauthorized(
+    "ROLE_PRIVS", lambda row: row["GRANTED_ROLE"] == 'SELECT_CATALOG_ROLE'))(failed_with_holders)
+
+check("5.3.2", 'Ensure "EXECUTE_CATALOG_ROLE" Is Revoked from Unauthorized "GRANTEE"', "5.3", collector=unauthorized(
+    "ROLE_PRIVS", lambda row: row["GRANTED_ROLE"] == 'EXECUTE_CATALOG_ROLE'))(failed_with_holders)
+
+check("5.3.3", 'Ensure "DBA" Is Revoked from Unauthorized "GRANTEE"', "5.3",
+      collector=role_and_proxies('DBA'), severity="high")(failed_in_containers)
+
+check("5.3.4", 'Ensure "AUDIT_ADMIN" Is Revoked from Unauthorized "GRANTEE"', "5.3",
+      collector=role_and_proxies('AUDIT_ADMIN'))(failed_in_containers)
+
+
+# 6. Audit/Logging Policies and Procedures
+section("6.1", "6. Audit/Logging Policies and Procedures", "6.1 Traditional Auditing")
+
+for check_id, option in (
+    ("6.1.1", "USER"),
+    ("6.1.2", "ROLE"),
+    ("6.1.3", "SYSTEM GRANT"),
+    ("6.1.4", "PROFILE"),
+    ("6.1.5", "DATABASE LINK"),
+    ("6.1.6", "PUBLIC DATABASE LINK"),
+    ("6.1.7", "PUBLIC SYNONYM"),
+    ("6.1.8", "SYNONYM"),
+    ("6.1.9", "DIRECTORY"),
+    ("6.1.10", "SELECT ANY DICTIONARY"),
+    ("6.1.11", "GRANT ANY OBJECT PRIVILEGE"),
+    ("6.1.12", "GRANT ANY PRIVILEGE"),
+    ("6.1.13", "DROP ANY PROCEDURE"),
+):
+    check(check_id, f"Ensure the '{option}' Audit Option Is Enabled (Automated)", "6.1",
+          collector=audited_by_access(option))(passed_if_any)
+
+check("6.1.14", "Ensure the 'ALL' Audit Option on 'SYS.AUD$' Is Enabled (Automated)", "6.1", collector=rows_where(
+    "OBJ_AUDIT_OPTS", lambda row: all(row[column] == 'A/A' for column in AUDIT_COLUMNS)))(passed_if_any)
+
+for check_id, option in (
+    ("6.1.15", "PROCEDURE"),
+    ("6.1.16", "ALTER SYSTEM"),
+    ("6.1.17", "TRIGGER"),
+    ("6.1.18", "CREATE SESSION"),
+):
+    check(check_id, f"Ensure the '{option}' Audit Option Is Enabled (Automated)", "6.1",
+          collector=audited_by_access(option))(passed_if_any)
+
+section("6.2", "6.2 Unified Auditing")
+
+for check_id, title, options in (
+    ("6.2.1", "Ensure the 'CREATE USER' Action Audit Is Enabled (Automated)", ('CREATE USER',)),
+    ("6.2.2", "Ensure the 'ALTER USER' Action Audit Is Enabled (Automated)", ('ALTER USER',)),
+    ("6.2.3", "Ensure the 'DROP USER' Audit Option Is Enabled (Automated)", ('DROP USER',)),
+    ("6.2.4", "Ensure the 'CREATE ROLE' Action Audit Is Enabled (Automated)", ('CREATE ROLE',)),
+    ("6.2.5", "Ensure the 'ALTER ROLE' Action Audit Is Enabled (Automated)", ('ALTER ROLE',)),
+    ("6.2.6", "Ensure the 'DROP ROLE' Action Audit Is Enabled (Automated)", ('DROP ROLE',)),
+    ("6.2.7", "Ensure the 'GRANT' Action Audit Is Enabled (Automated)", ('GRANT',)),
+    ("6.2.8", "Ensure the 'REVOKE' Action Audit Is Enabled (Automated)", ('REVOKE',)),
+    ("6.2.9", "Ensure the 'CREATE PROFILE' Action Audit Is Enabled (Automated)", ('CREATE PROFILE',)),
+    ("6.2.10", "Ensure the 'ALTER PROFILE' Action Audit Is Enabled (Automated)", ('ALTER PROFILE',)),
+    ("6.2.11", "Ensure the 'DROP PROFILE' Action Audit Is Enabled (Automated)", ('DROP PROFILE',)),
+    ("6.2.12", "Ensure the 'CREATE DATABASE LINK' Action Audit Is Enabled (Automated)", ('CREATE DATABASE LINK',)),
+    ("6.2.13", "Ensure the 'ALTER DATABASE LINK' Action Audit Is Enabled (Automated)", ('ALTER DATABASE LINK',)),
+    ("6.2.14", "Ensure the 'DROP DATABASE LINK' Action Audit Is Enabled (Automated)", ('DROP DATABASE LINK',)),
+    ("6.2.15", "Ensure the 'CREATE SYNONYM' Action Audit Is Enabled (Automated)", ('CREATE SYNONYM',)),
+    ("6.2.16", "Ensure the 'ALTER SYNONYM' Action Audit Is Enabled (Automated)", ('ALTER SYNONYM',)),
+    ("6.2.17", "Ensure the 'DROP SYNONYM' Action Audit Is Enabled (Automated)", ('DROP SYNONYM',)),
+):
+    check(check_id, title, "6.2", collector=unified_audit_missing(*options))(passed_if_empty)
+
+check("6.2.18", "Ensure the 'SELECT ANY DICTIONARY' Privilege Audit Is Enabled (Automated)", "6.2",
+      collector=unified_audit_missing('SELECT ANY DICTIONARY', option_type='SYSTEM PRIVILEGE'))(passed_if_empty)
+
+check("6.2.19", "Ensure the 'AUDSYS.AUD$UNIFIED' Access Audit Is Enabled (Automated)", "6.2",
+      collector=unified_audit_missing('ALL', option_type='OBJECT ACTION', obj=('AUDSYS', 'AUD$UNIFIED')))(passed_if_empty)
+
+for check_id, title, options in (
+    ("6.2.20", "Ensure the 'CREATE PROCEDURE/FUNCTION/PACKAGE/PACKAGE BODY' Action Audit Is Enabled (Automated)",
+     ('CREATE PROCEDURE', 'CREATE FUNCTION', 'CREATE PACKAGE', 'CREATE PACKAGE BODY')),
+    ("6.2.21", "Ensure the 'ALTER PROCEDURE/FUNCTION/PACKAGE/PACKAGE BODY' Action Audit Is Enabled (Automated)",
+     ('ALTER PROCEDURE', 'ALTER FUNCTION', 'ALTER PACKAGE', 'ALTER PACKAGE BODY')),
+    ("6.2.22", "Ensure the 'DROP PROCEDURE/FUNCTION/PACKAGE/PACKAGE BODY' Action Audit Is Enabled (Automated)",
+     ('DROP PROCEDURE', 'DROP FUNCTION', 'DROP PACKAGE', 'DROP PACKAGE BODY')),
+    ("6.2.23", "Ensure the 'ALTER SYSTEM' Action Audit is Enabled (Automated)", ('ALTER SYSTEM',)),
+    ("6.2.24", "Ensure the 'CREATE TRIGGER' Action Audit Is Enabled (Automated)", ('CREATE TRIGGER',)),
+    ("6.2.25", "Ensure the 'ALTER TRIGGER' Action Audit is Enabled (Automated)", ('ALTER TRIGGER',)),
+    ("6.2.26", "Ensure the 'DROP TRIGGER' Action Audit is Enabled (Automated)", ('DROP TRIGGER',)),
+    ("6.2.27", "Ensure the 'LOGON' and 'LOGOFF' Actions Audit is Enabled (Automated)", ('LOGON', 'LOGOFF')),
+):
+    check(check_id, title, "6.2", collector=unified_audit_missing(*options))(passed_if_empty)
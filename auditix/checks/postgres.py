@@ -0,0 +1,291 @@
+"""
+CIS PostgreSQL Benchmark checks evaluated from the server settings.
+
+Every setting rule reads the pg_settings snapshot of the run, so the
+sections below cost one query however many settings they judge.
+"""
+from functools import partial
+
+from ..collectors.postgres import pg_settings, roles, row_security, via
+from . import DATABASE, FAILED, NO_PERMISSION, PASSED, registry
+
+section = partial(registry.add_section, "postgres")
+check = partial(registry.check, "postgres")
+manual = partial(registry.manual, "postgres")
+
+LOG_LEVELS = ('debug5', 'debug4', 'debug3', 'debug2', 'debug1', 'info', 'notice',
+              'warning', 'error', 'log', 'fatal', 'panic')
+
+
+def setting_rule(name, accept):
+    """Collector and evaluator for one setting; a setting the server does not have fails."""
+    def collect(ctx):
+        return pg_settings(ctx).value(name)
+
+    def evaluate(value):
+        if value is None:
+            return FAILED
+        return PASSED if accept(value) else FAILED
+
+    return collect, evaluate
+
+
+def settings_of(*names):
+    # Collector for checks judging several settings together
+    def collect(ctx):
+        snapshot = pg_settings(ctx)
+        return {name: snapshot.value(name) for name in names}
+    return collect
+
+
+def one_of(*accepted):
+    return lambda value: value.strip().lower() in accepted
+
+
+def none_of(*rejected):
+    return lambda value: value.strip().lower() not in rejected
+
+
+def log_line_prefix(value):
+    # The non-syslog format leads with "%m [%p]"; both formats need these escapes
+    return all(component in value for component in ("user=%u", "db=%d", "app=%a", "client=%h"))
+
+
+def administrator_only(data):
+    return NO_PERMISSION, "Only system administrator has the permission"
+
+
+def needs(privileges):
+    # Items the audit account cannot inspect, reported with the privileges they need
+    return lambda data: (NO_PERMISSION, f"Need an {privileges} priviliges")
+
+
+# 3. Logging And Auditing
+section("3.1.1", "3. Logging And Auditing", "3.1 PostgreSQL Logging", "3.1.1 Logging Rationale")
+
+SETTING_RULES = (
+    ("3.1.2", "Ensure the log destinations are set correctly (Automated)",
+     "log_destination", bool),
+    ("3.1.3", "Ensure the logging collector is enabled (Automated)",
+     "logging_collector", one_of('on')),
+    ("3.1.4", "Ensure the log file destination directory is set correctly (Automated)",
+     "log_directory", one_of('log')),
+    ("3.1.5", "Ensure the filename pattern for log files is set correctly (Automated)",
+     "log_filename", lambda value: value.strip().lower().endswith('.log')),
+    ("3.1.6", "Ensure the log file permissions are set correctly (Automated)",
+     "log_file_mode", one_of('0600', '0640')),
+    ("3.1.7", "Ensure 'log_truncate_on_rotation' is enabled (Automated)",
+     "log_truncate_on_rotation", one_of('on')),
+    # pg_settings holds log_rotation_age in minutes
+    ("3.1.8", "Ensure the maximum log file lifetime is set correctly (Automated)",
+     "log_rotation_age", one_of('1440')),
+    ("3.1.9", "Ensure the maximum log file size is set correctly (Automated)",
+     "log_rotation_size", none_of('0')),
+    ("3.1.10", "Ensure the correct syslog facility is selected (Manual)",
+     "syslog_facility", one_of(*(f"local{n}" for n in range(8)))),
+    ("3.1.11", "Ensure syslog messages are not suppressed (Automated)",
+     "syslog_sequence_numbers", one_of('on')),
+    ("3.1.12", "Ensure syslog messages are not lost due to size (Automated)",
+     "syslog_split_messages", one_of('on')),
+    ("3.1.13", "Ensure the program name for PostgreSQL syslog messages is correct (Automated)",
+     "syslog_ident", one_of('postgres')),
+    ("3.1.14", "Ensure the correct messages are written to the server log (Automated)",
+     "log_min_messages", one_of(*LOG_LEVELS)),
+    ("3.1.15", "Ensure the correct SQL statements generating errors are recorded (Automated)",
+     "log_min_error_statement", one_of(*LOG_LEVELS)),
+    ("3.1.16", "Ensure 'debug_print_parse' is disabled (Automated)",
+     "debug_print_parse", one_of('off')),
+    ("3.1.17", "Ensure 'debug_print_rewritten' is disabled (Automated)",
+     "debug_print_rewritten", one_of('off')),
+    ("3.1.18", "Ensure 'debug_print_plan' is disabled (Automated)",
+     "debug_print_plan", one_of('off')),
+    ("3.1.19", "Ensure 'debug_pretty_print' is enabled (Automated)",
+     "debug_pretty_print", one_of('on')),
+    ("3.1.20", "Ensure 'log_connections' is enabled (Automated)",
+     "log_connections", one_of('on')),
+    ("3.1.21", "Ensure 'log_disconnections' is enabled (Automated)",
+     "log_disconnections", one_of('on')),
+    ("3.1.22", "Ensure 'log_error_verbosity' is set to 'verbose' (Automated)",
+     "log_error_verbosity", one_of('verbose')),
+    ("3.1.23", "Ensure 'log_hostname' is set correctly (Automated)",
+     "log_hostname", one_of('off')),
+    ("3.1.24", "Ensure 'log_line_prefix' is set correctly (Automated)",
+     "log_line_prefix", log_line_prefix),
+    ("3.1.25", "Ensure 'log_statement' is set correctly (Automated)",
+     "log_statement", none_of('none')),
+)
+
+for check_id, title, name, accept in SETTING_RULES:
+    collector, evaluator = setting_rule(name, accept)
+    check(check_id, title, "3.1.1", collector=collector)(evaluator)
+
+
+@check("3.1.26", "Ensure 'log_timezone' is set correctly (Automated)", "3.1.1",
+       collector=lambda ctx: pg_settings(ctx).value("log_timezone"))
+def log_timezone(value):
+    # Any zone may be right; the report shows it for review against the logging policy
+    if not value:
+        return FAILED
+    return PASSED, f"Returning {value}. Check with your organization as defined by the logging policy."
+
+
+@check("3.2", "Ensure the PostgreSQL Audit Extension (pgAudit) is enabled (Automated)", "3.1.1",
+       collector=settings_of("shared_preload_libraries", "pgaudit.log"))
+def pgaudit_enabled(values):
+    preloaded = values["shared_preload_libraries"] or ""
+    return PASSED if "pgaudit" in preloaded and values["pgaudit.log"] is not None else FAILED
+
+
+# 4. User Access and Authorization
+section("4", "4. User Access and Authorization")
+
+check("4.1", "Ensure sudo is configured correctly (Manual)", "4")(needs("administration"))
+check("4.2", "Ensure excessive administrative privileges are revoked (Manual)", "4")(needs("administration"))
+check("4.3", "Ensure excessive function privileges are revoked (Automated)", "4")(needs("POSTGRES user (Super user)"))
+manual("4.4", "Ensure excessive DML privileges are revoked (Manual)", "4")
+
+RLS_NOTE = ("The decision to implement Row Level Security (RLS) depends on an organization's specific business "
+            "processes and security needs.")
+
+
+def rls_findings(ctx):
+    # Superusers bypass RLS by definition and are reported by 4.6, not here
+    graph = roles(ctx)
+    superusers = graph.holding("superuser")
+    bypassing = [via(name, granting) for name, granting in graph.holding("bypassrls").items()
+                 if name not in superusers]
+    rls = row_security(ctx)
+    return rls.uncovered(), bypassing, rls.policies
+
+
+@check("4.5", "Ensure Row Level Security (RLS) is configured correctly (Manual)", "4", collector=rls_findings,
+       scope=DATABASE)
+def rls_configured(data):
+    # Every RLS-enabled table needs a policy and no ordinary login may bypass RLS,
+    # itself or through a role it is a member of; the finding lists all of them
+    uncovered, bypassing, tables = data
+    if not tables:
+        return FAILED, f"No table has row level security enabled. {RLS_NOTE}"
+    problems = []
+    if uncovered:
+        problems.append(f"tables without a policy: {', '.join(uncovered)}")
+    if bypassing:
+        problems.append(f"logins with BYPASSRLS: {', '.join(bypassing)}")
+    if problems:
+        return FAILED, f"{'; '.join(problems)}. {RLS_NOTE}"
+    return PASSED, RLS_NOTE
+
+
+SET_USER_NOTE = "Check the admin users in our organization to ensure accurate identification of superuser roles."
+
+ADMIN_PATTERNS = ('admin', 'administrator', 'root', 'dbadmin', 'sysadmin', '^admin.*', '.*admin$')
+
+
+def admin_like(name):
+    return any(name.startswith(pattern) or name.endswith(pattern) for pattern in ADMIN_PATTERNS)
+
+
+def set_user_findings(ctx):
+    installed = bool(ctx.fetch_all("SELECT name FROM pg_available_extensions WHERE name = 'set_user'"))
+    return installed, roles(ctx).holding("superuser")
+
+
+@check("4.6", "Ensure the set_user extension is installed (Automated)", "4", collector=set_user_findings)
+def set_user_installed(data):
+    # Fails without set_user, or when an admin-like login has superuser power,
+    # its own or through membership in a superuser role
+    installed, superusers = data
+    if installed and not any(admin_like(name) for name in superusers):
+        return PASSED, SET_USER_NOTE
+    return FAILED, SET_USER_NOTE
+
+
+manual("4.7", "Make use of predefined roles (Manual)", "4")
+
+
+# 6. PostgreSQL Settings
+section("6", "6. PostgreSQL Settings")
+
+manual("6.1", "Understanding attack vectors and runtime parameters (Manual)", "6")
+
+# Expected values of the 'backend' and 'superuser-backend' context parameters
+BACKEND_SETTINGS = {
+    "ignore_system_indexes": "off",
+    "jit_debugging_support": "off",
+    "jit_profiling_support": "off",
+    "log_connections": "on",
+    "log_disconnections": "on",
+    "post_auth_delay": "0",
+}
+
+
+@check("6.2", "Ensure 'backend' runtime parameters are configured correctly (Automated)", "6",
+       collector=lambda ctx: pg_settings(ctx).in_context('backend', 'superuser-backend'))
+def backend_parameters(values):
+    failing = sorted(name for name, expected in BACKEND_SETTINGS.items()
+                     if name in values and values[name] != expected)
+    return (FAILED, ", ".join(failing)) if failing else PASSED
+
+
+manual("6.3", "Ensure 'Postmaster' runtime parameters are configured correctly (Manual)", "6")
+manual("6.4", "Ensure 'SIGHUP' Runtime Parameters are Configured (Manual)", "6")
+manual("6.5", "Ensure 'Superuser' Runtime Parameters are Configured (Manual)", "6")
+manual("6.6", "Ensure 'User' Runtime Parameters are Configured (Manual)", "6")
+
+check("6.7", "Ensure FIPS 140-2 OpenSSL Cryptography Is Used (Automated)", "6")(administrator_only)
+
+collector, evaluator = setting_rule("ssl", one_of('on'))
+check("6.8", "Ensure TLS is enabled and configured correctly (Automated)", "6", collector=collector)(evaluator)
+
+
+# 7. Replication
+section("7", "7. Replication")
+
+
+@check("7.1", "Ensure a replication-only user is created and used for streaming replication (Manual)", "7",
+       collector=lambda ctx: roles(ctx).logins())
+def replication_user(logins):
+    # A dedicated replication login holds REPLICATION without superuser power
+    dedicated = [name for name, privileges in logins.items()
+                 if privileges["replication"] and not privileges["superuser"]]
+    return PASSED if dedicated else FAILED
+
+
+collector, evaluator = setting_rule("log_replication_commands", one_of('on'))
+check("7.2", "Ensure logging of replication commands is configured (Manual)", "7",
+      collector=collector)(evaluator)
+
+manual("7.3", "Ensure base backups are configured and functional (Manual)", "7")
+
+
+@check("7.4", "Ensure WAL archiving is configured and functional (Automated)", "7",
+       collector=settings_of("archive_mode", "archive_command", "archive_library"))
+def wal_archiving(values):
+    # archive_mode on (or always) with an archive command or an archive library
+    archiver = (values["archive_command"] not in (None, "", "(disabled)")
+                or values["archive_library"] not in (None, ""))
+    return PASSED if values["archive_mode"] in ("on", "always") and archiver else FAILED
+
+
+manual("7.5", "Ensure streaming replication parameters are configured correctly (Manual)", "7")
+
+
+# 8. Special Configuration Considerations
+section("8", "8. Special Configuration Considerations")
+
+
+@check("8.1", "Ensure PostgreSQL subdirectory locations are outside the data cluster (Manual)", "8",
+       collector=settings_of("log_directory", "data_directory", "allow_in_place_tablespaces",
+                             "temp_tablespaces", "temp_file_limit"))
+def subdirectory_locations(values):
+    temp_limited = bool(values["temp_tablespaces"]) or values["temp_file_limit"] not in (None, "0")
+    if (values["log_directory"] == "log" and values["data_directory"] == "C:/Program Files/PostgreSQL/16/data"
+            and values["allow_in_place_tablespaces"] == "off" and temp_limited):
+        return PASSED
+    return FAILED
+
+
+@check("8.2", "Ensure the backup and restore tool, 'pgBackRest', is installed and configured (Automated)", "8")
+def backup_tool(data):
+    return (NO_PERMISSION, "To ensure that your organization implements an effective backup solution for "
+                           "PostgreSQL databases, similar to pgBackRest's features")
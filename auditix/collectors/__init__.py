@@ -0,0 +1,7 @@
+"""
+Collectors that fetch catalog data once per run for many checks.
+
+A collector is built lazily from the run's ``AuditContext`` (see
+``AuditContext.cached``) and then shared by every check that reads it, so
+a dictionary view is queried once however many checks evaluate it.
+"""
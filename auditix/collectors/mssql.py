@@ -0,0 +1,244 @@
+"""
+SQL Server collectors.
+
+Checks judging objects inside every database (guest access, orphaned
+users, CLR assemblies, encryption keys, the msdb roles and proxies) share one pass over the
+instance: each database is visited once and every per-database query runs
+in that visit, instead of each check walking the database list with its own
+``USE``.  The pass switches databases on the run's connection and switches
+back afterwards; when the context can open connections of its own, up to
+``workers`` databases are read in parallel, each over a connection to that
+database.  The queries of one visit go to the server as one batch.  A
+database or query that cannot be read keeps its error so the checks can
+report it.
+
+Server configuration options are read from sys.configurations once per run
+and the registry values some checks judge are read together in one batch.
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from ..batching import fetch_batch
+
+# System databases, left out of the checks on "non-system databases"
+SYSTEM_DATABASES = ('master', 'model', 'tempdb', 'msdb', 'Resource')
+
+
+class DatabaseQuery:
+    """A query run in every database it applies to: all but ``skip``, or only those in ``only``."""
+
+    def __init__(self, query, only=None, skip=()):
+        self.query = query
+        self.only = only
+        self.skip = skip
+
+    def applies(self, database):
+        if self.only is not None:
+            return database in self.only
+        return database not in self.skip
+
+
+QUERIES = {
+    "guest_connect": DatabaseQuery("""
+        SELECT DB_NAME() AS DatabaseName, 'guest' AS Database_User, [permission_name], [state_desc]
+        FROM sys.database_permissions
+        WHERE [grantee_principal_id] = DATABASE_PRINCIPAL_ID('guest')
+        AND [state_desc] LIKE 'GRANT%'
+        AND [permission_name] = 'CONNECT'
+    """, skip=('master', 'tempdb', 'msdb')),
+    "orphaned_users": DatabaseQuery("""
+        SELECT dp.type_desc, dp.sid, dp.name AS orphan_user_name, dp.authentication_type_desc
+        FROM sys.database_principals AS dp
+        LEFT JOIN sys.server_principals AS sp ON dp.sid = sp.sid
+        WHERE sp.sid IS NULL AND dp.authentication_type_desc = 'INSTANCE'
+    """),
+    "proxy_public": DatabaseQuery("""
+        SELECT sp.name AS proxyname
+        FROM dbo.sysproxylogin spl
+        JOIN sys.database_principals dp ON dp.sid = spl.sid
+        JOIN sysproxies sp ON sp.proxy_id = spl.proxy_id
+        WHERE principal_id = USER_ID('public')
+    """, only=('msdb',)),
+    "admin_role_members": DatabaseQuery("""
+        SELECT m.name, r.name
+        FROM sys.database_role_members AS drm
+        INNER JOIN sys.database_principals AS r ON drm.role_principal_id = r.principal_id
+        INNER JOIN sys.database_principals AS m ON drm.member_principal_id = m.principal_id
+        WHERE r.name IN ('db_owner', 'db_securityadmin', 'db_ddladmin', 'db_datawriter')
+        AND m.name <> 'dbo'
+    """, only=('msdb',)),
+    "unsafe_assemblies": DatabaseQuery("""
+        SELECT name, permission_set_desc
+        FROM sys.assemblies
+        WHERE is_user_defined = 1 AND permission_set_desc <> 'SAFE_ACCESS'
+    """),
+    "weak_symmetric_keys": DatabaseQuery("""
+        SELECT DB_NAME() AS Database_Name, name AS Key_Name
+        FROM sys.symmetric_keys
+        WHERE algorithm_desc NOT IN ('AES_128', 'AES_192', 'AES_256')
+    """, skip=SYSTEM_DATABASES),
+    "short_asymmetric_keys": DatabaseQuery("""
+        SELECT DB_NAME() AS Database_Name, name AS Key_Name
+        FROM sys.asymmetric_keys
+        WHERE key_length < 2048
+    """, skip=SYSTEM_DATABASES),
+}
+
+
+def quote_name(name):
+    # Database names cannot be bound; bracket them as QUOTENAME does
+    return "[" + name.replace("]", "]]") + "]"
+
+
+class DatabasePass:
+    """
+    The rows of every per-database query in every database it applies to.
+
+    ``rows[key]`` maps each database to its rows, ``errors[key]`` each
+    database the query could not run in to the error.
+    """
+
+    def __init__(self, ctx):
+        self.rows = {key: {} for key in QUERIES}
+        self.errors = {key: {} for key in QUERIES}
+        self.error = None
+        try:
+            names = [name for name, in ctx.fetch_all("SELECT name FROM sys.databases ORDER BY name")]
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        names = [name for name in names if any(query.applies(name) for query in QUERIES.values())]
+        if ctx.connect is not None and ctx.workers > 1 and len(names) > 1:
+            with ThreadPoolExecutor(max_workers=min(ctx.workers, len(names))) as executor:
+                visits = executor.map(lambda name: (name, self.visit_connected(ctx, name)), names)
+                for name, (found, errors) in visits:
+                    self.merge(name, found, errors)
+        else:
+            self.visit_in_place(ctx, names)
+
+    def visit(self, ctx, cursor, database):
+        # Every applicable query in the current database of cursor, as one batch
+        keys = [key for key, query in QUERIES.items() if query.applies(database)]
+        results = fetch_batch(ctx.dialect, cursor, [(QUERIES[key].query, None) for key in keys], ctx.db_errors)
+        found, errors = {}, {}
+        for key, result in zip(keys, results):
+            if result.error is not None:
+                errors[key] = result.error
+            else:
+                found[key] = result.rows
+        return found, errors
+
+    def visit_connected(self, ctx, database):
+        try:
+            connection = ctx.connect(database)
+        except ctx.db_errors as e:
+            return {}, self.unreadable(database, e)
+        try:
+            cursor = connection.cursor()
+            try:
+                return self.visit(ctx, cursor, database)
+            finally:
+                cursor.close()
+        finally:
+            connection.close()
+
+    def visit_in_place(self, ctx, names):
+        # Switch the run's connection through the databases and back again
+        cursor = ctx.cursor()
+        cursor.execute("SELECT DB_NAME()")
+        current = cursor.fetchone()[0]
+        try:
+            for name in names:
+                try:
+                    cursor.execute(f"USE {quote_name(name)}")
+                except ctx.db_errors as e:
+                    self.merge(name, {}, self.unreadable(name, e))
+                    continue
+                self.merge(name, *self.visit(ctx, cursor, name))
+        finally:
+            cursor.execute(f"USE {quote_name(current)}")
+
+    def unreadable(self, database, error):
+        return {key: error for key, query in QUERIES.items() if query.applies(database)}
+
+    def merge(self, database, found, errors):
+        for key, rows in found.items():
+            self.rows[key][database] = rows
+        for key, error in errors.items():
+            self.errors[key][database] = error
+
+    def findings(self, key):
+        """``(rows by database, errors by database)`` of one per-database query."""
+        if self.error is not None:
+            raise self.error
+        return self.rows[key], self.errors[key]
+
+
+def database_pass(ctx):
+    return ctx.cached("mssql.databases", DatabasePass)
+
+
+class Configurations:
+    """sys.configurations of one run as {lower-cased name: (value, value_in_use)}."""
+
+    def __init__(self, ctx):
+        self.options = {}
+        self.error = None
+        try:
+            rows = ctx.fetch_all("SELECT name, CAST(value AS int), CAST(value_in_use AS int) FROM sys.configurations")
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        for name, value, value_in_use in rows:
+            self.options[name.lower()] = (value, value_in_use)
+
+    def get(self, name):
+        if self.error is not None:
+            raise self.error
+        return self.options.get(name.lower())
+
+
+def configurations(ctx):
+    return ctx.cached("mssql.configurations", Configurations)
+
+
+# Registry values read through xp_instance_regread: name -> (key, value name, T-SQL type)
+REGISTRY_VALUES = {
+    "TcpPort": (r"SOFTWARE\Microsoft\Microsoft SQL Server\MSSQLServer\SuperSocketNetLib\Tcp\IPAll",
+                "TcpPort", "nvarchar(256)"),
+    "HideInstance": (r"SOFTWARE\Microsoft\Microsoft SQL Server\MSSQLServer\SuperSocketNetLib",
+                     "HideInstance", "int"),
+    "NumErrorLogs": (r"Software\Microsoft\MSSQLServer\MSSQLServer", "NumErrorLogs", "int"),
+}
+
+
+class RegistryValues:
+    """
+    The REGISTRY_VALUES of the instance, read by one batch that runs every
+    xp_instance_regread into a variable and selects them as one row.  A
+    value that is not set is None.
+    """
+
+    def __init__(self, ctx):
+        self.values = {}
+        self.error = None
+        names = list(REGISTRY_VALUES)
+        lines = ["SET NOCOUNT ON;"]
+        lines += [f"DECLARE @{name} {kind};" for name, (key, value, kind) in REGISTRY_VALUES.items()]
+        lines += [f"EXECUTE master.dbo.xp_instance_regread N'HKEY_LOCAL_MACHINE', N'{key}', N'{value}', "
+                  f"@{name} OUTPUT, N'no_output';" for name, (key, value, kind) in REGISTRY_VALUES.items()]
+        lines.append(f"SELECT {', '.join('@' + name for name in names)};")
+        try:
+            rows = ctx.fetch_all("\n".join(lines))
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        self.values = dict(zip(names, rows[0]))
+
+    def get(self, name):
+        if self.error is not None:
+            raise self.error
+        return self.values.get(name)
+
+
+def registry_values(ctx):
+    return ctx.cached("mssql.registry", RegistryValues)
@@ -0,0 +1,192 @@
+"""
+Oracle Net configuration files (listener.ora, sqlnet.ora, tnsnames.ora).
+
+A file is a list of ``NAME = value`` parameters where a value is a word, a
+parenthesized list of words, or a tree of nested ``(NAME = value)``
+parameters.  Parameter names are case-insensitive and kept upper-cased.
+``IFILE = path`` includes another file at that point.  Parsed files are
+cached by path and by the modification times of the file and its includes,
+so every rule reading the same file, and every later run until one of them
+changes, shares one parsed model.
+"""
+import os
+import re
+
+# Files referencing each other through IFILE beyond this depth are not followed
+MAX_IFILE_DEPTH = 8
+
+TOKEN = re.compile(r'"[^"]*"|\'[^\']*\'|[()=,]|[^\s()=,"\']+')
+
+_cache = {}
+
+
+class NetConfigError(Exception):
+    pass
+
+
+def tokenize(text):
+    # Comments run from # to the end of the line
+    text = "\n".join(line.split("#", 1)[0] for line in text.splitlines())
+    return TOKEN.findall(text)
+
+
+class Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def peek(self, offset=0):
+        pos = self.pos + offset
+        return self.tokens[pos] if pos < len(self.tokens) else None
+
+    def take(self, expected=None):
+        token = self.peek()
+        if token is None or (expected is not None and token != expected):
+            raise NetConfigError(f"expected {expected or 'a value'} at token {self.pos}, found {token!r}")
+        self.pos += 1
+        return token
+
+    def parameters(self):
+        # Top level: NAME = value, repeated until the end of the file
+        found = []
+        while self.peek() is not None:
+            name = self.take()
+            self.take("=")
+            found.append((name.upper(), self.value(top=True)))
+        return found
+
+    def value(self, top=False):
+        if self.peek() == "(":
+            if self.peek(2) == "=":
+                return self.nested()
+            return self.word_list()
+        words = []
+        while self.peek() not in (None, "(", ")", "=", ","):
+            # A word followed by "=" starts the next top-level parameter
+            if top and self.peek(1) == "=":
+                break
+            words.append(unquote(self.take()))
+        return " ".join(words)
+
+    def nested(self):
+        found = []
+        while self.peek() == "(":
+            self.take("(")
+            name = self.take()
+            self.take("=")
+            found.append((name.upper(), self.value()))
+            self.take(")")
+        return found
+
+    def word_list(self):
+        self.take("(")
+        words = []
+        while self.peek() != ")":
+            token = self.take()
+            if token != ",":
+                words.append(unquote(token))
+        self.take(")")
+        return tuple(words)
+
+
+def unquote(token):
+    if len(token) > 1 and token[0] == token[-1] and token[0] in "\"'":
+        return token[1:-1]
+    return token
+
+
+def parse(text):
+    return Parser(tokenize(text)).parameters()
+
+
+class NetConfig:
+    """
+    One parsed configuration file with its IFILE includes expanded.
+
+    ``parameters`` keeps every top-level parameter in file order; ``get``
+    returns the value of the last setting of a name, as the Net services
+    do.  Nested values are lists of ``(NAME, value)`` pairs, word lists are
+    tuples and everything else is a string.
+    """
+
+    def __init__(self, path, parameters, files=()):
+        self.path = path
+        self.parameters = parameters
+        self.files = dict(files)
+
+    def unchanged(self):
+        # Whether the file and every file it includes still have the parsed mtime
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in self.files.items())
+        except OSError:
+            return False
+
+    def get(self, name, default=None):
+        name = name.upper()
+        for key, value in reversed(self.parameters):
+            if key == name:
+                return value
+        return default
+
+    def names(self, prefix=""):
+        prefix = prefix.upper()
+        return [key for key, value in self.parameters if key.startswith(prefix)]
+
+    def contains(self, word):
+        # Whether word appears in any name or value, case-insensitively
+        word = word.upper()
+        pending = list(self.parameters)
+        while pending:
+            key, value = pending.pop()
+            if word in key:
+                return True
+            if isinstance(value, list):
+                pending.extend(value)
+            elif any(word in part.upper() for part in (value if isinstance(value, tuple) else (value,))):
+                return True
+        return False
+
+    def listeners(self):
+        # Top-level parameters holding an address description are listener definitions
+        return [key for key, value in self.parameters
+                if isinstance(value, list) and any(name in ('DESCRIPTION_LIST', 'DESCRIPTION', 'ADDRESS_LIST',
+                                                            'ADDRESS') for name, nested in value)]
+
+
+def load(path, depth=0):
+    """Parse path, reusing the cached model while it and its includes are unchanged."""
+    cached = _cache.get(path)
+    if cached is not None and cached.unchanged():
+        return cached
+    files = {path: os.stat(path).st_mtime_ns}
+    with open(path, "r") as file:
+        parsed = parse(file.read())
+    parameters = []
+    for name, value in parsed:
+        if name == 'IFILE' and isinstance(value, str) and depth < MAX_IFILE_DEPTH:
+            include = value if os.path.isabs(value) else os.path.join(os.path.dirname(path), value)
+            included = load(include, depth + 1)
+            parameters.extend(included.parameters)
+            files.update(included.files)
+        else:
+            parameters.append((name, value))
+    config = NetConfig(path, parameters, files)
+    _cache[path] = config
+    return config
+
+
+def admin_file(name, oracle_home=None):
+    """
+    The parsed file from ORACLE_HOME/network/admin as ``(config, None)``,
+    or ``(None, reason)`` when it cannot be read.
+    """
+    oracle_home = oracle_home or os.environ.get('ORACLE_HOME')
+    if oracle_home is None:
+        return None, "ORACLE_HOME environment variable is not set"
+    path = os.path.join(oracle_home, "network", "admin", name)
+    if not os.path.exists(path):
+        return None, f"{name} path not found. Please check the ORACLE_HOME path."
+    try:
+        return load(path), None
+    except (OSError, UnicodeDecodeError, NetConfigError):
+        return None, f"Error reading {name} file"
@@ -0,0 +1,412 @@
+"""
+Oracle data dictionary snapshot.
+
+The container mode of the database is probed once per run: a CDB is read
+through the CDB_ views, a non-CDB through the DBA_ views.  Each catalog view
+is then fetched once from that family, all of them in one batch, and kept as
+a list of row dicts keyed by column name.  Rows from the CDB_ family carry their CON_ID, rows from the
+DBA_ family have CON_ID set to None; every row gets the CON_NAME of its
+container from a map fetched once.  A view that cannot be read keeps its
+error, which is raised again to every check reading it so that those checks
+report NoPermission.
+"""
+
+# Rows fetched per round trip
+ARRAYSIZE = 1000
+
+# Statements kept parsed per connection by the driver; above the number of
+# distinct statements a run executes, so a repeat run parses nothing again
+STATEMENT_CACHE_SIZE = 64
+
+# Object names checked by the 5.1.x table privilege checks; only grants on
+# these (and PUBLIC EXECUTE grants) are collected from TAB_PRIVS
+SENSITIVE_TABLES = (
+    'CDB_LOCAL_ADMINAUTH$', 'DEFAULT_PWD$', 'ENC$', 'HISTGRM$',
+    'HIST_HEAD$', 'LINK$', 'PDB_SYNC$', 'SCHEDULER$_CREDENTIAL',
+    'USER$', 'USER_HISTORY$', 'XS$VERIFIERS',
+)
+
+AUDIT_COLUMNS = ('ALT', 'AUD', 'COM', 'DEL', 'GRA', 'IND', 'INS', 'LOC', 'REN', 'SEL', 'UPD', 'FBK')
+
+
+def bind_list(prefix, values):
+    # An IN list of bind variables and the values to bind to them
+    names = [f"{prefix}{i}" for i in range(len(values))]
+    return f"({', '.join(':' + name for name in names)})", dict(zip(names, values))
+
+
+class CatalogView:
+    """
+    A dictionary view available as CDB_<name> and DBA_<name>.
+
+    Values in the filter are bind variables, so the statement text is the
+    same on every run and the server reuses its shared cursor.
+    """
+
+    def __init__(self, name, columns, where=None, binds=None):
+        self.name = name
+        self.columns = tuple(columns)
+        self.where = where
+        self.binds = dict(binds or {})
+
+    def statement(self, family):
+        columns = ", ".join(self.columns + (("CON_ID",) if family == "CDB" else ()))
+        where = f" WHERE {self.where}" if self.where else ""
+        return f"SELECT {columns} FROM {family}_{self.name}{where}"
+
+
+_SENSITIVE_IN, _SENSITIVE_BINDS = bind_list("sensitive", SENSITIVE_TABLES)
+
+VIEWS = {view.name: view for view in (
+    CatalogView("USERS", ("USERNAME", "ACCOUNT_STATUS", "PROFILE", "AUTHENTICATION_TYPE", "ORACLE_MAINTAINED")),
+    CatalogView("USERS_WITH_DEFPWD", ("USERNAME",)),
+    CatalogView("ROLES", ("ROLE", "ORACLE_MAINTAINED")),
+    CatalogView("TABLES", ("OWNER", "TABLE_NAME"), "OWNER = :owner AND TABLE_NAME = :table_name",
+                {"owner": 'SYS', "table_name": 'USER$MIG'}),
+    CatalogView("DB_LINKS", ("OWNER", "DB_LINK", "HOST")),
+    CatalogView("TAB_PRIVS", ("GRANTEE", "OWNER", "TABLE_NAME", "PRIVILEGE"),
+                "(GRANTEE = :grantee AND PRIVILEGE = :privilege)"
+                " OR (OWNER = :owner AND (TABLE_NAME = :aud"
+                " OR TABLE_NAME LIKE :dba ESCAPE '\\'"
+                f" OR TABLE_NAME IN {_SENSITIVE_IN}))",
+                dict(_SENSITIVE_BINDS, grantee='PUBLIC', privilege='EXECUTE', owner='SYS', aud='AUD$', dba='DBA\\_%')),
+    CatalogView("SYS_PRIVS", ("GRANTEE", "PRIVILEGE", "ADMIN_OPTION")),
+    CatalogView("ROLE_PRIVS", ("GRANTEE", "GRANTED_ROLE", "ADMIN_OPTION")),
+    CatalogView("PROXIES", ("PROXY", "CLIENT")),
+    CatalogView("PROFILES", ("PROFILE", "RESOURCE_NAME", "LIMIT")),
+    CatalogView("STMT_AUDIT_OPTS", ("AUDIT_OPTION", "USER_NAME", "PROXY_NAME", "SUCCESS", "FAILURE")),
+    CatalogView("OBJ_AUDIT_OPTS", ("OWNER", "OBJECT_NAME") + AUDIT_COLUMNS, "OBJECT_NAME = :object_name",
+                {"object_name": 'AUD$'}),
+)}
+
+
+class ContainerMode:
+    """
+    Whether the database is a container database, and its container names.
+
+    ``family`` is the view family the run reads: "CDB" for a container
+    database, "DBA" otherwise or when V$DATABASE cannot be read.  Container
+    names are looked up here instead of per row on the server; the root and
+    CON_ID 0 take the database name, as the DECODE(CON_ID, ...) in the
+    benchmark queries does.
+    """
+
+    def __init__(self, cdb=False, db_name=None, containers=()):
+        self.cdb = cdb
+        self.db_name = db_name
+        self.containers = dict(containers)
+        self.containers[0] = self.containers[1] = db_name
+
+    @property
+    def family(self):
+        return "CDB" if self.cdb else "DBA"
+
+    def name(self, con_id):
+        return self.containers.get(con_id, self.db_name)
+
+    @classmethod
+    def probe(cls, ctx):
+        cursor = ctx.cursor()
+        try:
+            cursor.execute("SELECT CDB, NAME FROM V$DATABASE")
+            cdb, db_name = cursor.fetchone()
+            containers = ()
+            if cdb == 'YES':
+                cursor.execute("SELECT CON_ID, NAME FROM V$CONTAINERS")
+                containers = cursor.fetchall()
+        except ctx.db_errors:
+            return cls()
+        return cls(cdb == 'YES', db_name, containers)
+
+
+def container_mode(ctx):
+    return ctx.cached("oracle.container_mode", ContainerMode.probe)
+
+
+class OracleSnapshot:
+    """The catalog views of one run, fetched at most once each."""
+
+    def __init__(self, ctx, views=VIEWS):
+        self.ctx = ctx
+        self.views = views
+        self.mode = container_mode(ctx)
+        self.data = {}
+        self.errors = {}
+        self._maintained = None
+
+    def collect(self, names=None):
+        # Collector phase: fetch every view (or the named ones) up front, in
+        # one batch of ref cursors
+        pending = [name for name in (names if names is not None else self.views)
+                   if name not in self.data and name not in self.errors]
+        if not pending:
+            return self
+        self.ctx.cursor().arraysize = ARRAYSIZE
+        statements = [(self.views[name].statement(self.mode.family), self.views[name].binds) for name in pending]
+        for name, result in zip(pending, self.ctx.fetch_batch(statements)):
+            self._store(name, result)
+        return self
+
+    def rows(self, name):
+        self.collect((name,))
+        if name in self.errors:
+            raise self.errors[name]
+        return self.data[name]
+
+    def _store(self, name, result):
+        if result.error is not None:
+            self.errors[name] = result.error
+            return
+        rows = [dict(zip(result.columns, row)) for row in result.rows]
+        for row in rows:
+            row.setdefault("CON_ID", None)
+            row["CON_NAME"] = self.mode.name(row["CON_ID"])
+        self.data[name] = rows
+
+    def oracle_maintained(self):
+        # Users and roles created by Oracle, excluded from the grant checks
+        if self._maintained is None:
+            names = {row["USERNAME"] for row in self.rows("USERS") if row["ORACLE_MAINTAINED"] == 'Y'}
+            names.update(row["ROLE"] for row in self.rows("ROLES") if row["ORACLE_MAINTAINED"] == 'Y')
+            self._maintained = names
+        return self._maintained
+
+
+def snapshot(ctx):
+    return ctx.cached("oracle.snapshot", OracleSnapshot)
+
+
+class PrivilegeGraph:
+    """
+    System privilege and role grants of every container as a graph.
+
+    Grantees (users, roles and PUBLIC) point to the roles granted to them;
+    the role hierarchy is expanded on demand and cached, so both "which
+    roles does this grantee hold" and "which users hold this grantee's
+    privileges" are lookups.  Nodes are keyed by (CON_ID, name).
+    """
+
+    def __init__(self, ctx):
+        catalog = snapshot(ctx)
+        self.maintained = catalog.oracle_maintained()
+        self.sys_privs = catalog.rows("SYS_PRIVS")
+        self.role_privs = catalog.rows("ROLE_PRIVS")
+        self.users = {}
+        for row in catalog.rows("USERS"):
+            self.users.setdefault(row["CON_ID"], set()).add(row["USERNAME"])
+        self.granted = {}
+        self.members = {}
+        for row in self.role_privs:
+            self.granted.setdefault((row["CON_ID"], row["GRANTEE"]), set()).add(row["GRANTED_ROLE"])
+            self.members.setdefault((row["CON_ID"], row["GRANTED_ROLE"]), set()).add(row["GRANTEE"])
+        self._roles = {}
+        self._holders = {}
+
+    def _closure(self, edges, cache, con_id, name):
+        key = (con_id, name)
+        if key not in cache:
+            seen = set()
+            pending = [name]
+            while pending:
+                for node in edges.get((con_id, pending.pop()), ()):
+                    if node not in seen:
+                        seen.add(node)
+                        pending.append(node)
+            cache[key] = seen
+        return cache[key]
+
+    def roles(self, con_id, grantee):
+        # Every role the grantee holds, directly or through other roles
+        return self._closure(self.granted, self._roles, con_id, grantee)
+
+    def holders(self, con_id, grantee):
+        # Every user that holds what is granted to grantee
+        users = self.users.get(con_id, set())
+        if grantee == 'PUBLIC':
+            return set(users)
+        reached = self._closure(self.members, self._holders, con_id, grantee) | {grantee}
+        if 'PUBLIC' in reached:
+            return set(users)
+        return reached & users
+
+    def sys_privileges(self, con_id, grantee):
+        # Effective system privileges of grantee, including those of PUBLIC and of the roles granted to it
+        grantees = self.roles(con_id, grantee) | self.roles(con_id, 'PUBLIC') | {grantee, 'PUBLIC'}
+        return {row["PRIVILEGE"] for row in self.sys_privs
+                if row["CON_ID"] == con_id and row["GRANTEE"] in grantees}
+
+    def who_holds(self, privilege):
+        # {CON_ID: users} holding a system privilege through any path
+        holders = {}
+        for row in self.sys_privs:
+            if row["PRIVILEGE"] == privilege:
+                holders.setdefault(row["CON_ID"], set()).update(self.holders(row["CON_ID"], row["GRANTEE"]))
+        return holders
+
+    def grants(self, rows, predicate):
+        # Grant rows matching predicate to grantees not maintained by Oracle,
+        # each with the users effectively holding the grant as HOLDERS
+        return [dict(row, HOLDERS=self.holders(row["CON_ID"], row["GRANTEE"])) for row in rows
+                if predicate(row) and row["GRANTEE"] not in self.maintained]
+
+
+def privileges(ctx):
+    return ctx.cached("oracle.privileges", PrivilegeGraph)
+
+
+class ProfileLimits:
+    """
+    Effective resource limits of the profiles in use, per container.
+
+    A limit of DEFAULT is resolved to the DEFAULT profile's limit for the
+    same resource in the same container, so ``limits`` holds what the
+    database enforces, keyed by (CON_ID, profile, resource).  Profiles no
+    user of their container is assigned are left out.
+    """
+
+    def __init__(self, ctx):
+        catalog = snapshot(ctx)
+        in_use = {(row["CON_ID"], row["PROFILE"]) for row in catalog.rows("USERS")}
+        rows = catalog.rows("PROFILES")
+        defaults = {(row["CON_ID"], row["RESOURCE_NAME"]): row["LIMIT"] for row in rows if row["PROFILE"] == 'DEFAULT'}
+        self.limits = {}
+        for row in rows:
+            if (row["CON_ID"], row["PROFILE"]) not in in_use:
+                continue
+            limit = row["LIMIT"]
+            if limit == 'DEFAULT':
+                limit = defaults.get((row["CON_ID"], row["RESOURCE_NAME"]))
+            self.limits[(row["CON_ID"], row["PROFILE"], row["RESOURCE_NAME"])] = dict(row, LIMIT=limit)
+
+    def limit(self, con_id, profile, resource):
+        row = self.limits.get((con_id, profile, resource))
+        return row["LIMIT"] if row is not None else None
+
+    def resource(self, name):
+        # The effective limit rows of one resource across containers and profiles
+        return [row for (con_id, profile, resource), row in self.limits.items() if resource == name]
+
+
+def profile_limits(ctx):
+    return ctx.cached("oracle.profile_limits", ProfileLimits)
+
+
+class ParameterMatrix:
+    """
+    Initialization parameters of every container, fetched in one query.
+
+    ``values(name)`` maps the CON_ID of each container to the upper-cased
+    value of the parameter there; a parameter that is not listed has no
+    entry.  CON_ID 0 (the whole CDB, or a non-CDB) and 1 (the root) are kept
+    apart even though both are named after the database; ``names`` names
+    containers for a finding.  Hidden (underscore) parameters are not in
+    V$SYSTEM_PARAMETER and are read from the X$ tables of the current
+    container instead, one query per parameter, cached in the run's context
+    like any collector.  Like a snapshot view, a value that cannot be read
+    raises its error again to every check reading it.
+    """
+
+    def __init__(self, ctx):
+        self.mode = container_mode(ctx)
+        self.ctx = ctx
+        self.matrix = {}
+        self.error = None
+        cursor = ctx.cursor()
+        cursor.arraysize = ARRAYSIZE
+        try:
+            cursor.execute("SELECT UPPER(NAME), UPPER(VALUE), CON_ID FROM V$SYSTEM_PARAMETER")
+            rows = cursor.fetchall()
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        for name, value, con_id in rows:
+            self.matrix.setdefault(name, {})[con_id] = value
+
+    def values(self, name):
+        name = name.upper()
+        if name.startswith('_'):
+            values = self.ctx.cached(f"oracle.hidden_parameter.{name}", lambda ctx: hidden_parameter(ctx, name))
+            if isinstance(values, Exception):
+                raise values
+            return values
+        if self.error is not None:
+            raise self.error
+        return self.matrix.get(name, {})
+
+    def names(self, con_ids):
+        # The sorted names of the containers, each once
+        return sorted({self.mode.name(con_id) for con_id in con_ids})
+
+
+def hidden_parameter(ctx, name):
+    # The value of a hidden parameter in the current container by its CON_ID, or the error reading it
+    cursor = ctx.cursor()
+    try:
+        cursor.execute("""
+            SELECT UPPER(B.KSPPSTVL), TO_NUMBER(SYS_CONTEXT('USERENV', 'CON_ID'))
+            FROM SYS.X_$KSPPI A
+            JOIN SYS.X_$KSPPCV B ON A.INDX = B.INDX
+            WHERE UPPER(A.KSPPINM) = :name
+        """, name=name)
+        return {con_id: value for value, con_id in cursor.fetchall()}
+    except ctx.db_errors as e:
+        return e
+
+
+def parameters(ctx):
+    return ctx.cached("oracle.parameters", ParameterMatrix)
+
+
+def by_container(rows):
+    grouped = {}
+    for row in rows:
+        grouped.setdefault(row["CON_NAME"], []).append(row)
+    return grouped
+
+
+class UnifiedAuditCoverage:
+    """
+    Which audit options are covered by a unified audit policy enabled for
+    all users on success and failure.
+
+    Both policy views are read once; ``missing(options)`` then answers any
+    number of coverage questions in memory.  Object actions are keyed by
+    their object schema and name as well.
+    """
+
+    def __init__(self, ctx):
+        self.covered = set()
+        self.error = None
+        cursor = ctx.cursor()
+        cursor.arraysize = ARRAYSIZE
+        try:
+            cursor.execute("""
+                SELECT POLICY_NAME, SUCCESS, FAILURE, ENABLED_OPTION, ENTITY_NAME
+                FROM AUDIT_UNIFIED_ENABLED_POLICIES
+            """)
+            enabled = {policy for policy, success, failure, option, entity in cursor.fetchall()
+                       if success == 'YES' and failure == 'YES' and option == 'BY USER' and entity == 'ALL USERS'}
+            cursor.execute("""
+                SELECT POLICY_NAME, AUDIT_OPTION, AUDIT_OPTION_TYPE, OBJECT_SCHEMA, OBJECT_NAME
+                FROM AUDIT_UNIFIED_POLICIES
+            """)
+            policies = cursor.fetchall()
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        for policy, option, option_type, schema, name in policies:
+            if policy in enabled:
+                if option_type == 'OBJECT ACTION':
+                    self.covered.add((option_type, option, schema, name))
+                else:
+                    self.covered.add((option_type, option))
+
+    def missing(self, options, option_type='STANDARD ACTION', obj=None):
+        if self.error is not None:
+            raise self.error
+        keys = [(option_type, option) + tuple(obj or ()) for option in options]
+        return [option for option, key in zip(options, keys) if key not in self.covered]
+
+
+def unified_audit(ctx):
+    return ctx.cached("oracle.unified_audit", UnifiedAuditCoverage)
@@ -0,0 +1,192 @@
+"""
+PostgreSQL catalog collectors.
+
+All of pg_settings is read in one query per run instead of one SHOW per
+setting.  Values are the raw ``setting`` column, which is in the setting's
+base ``unit`` (e.g. log_rotation_age in minutes) rather than the display
+form SHOW returns.  If pg_settings cannot be read the error is kept and
+raised again to every check reading a setting, so those report NoPermission.
+"""
+
+
+class SettingsSnapshot:
+    """pg_settings of one run as {name: row dict}."""
+
+    COLUMNS = ("name", "setting", "unit", "source", "context")
+
+    def __init__(self, ctx):
+        self.rows = {}
+        self.error = None
+        cursor = ctx.cursor()
+        try:
+            cursor.execute(f"SELECT {', '.join(self.COLUMNS)} FROM pg_settings")
+            rows = cursor.fetchall()
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        for row in rows:
+            self.rows[row[0]] = dict(zip(self.COLUMNS, row))
+
+    def get(self, name):
+        if self.error is not None:
+            raise self.error
+        return self.rows.get(name)
+
+    def value(self, name, default=None):
+        row = self.get(name)
+        return row["setting"] if row is not None else default
+
+    def in_context(self, *contexts):
+        if self.error is not None:
+            raise self.error
+        return {name: row["setting"] for name, row in self.rows.items() if row["context"] in contexts}
+
+
+def pg_settings(ctx):
+    return ctx.cached("postgres.settings", SettingsSnapshot)
+
+
+def databases(ctx):
+    """Names of the databases of the cluster that accept connections, templates excluded."""
+    return [name for name, in ctx.fetch_all(
+        "SELECT datname FROM pg_catalog.pg_database WHERE datallowconn AND NOT datistemplate ORDER BY datname")]
+
+
+# Rows fetched per round trip from a server-side cursor
+ITERSIZE = 2000
+
+
+def stream(ctx, name, query):
+    """
+    Rows of query read through a named (server-side) cursor, ITERSIZE rows
+    per round trip, so a catalog with many thousands of rows is never held
+    by the server or the driver all at once.
+    """
+    cursor = ctx.connection.cursor(name=name)
+    cursor.itersize = ITERSIZE
+    try:
+        cursor.execute(query)
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+class RoleGraph:
+    """
+    Roles, their memberships and the effective privileges of every login.
+
+    pg_roles and pg_auth_members are read in one statement.  A role can
+    SET ROLE to every role it is a member of, directly or through other
+    roles, so a login holding membership in a superuser, REPLICATION or
+    BYPASSRLS role effectively has that attribute even though PostgreSQL
+    does not inherit it.  The membership closure is built once per run and
+    every role-based check reads it instead of querying the catalog again.
+    """
+
+    ATTRIBUTES = ("superuser", "replication", "bypassrls")
+
+    def __init__(self, ctx):
+        self.roles = {}
+        self.member_of = {}
+        self.error = None
+        self._closure = {}
+        cursor = ctx.cursor()
+        try:
+            cursor.execute("""
+                SELECT 'role', r.rolname::text, NULL::text, r.rolcanlogin,
+                       r.rolsuper, r.rolreplication, r.rolbypassrls
+                FROM pg_catalog.pg_roles r
+                UNION ALL
+                SELECT 'member', m.rolname::text, g.rolname::text, NULL, NULL, NULL, NULL
+                FROM pg_catalog.pg_auth_members a
+                JOIN pg_catalog.pg_roles m ON m.oid = a.member
+                JOIN pg_catalog.pg_roles g ON g.oid = a.roleid
+            """)
+            rows = cursor.fetchall()
+        except ctx.db_errors as e:
+            self.error = e
+            return
+        for kind, name, group, login, superuser, replication, bypassrls in rows:
+            if kind == 'role':
+                self.roles[name] = {"login": login, "superuser": superuser,
+                                    "replication": replication, "bypassrls": bypassrls}
+            else:
+                self.member_of.setdefault(name, set()).add(group)
+
+    def reachable(self, name):
+        # name and every role it is a member of, directly or indirectly
+        if self.error is not None:
+            raise self.error
+        if name not in self._closure:
+            found = {name}
+            pending = [name]
+            while pending:
+                for group in self.member_of.get(pending.pop(), ()):
+                    if group not in found:
+                        found.add(group)
+                        pending.append(group)
+            self._closure[name] = found
+        return self._closure[name]
+
+    def effective(self, name):
+        """{attribute: sorted roles granting it} for name, empty where not held."""
+        reachable = self.reachable(name)
+        return {attribute: sorted(role for role in reachable if self.roles.get(role, {}).get(attribute))
+                for attribute in self.ATTRIBUTES}
+
+    def logins(self):
+        """Effective privileges of every login role as {name: effective(name)}."""
+        if self.error is not None:
+            raise self.error
+        return {name: self.effective(name) for name, role in sorted(self.roles.items()) if role["login"]}
+
+    def holding(self, attribute):
+        # Login roles with attribute as {name: roles granting it}
+        return {name: privileges[attribute] for name, privileges in self.logins().items()
+                if privileges[attribute]}
+
+
+def roles(ctx):
+    return ctx.cached("postgres.roles", RoleGraph)
+
+
+def via(name, granting):
+    # "app" when the role holds the attribute itself, "app (via admins)" when inherited
+    inherited = [role for role in granting if role != name]
+    if name in granting or not inherited:
+        return name
+    return f"{name} (via {', '.join(inherited)})"
+
+
+class RowSecurity:
+    """
+    Tables with row level security enabled and the number of their policies.
+
+    One statement joins pg_class to pg_policy, so the tables without any
+    policy are known without a query per table.
+    """
+
+    def __init__(self, ctx):
+        self.policies = {}
+        self.error = None
+        try:
+            for name, policies in stream(ctx, "auditix_rls", """
+                SELECT c.oid::regclass::text, count(p.oid)
+                FROM pg_catalog.pg_class c
+                LEFT JOIN pg_catalog.pg_policy p ON p.polrelid = c.oid
+                WHERE c.relrowsecurity
+                GROUP BY c.oid
+            """):
+                self.policies[name] = policies
+        except ctx.db_errors as e:
+            self.error = e
+
+    def uncovered(self):
+        # RLS-enabled tables without a single policy
+        if self.error is not None:
+            raise self.error
+        return sorted(name for name, policies in self.policies.items() if not policies)
+
+
+def row_security(ctx):
+    return ctx.cached("postgres.row_security", RowSecurity)
@@ -0,0 +1,131 @@
+"""
+Connections to the audited targets, one process-wide pool per target and login.
+
+Oracle sessions come from a ``cx_Oracle.SessionPool``, which pings a session
+idle for a while before handing it out and terminates the ones idle for
+longer than ``max_idle`` itself.  PostgreSQL and SQL Server connections are
+kept by a ``ConnectionPool``, which checks them with ``SELECT 1`` and rolls
+back what an audit left open before the next audit gets them.  A SQL Server
+audit visiting every database leases its connection to each one from the
+pool of that database.
+
+The size, idle time and number of pools come from the AUDITIX_POOL_SIZE,
+AUDITIX_POOL_MAX_IDLE and AUDITIX_MAX_POOLS settings.  With ``shared=False``
+a caller gets a pool of its own instead, which it closes when done.
+"""
+import cx_Oracle
+import psycopg2
+import pyodbc
+from django.conf import settings
+
+from .collectors.oracle import STATEMENT_CACHE_SIZE
+from .pool import MAX_IDLE, MAX_POOLS, POOL_SIZE, ConnectionPool, fingerprint, shared_pool
+
+
+def pool_size():
+    # Connections per target the audits may use at once
+    return getattr(settings, "AUDITIX_POOL_SIZE", POOL_SIZE)
+
+
+def max_idle():
+    return getattr(settings, "AUDITIX_POOL_MAX_IDLE", MAX_IDLE)
+
+
+def select_one(connection):
+    cursor = connection.cursor()
+    try:
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+    finally:
+        cursor.close()
+
+
+def rollback(connection):
+    connection.rollback()
+
+
+class OracleSessionPool(ConnectionPool):
+    """
+    A ConnectionPool handing out the sessions of a cx_Oracle.SessionPool.
+
+    The session pool keeps ``size`` sessions for the checks, which the
+    pool's slots never exceed, and opens the audits' own sessions beyond
+    them (FORCEGET), dropping those when they are released.  Once the pool
+    is closed and none of its sessions is in use the session pool is
+    closed; a caller that still held the pool then gets a connection of its
+    own.
+    """
+
+    def __init__(self, username, password, dsn, size, max_idle):
+        super().__init__(lambda: cx_Oracle.connect(username, password, dsn), size, max_idle)
+        self.sessions = cx_Oracle.SessionPool(username, password, dsn, min=0, max=self.size, increment=1,
+                                              threaded=True, getmode=cx_Oracle.SPOOL_ATTRVAL_FORCEGET,
+                                              timeout=max_idle)
+
+    def take(self):
+        sessions = self.sessions
+        if sessions is None:
+            return self.connect()
+        connection = sessions.acquire()
+        # Keep the audit statements parsed in the driver's statement cache
+        connection.stmtcachesize = STATEMENT_CACHE_SIZE
+        return connection
+
+    def give(self, connection):
+        if self.sessions is None:
+            self.discard(connection)
+            return
+        try:
+            self.sessions.release(connection)
+        except cx_Oracle.DatabaseError:
+            # A session whose transaction cannot end is dropped from the pool
+            self.sessions.drop(connection)
+
+    def evict(self):
+        # The session pool times idle sessions out on its own
+        pass
+
+    def shut(self):
+        sessions, self.sessions = self.sessions, None
+        if sessions is not None:
+            try:
+                # Every session was released, none is terminated under an audit
+                sessions.close()
+            except cx_Oracle.DatabaseError:
+                pass
+
+
+def pooled(key, factory, shared=True):
+    # The process-wide pool for key, or a new one for the caller alone to close
+    if not shared:
+        return factory()
+    return shared_pool(fingerprint(*key), factory, getattr(settings, "AUDITIX_MAX_POOLS", MAX_POOLS))
+
+
+def oracle_pool(username, password, dsn, shared=True):
+    return pooled(("oracle", dsn, username, password),
+                  lambda: OracleSessionPool(username, password, dsn, pool_size(), max_idle()), shared)
+
+
+def postgres_pool(host, port, database, username, password, shared=True):
+    return pooled(("postgres", host, port, database, username, password),
+                  lambda: ConnectionPool(
+                      lambda: psycopg2.connect(host=host, port=port, dbname=database,
+                                               user=username, password=password),
+                      pool_size(), max_idle(), ping=select_one, reset=rollback), shared)
+
+
+def mssql_connection_string(server, database, username, password):
+    return f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={server};DATABASE={database};UID={username};PWD={password};'
+
+
+def mssql_pool(server, database, username, password, shared=True):
+    return pooled(("mssql", server, database, username, password),
+                  lambda: ConnectionPool(
+                      lambda: pyodbc.connect(mssql_connection_string(server, database, username, password)),
+                      pool_size(), max_idle(), ping=select_one, reset=rollback), shared)
+
+
+def mssql_database_connect(server, username, password):
+    # The connect of an audit context visiting every database: a connection leased from that database's pool
+    return lambda name: mssql_pool(server, name, username, password).lease()
@@ -0,0 +1,435 @@
+"""
+Plans and executes audit runs over the check registry.
+
+A run is planned from the registered sections and checks of one dialect,
+optionally narrowed to some sections or with checks skipped, and then
+executed against an ``AuditContext``.  Each check yields a ``CheckResult``;
+the ``AuditRun`` keeps them in report order together with the totals used
+by the summary table.
+
+Checks scoped to a database can be run in several databases of one server
+at once: each database gets a connection and context of its own from a
+bounded pool of workers while the server-wide checks run on the main
+context, and the results are merged into the one run in report order.
+The server-wide checks can likewise share a bounded ``ConnectionPool`` to
+the target and run several at a time.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from .batching import fetch_batch
+from .checks import DATABASE, NO_PERMISSION, STATUSES, load
+
+# Databases audited at the same time, i.e. connections open besides the main one
+DATABASE_WORKERS = 4
+
+
+def statement_key(statement, params):
+    return statement, repr(params)
+
+
+class AuditCancelled(BaseException):
+    """
+    Raised into a run whose cancel event was set.
+
+    A BaseException, so the broad ``except Exception`` around the report
+    writing lets it through to whoever asked for the cancellation.
+    """
+
+
+_cancel = threading.local()
+
+
+@contextmanager
+def cancellable(event):
+    """Stop the runs of this thread within the with block, at their next check, once event is set."""
+    _cancel.event = event
+    try:
+        yield
+    finally:
+        _cancel.event = None
+
+
+def check_cancelled():
+    event = getattr(_cancel, "event", None)
+    if event is not None and event.is_set():
+        raise AuditCancelled()
+
+
+_observer = threading.local()
+
+
+@contextmanager
+def observing(observer):
+    """
+    Report the runs of this thread within the with block to observer:
+    ``observer.planned(plan, expected)`` when a run starts, with the number
+    of results it will yield, and ``observer.result(result)`` for each one.
+    """
+    _observer.observer, _observer.announced = observer, set()
+    try:
+        yield observer
+    finally:
+        _observer.observer, _observer.announced = None, set()
+
+
+def current_observer():
+    return getattr(_observer, "observer", None)
+
+
+def announce(plans, databases=None):
+    """
+    Report the runs of plans this thread is about to make to its observer
+    now, so that its total counts all of them before the first result; the
+    runs themselves then do not report them again.
+    """
+    observer = current_observer()
+    if observer is None:
+        return
+    for plan in plans:
+        observer.planned(plan, expected_results(plan, databases))
+        _observer.announced.add(plan)
+
+
+class ServerNeeded(BaseException):
+    """
+    Raised by a context reading from memory only when a check would reach
+    the server; a BaseException, so no collector takes it for a driver error.
+    """
+
+
+class AuditContext:
+    """
+    Per-run state shared by all collectors.
+
+    Holds the open connection, a single reused cursor, the driver errors that
+    mean "not allowed to read this" (reported as NoPermission) and a cache
+    for data collected once and read by many checks.  ``connect``, when
+    given, opens a further connection to a database by name; collectors
+    visiting many databases then read up to ``workers`` of them at once.
+
+    Checks may run in several threads at once, each over a connection of its
+    own bound with ``using``; ``connection`` and ``cursor()`` then answer
+    with that thread's connection, and a collector is built by one thread
+    while the others needing it wait.  Within ``in_memory`` a thread may
+    only read the collectors already built: reaching the server raises
+    ServerNeeded instead.
+    """
+
+    def __init__(self, connection, dialect, db_errors=(Exception,), connect=None, workers=DATABASE_WORKERS):
+        self.main_connection = connection
+        self.dialect = dialect
+        self.db_errors = tuple(db_errors)
+        self.connect = connect
+        self.workers = workers
+        self.cache = {}
+        self.prefetched = {}
+        self._cursor = None
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._building = {}
+
+    @property
+    def connection(self):
+        self._server_needed()
+        return getattr(self._local, "connection", None) or self.main_connection
+
+    def _server_needed(self):
+        if getattr(self._local, "in_memory", False):
+            raise ServerNeeded()
+
+    @contextmanager
+    def in_memory(self):
+        """Run the with block of this thread over the collectors already built, without the server."""
+        self._local.in_memory = True
+        try:
+            yield self
+        finally:
+            self._local.in_memory = False
+
+    @contextmanager
+    def using(self, connection):
+        """Run the with block of this thread over connection instead of the main one."""
+        self._local.connection, self._local.cursor = connection, None
+        try:
+            yield self
+        finally:
+            cursor = self._local.cursor
+            self._local.connection = self._local.cursor = None
+            if cursor is not None:
+                cursor.close()
+
+    def cursor(self):
+        self._server_needed()
+        if getattr(self._local, "connection", None) is not None:
+            if self._local.cursor is None:
+                self._local.cursor = self._local.connection.cursor()
+            return self._local.cursor
+        if self._cursor is None:
+            self._cursor = self.main_connection.cursor()
+        return self._cursor
+
+    def fetch_batch(self, statements):
+        """A ``StatementResult`` per ``(statement, params)``, sent in as few round trips as the driver allows."""
+        return fetch_batch(self.dialect, self.cursor(), statements, self.db_errors)
+
+    def prefetch(self, statements):
+        # Run statements now, batched, for fetch_all to answer from once each
+        pending = {statement_key(statement, params): (statement, params) for statement, params in statements}
+        pending = {key: statement for key, statement in pending.items() if key not in self.prefetched}
+        for key, result in zip(pending, self.fetch_batch(pending.values())):
+            self.prefetched[key] = result
+
+    def fetch_all(self, query, params=None):
+        # A tuple of statements returns the concatenation of their rows, each
+        # executed with the same bind parameters
+        statements = query if isinstance(query, (tuple, list)) else (query,)
+        if len(statements) > 1:
+            self.prefetch((statement, params) for statement in statements)
+        rows = []
+        cursor = self.cursor()
+        for statement in statements:
+            result = self.prefetched.pop(statement_key(statement, params), None)
+            if result is not None:
+                rows.extend(result.fetch())
+                continue
+            if params is None:
+                cursor.execute(statement)
+            else:
+                cursor.execute(statement, params)
+            rows.extend(cursor.fetchall())
+        return rows
+
+    def cached(self, key, factory):
+        if key not in self.cache:
+            self._server_needed()
+            with self._lock:
+                building = self._building.setdefault(key, threading.Lock())
+            with building:
+                if key not in self.cache:
+                    self.cache[key] = factory(self)
+        return self.cache[key]
+
+    def close(self):
+        if self._cursor is not None:
+            self._cursor.close()
+            self._cursor = None
+
+
+class CheckResult:
+    def __init__(self, check, status, note=None, elapsed=0.0, error=None, database=None):
+        self.check = check
+        self.status = status
+        self.note = note
+        self.elapsed = elapsed
+        self.error = error
+        self.database = database
+
+    @property
+    def label(self):
+        label = self.check.label
+        if self.database is not None:
+            label = f"{label} [{self.database}]"
+        if self.note:
+            return f"{label} - {self.note}"
+        return label
+
+    def as_dict(self):
+        return {
+            "check_id": self.check.check_id,
+            "title": self.check.title,
+            "section": self.check.section,
+            "severity": self.check.severity,
+            "database": self.database,
+            "status": self.status,
+            "note": self.note,
+            "elapsed": round(self.elapsed, 4),
+            "error": str(self.error) if self.error else None,
+        }
+
+
+class AuditPlan:
+    """The ordered sections of one run and the checks to execute in each."""
+
+    def __init__(self, dialect, standard, sections):
+        self.dialect = dialect
+        self.standard = standard
+        self.sections = sections
+
+    @property
+    def checks(self):
+        return [check for section, checks in self.sections for check in checks]
+
+    def __len__(self):
+        return sum(len(checks) for section, checks in self.sections)
+
+
+class AuditRun:
+    def __init__(self, plan):
+        self.plan = plan
+        self.results = []
+        self.counts = dict.fromkeys(STATUSES, 0)
+        self.elapsed = 0.0
+
+    def add(self, result):
+        self.results.append(result)
+        self.counts[result.status] += 1
+
+    def by_section(self):
+        grouped = {check.check_id: [] for check in self.plan.checks}
+        for result in self.results:
+            grouped[result.check.check_id].append(result)
+        for section, checks in self.plan.sections:
+            yield section, [result for check in checks for result in grouped[check.check_id]]
+
+    def as_dict(self):
+        return {
+            "dialect": self.plan.dialect,
+            "standard": self.plan.standard,
+            "counts": dict(self.counts),
+            "elapsed": round(self.elapsed, 4),
+            "results": [result.as_dict() for result in self.results],
+        }
+
+
+def plan_run(dialect, standard="CIS", sections=None, skip=()):
+    registry = load(dialect)
+    skip = set(skip)
+    planned = []
+    for section in registry.sections(dialect, standard):
+        if sections is not None and section.key not in sections:
+            continue
+        checks = [check for check in registry.checks(dialect, standard)
+                  if check.section == section.key and check.check_id not in skip]
+        if checks:
+            planned.append((section, checks))
+    return AuditPlan(dialect, standard, planned)
+
+
+def prefetch_queries(checks, ctx):
+    # The plain queries of the checks go to the server together before any check runs
+    ctx.prefetch((statement, check.params) for check in checks if check.query is not None
+                 for statement in (check.query if isinstance(check.query, (tuple, list)) else (check.query,)))
+
+
+def execute_check(check, ctx, database=None):
+    started = time.perf_counter()
+    try:
+        status, note = check.evaluate(check.collect(ctx))
+        error = None
+    except ctx.db_errors as e:
+        status, note, error = NO_PERMISSION, None, e
+    return CheckResult(check, status, note, time.perf_counter() - started, error, database)
+
+
+def expected_results(plan, databases=None):
+    # One result per check, and one per database for the database-scoped checks run in each
+    if not databases:
+        return len(plan)
+    per_database = sum(1 for check in plan.checks if check.scope == DATABASE)
+    return len(plan) + per_database * (len(databases) - 1)
+
+
+def run_database(checks, database, connect, dialect, db_errors):
+    """Results of checks in one database, over a connection of its own, by check id."""
+    try:
+        connection = connect(database)
+    except db_errors as e:
+        return {check.check_id: CheckResult(check, NO_PERMISSION, error=e, database=database) for check in checks}
+    ctx = AuditContext(connection, dialect, db_errors)
+    try:
+        prefetch_queries(checks, ctx)
+        return {check.check_id: execute_check(check, ctx, database) for check in checks}
+    finally:
+        ctx.close()
+        connection.close()
+
+
+def execute_in_memory(check, ctx):
+    # The result of check when its collector was built already, else None
+    try:
+        with ctx.in_memory():
+            return execute_check(check, ctx)
+    except ServerNeeded:
+        return None
+
+
+def run_pooled(check, ctx, pool):
+    # One check over a connection of the pool, bound to this worker thread
+    try:
+        with pool.connection() as connection, ctx.using(connection):
+            return execute_check(check, ctx)
+    except ctx.db_errors as e:
+        return CheckResult(check, NO_PERMISSION, error=e)
+
+
+def run_plan(plan, ctx, on_result=None, databases=None, connect=None, workers=DATABASE_WORKERS, pool=None):
+    """
+    Execute plan against ctx.
+
+    With ``databases`` (and ``connect``, opening a connection to a database
+    by name) the database-scoped checks run in each of them instead, at
+    most ``workers`` databases at a time, and yield one result per database.
+
+    With a ``pool`` of more than one connection the other checks reading
+    through a collector not built yet run concurrently, one per connection
+    of the pool, after the plain queries were sent together over the main
+    connection; those whose collector was built already (an Oracle snapshot
+    collected before the run) are evaluated from memory on this thread, as
+    they would not use the pool's connection.  Either way the results are
+    added to the run, and passed to ``on_result``, by this thread in report
+    order, so the totals are counted once each and the report reads the same.
+    """
+    run = AuditRun(plan)
+    started = time.perf_counter()
+    per_database = [check for check in plan.checks if check.scope == DATABASE] if databases else []
+    pending = {}
+    concurrent = {}
+    ready = {}
+    executors = []
+    if per_database:
+        executors.append(ThreadPoolExecutor(max_workers=min(workers, len(databases))))
+        pending = {database: executors[-1].submit(run_database, per_database, database, connect,
+                                                  ctx.dialect, ctx.db_errors)
+                   for database in databases}
+    observer = current_observer()
+    try:
+        local = [check for check in plan.checks if not (pending and check.scope == DATABASE)]
+        if observer is not None and plan not in getattr(_observer, "announced", ()):
+            observer.planned(plan, expected_results(plan, databases))
+        prefetch_queries(local, ctx)
+        # Plain queries are answered from the prefetch; only collectors still talk to the server
+        collecting = [check for check in local if check.collector is not None]
+        if pool is not None and pool.size > 1 and len(collecting) > 1:
+            for check in collecting:
+                result = execute_in_memory(check, ctx)
+                if result is not None:
+                    ready[check.check_id] = result
+            collecting = [check for check in collecting if check.check_id not in ready]
+        if len(collecting) > 1 and pool is not None and pool.size > 1:
+            executors.append(ThreadPoolExecutor(max_workers=min(pool.size, len(collecting))))
+            concurrent = {check.check_id: executors[-1].submit(run_pooled, check, ctx, pool)
+                          for check in collecting}
+        for check in plan.checks:
+            check_cancelled()
+            if pending and check.scope == DATABASE:
+                results = [pending[database].result()[check.check_id] for database in databases]
+            elif check.check_id in ready:
+                results = [ready[check.check_id]]
+            elif check.check_id in concurrent:
+                results = [concurrent[check.check_id].result()]
+            else:
+                results = [execute_check(check, ctx)]
+            for result in results:
+                run.add(result)
+                if on_result is not None:
+                    on_result(result)
+                if observer is not None:
+                    observer.result(result)
+    finally:
+        for executor in executors:
+            executor.shutdown(cancel_futures=True)
+    run.elapsed = time.perf_counter() - started
+    return run
@@ -0,0 +1,239 @@
+"""
+Audits of a fleet of targets read from an inventory.
+
+An inventory is a CSV file with a header row or a JSON list of objects, one
+target each, with the fields ``db_type`` (Oracle, MS SQL or Postgresql, as
+in the audit form), ``host``, ``port``, ``dsn`` (Oracle), ``database`` (MS
+SQL and PostgreSQL), ``standard`` (CIS unless given; a standard without
+registry checks for the target's dialect, such as DISA_STIG, is rejected
+with the inventory rather than audited by an empty plan) and optionally
+``username`` and ``password``; a target without credentials uses the ones
+the runner is given.
+
+Targets are audited concurrently, at most ``workers`` at a time and at most
+``per_host`` on any one host, each by the registry checks of its dialect
+over a connection pool of its own (see ``connections``), closed once the
+target is audited instead of kept with the process-wide pools of the web
+audits.  A target that cannot be reached or audited keeps its error and
+does not stop the others.
+
+The benchmark items the audit views still evaluate themselves, outside the
+registry, are not run by a fleet audit; each target lists them as
+``not_run``.
+"""
+import csv
+import json
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import cx_Oracle
+import psycopg2
+import pyodbc
+
+from .checks import STATUSES, load
+from .collectors.oracle import snapshot
+from .connections import mssql_database_connect, mssql_pool, oracle_pool, pool_size, postgres_pool
+from .engine import AuditContext, plan_run, run_plan
+
+# Targets audited at the same time, over the whole fleet and on one host
+FLEET_WORKERS = 16
+PER_HOST = 2
+
+DIALECTS = {
+    "oracle": "oracle",
+    "ms sql": "mssql",
+    "mssql": "mssql",
+    "postgresql": "postgres",
+    "postgres": "postgres",
+}
+
+DEFAULT_PORTS = {"mssql": 1433, "postgres": 5432}
+
+# Benchmark items written by the audit views themselves rather than registered checks
+NOT_RUN = {
+    "mssql": ("1.1", "1.2"),
+    "postgres": ("1.1", "1.2", "1.3", "2.1", "5.1", "5.2", "5.3"),
+}
+
+
+class InventoryError(ValueError):
+    pass
+
+
+class Target:
+    def __init__(self, db_type, host="", port=None, dsn="", database="", standard="CIS",
+                 username=None, password=None):
+        self.dialect = DIALECTS.get((db_type or "").strip().lower())
+        if self.dialect is None:
+            raise InventoryError(f"unknown db_type {db_type!r}")
+        self.db_type = db_type
+        self.dsn = (dsn or "").strip()
+        self.host = (host or "").strip() or self.dsn.split(":")[0].split("/")[0]
+        if not self.host:
+            raise InventoryError(f"{db_type} target without host or dsn")
+        self.port = int(port) if port not in (None, "") else DEFAULT_PORTS.get(self.dialect)
+        self.database = (database or "").strip()
+        if self.dialect == "oracle" and not self.dsn:
+            self.dsn = f"{self.host}:{self.port or 1521}/{self.database}"
+        self.standard = (standard or "").strip() or "CIS"
+        if not load(self.dialect).checks(self.dialect, self.standard):
+            raise InventoryError(f"no {self.standard} checks for {db_type} targets")
+        self.username = username or None
+        self.password = password or None
+
+    @property
+    def name(self):
+        if self.dialect == "oracle":
+            return self.dsn
+        return f"{self.host}:{self.port}/{self.database}"
+
+    def as_dict(self):
+        return {"db_type": self.db_type, "dialect": self.dialect, "target": self.name,
+                "host": self.host, "standard": self.standard}
+
+
+def load_inventory(path):
+    """The targets listed in a .json or .csv inventory file."""
+    with open(path, newline="") as f:
+        if path.lower().endswith(".json"):
+            rows = json.load(f)
+            if isinstance(rows, dict):
+                rows = rows.get("targets", [])
+        else:
+            rows = list(csv.DictReader(f))
+    targets = []
+    for line, row in enumerate(rows, 1):
+        fields = {key.strip().lower(): value for key, value in row.items() if key}
+        try:
+            targets.append(Target(**{key: fields.get(key) for key in (
+                "db_type", "host", "port", "dsn", "database", "standard", "username", "password")}))
+        except ValueError as e:
+            raise InventoryError(f"{path}, target {line}: {e}") from e
+    return targets
+
+
+class TargetResult:
+    def __init__(self, target, run=None, error=None, elapsed=0.0):
+        self.target = target
+        self.run = run
+        self.error = error
+        self.elapsed = elapsed
+
+    def as_dict(self):
+        result = self.target.as_dict()
+        result.update(self.run.as_dict() if self.run is not None else {"results": []})
+        result["elapsed"] = round(self.elapsed, 4)
+        result["error"] = str(self.error) if self.error is not None else None
+        result["not_run"] = list(NOT_RUN.get(self.target.dialect, ()))
+        return result
+
+
+class FleetRun:
+    """The results of every target of a fleet audit, in inventory order, and their totals."""
+
+    def __init__(self, targets):
+        self.targets = targets
+        self.results = [None] * len(targets)
+        self.elapsed = 0.0
+
+    @property
+    def counts(self):
+        counts = dict.fromkeys(STATUSES, 0)
+        for result in self.results:
+            if result is not None and result.run is not None:
+                for status, count in result.run.counts.items():
+                    counts[status] += count
+        return counts
+
+    @property
+    def unreachable(self):
+        return [result for result in self.results if result is not None and result.error is not None]
+
+    def summary(self):
+        return {
+            "targets": len(self.targets),
+            "audited": sum(1 for result in self.results if result is not None and result.error is None),
+            "unreachable": len(self.unreachable),
+            "counts": self.counts,
+            "by_dialect": dict(Counter(target.dialect for target in self.targets)),
+            "not_run": {dialect: list(NOT_RUN[dialect])
+                        for dialect in sorted({target.dialect for target in self.targets}) if dialect in NOT_RUN},
+            "elapsed": round(self.elapsed, 4),
+        }
+
+    def as_dict(self):
+        return {"summary": self.summary(),
+                "targets": [result.as_dict() for result in self.results if result is not None]}
+
+
+def open_target(target, username, password):
+    """A connection pool of target's own and its audit context, over a connection leased from the pool."""
+    if target.dialect == "oracle":
+        pool = oracle_pool(username, password, target.dsn, shared=False)
+        return pool, AuditContext(pool.lease(), "oracle", db_errors=(cx_Oracle.DatabaseError,))
+    if target.dialect == "mssql":
+        server = f"{target.host},{target.port}"
+        pool = mssql_pool(server, target.database, username, password, shared=False)
+        return pool, AuditContext(
+            pool.lease(), "mssql", db_errors=(pyodbc.Error,),
+            connect=mssql_database_connect(server, username, password),
+            workers=pool_size(),
+        )
+    pool = postgres_pool(target.host, target.port, target.database, username, password, shared=False)
+    return pool, AuditContext(pool.lease(), "postgres", db_errors=(psycopg2.Error,))
+
+
+def audit_target(target, username=None, password=None):
+    """A TargetResult with the run of the registry checks of target, or the error that stopped it."""
+    started = time.perf_counter()
+    pool = ctx = None
+    try:
+        pool, ctx = open_target(target, target.username or username, target.password or password)
+        if target.dialect == "oracle":
+            snapshot(ctx).collect()
+        run = run_plan(plan_run(target.dialect, target.standard), ctx, pool=pool)
+        return TargetResult(target, run, elapsed=time.perf_counter() - started)
+    except Exception as e:
+        return TargetResult(target, error=e, elapsed=time.perf_counter() - started)
+    finally:
+        if ctx is not None:
+            ctx.close()
+            ctx.main_connection.close()
+        if pool is not None:
+            pool.close()
+
+
+def run_fleet(targets, username=None, password=None, workers=FLEET_WORKERS, per_host=PER_HOST,
+              on_result=None, audit=audit_target):
+    """
+    Audit targets, at most ``workers`` at once and ``per_host`` per host.
+
+    A target waits in inventory order until its host has a free slot, so a
+    host with many databases never holds up the other hosts.  ``on_result``
+    is called with each TargetResult as it completes.
+    """
+    fleet = FleetRun(list(targets))
+    started = time.perf_counter()
+    workers, per_host = max(1, workers), max(1, per_host)
+    waiting = dict(enumerate(fleet.targets))
+    busy = Counter()
+    running = {}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        while waiting or running:
+            for index, target in list(waiting.items()):
+                if len(running) >= workers:
+                    break
+                if busy[target.host] >= per_host:
+                    continue
+                del waiting[index]
+                busy[target.host] += 1
+                running[executor.submit(audit, target, username, password)] = index
+            for future in wait(running, return_when=FIRST_COMPLETED).done:
+                index = running.pop(future)
+                busy[fleet.targets[index].host] -= 1
+                fleet.results[index] = future.result()
+                if on_result is not None:
+                    on_result(fleet.results[index])
+    fleet.elapsed = time.perf_counter() - started
+    return fleet
@@ -0,0 +1,284 @@
+"""
+Background audit jobs.
+
+An audit submitted as a job is recorded as an ``AuditJob`` in the project's
+SQLite database and run by a pool of worker threads in this process, so
+the request submitting it returns at once with the job id.  The job runs
+the same view as a synchronous audit, over the form it was submitted with,
+and keeps the id of the report artifact it returns (see ``artifacts``).  The credentials
+stay in memory with the queued job and are never written to the database.
+
+A queued job is cancelled before it starts; a running one stops at its
+next check.  Jobs that were queued or running when the process stopped
+are marked failed when the pool starts again.
+
+While a job runs, every check result is recorded as a progress event for
+the subscribers of its event stream.  Submitting the same audit (same
+target, standard, options and credentials) while a job for it is queued or
+running returns that job instead of starting a second audit; a streamed
+audit is run as a job too, so that it is matched the same way.
+"""
+import asyncio
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .artifacts import ARTIFACT_HEADER
+from .engine import AuditCancelled, cancellable, observing
+from .models import AuditJob
+from .pool import fingerprint
+
+# Audits run at the same time when the AUDITIX_JOB_WORKERS setting is not set
+JOB_WORKERS = 2
+
+_executor = None
+_lock = threading.Lock()
+# Job id -> (future, cancel event) of the jobs queued or running in this process
+_active = {}
+# Job id -> Progress, and audit fingerprint -> job id, of the same jobs
+_progress = {}
+_submitted = {}
+
+# Form fields that make two submissions the same audit
+AUDIT_FIELDS = ("db_type", "audit_standard", "dsn", "server", "database", "scope", "username", "password")
+
+# Seconds an event stream waits for an event before sending a keep-alive comment
+KEEPALIVE = 15
+KEEPALIVE_MESSAGE = ": keep-alive\n\n"
+
+# Seconds between polls of an ASGI event stream for new events
+EVENTS_POLL = 0.25
+
+
+class Progress:
+    """The progress events of one job, kept for the subscribers of its event stream."""
+
+    def __init__(self):
+        self.events = []
+        self.done = 0
+        self.total = 0
+        self.finished = False
+        self.started = time.monotonic()
+        self.condition = threading.Condition()
+
+    def planned(self, plan, expected):
+        with self.condition:
+            self.total += expected
+
+    def result(self, result):
+        with self.condition:
+            self.done += 1
+            self.events.append({
+                "section": result.check.section,
+                "check_id": result.check.check_id,
+                "title": result.check.title,
+                "database": result.database,
+                "status": result.status,
+                "elapsed": round(result.elapsed, 4),
+                "audit_elapsed": round(time.monotonic() - self.started, 2),
+                "done": self.done,
+                "total": max(self.total, self.done),
+            })
+            self.condition.notify_all()
+
+    def finish(self):
+        with self.condition:
+            self.finished = True
+            self.condition.notify_all()
+
+    def wait(self, seen, timeout):
+        """The events after the first ``seen`` ones, waiting up to timeout for one, and whether the job ended."""
+        with self.condition:
+            self.condition.wait_for(lambda: len(self.events) > seen or self.finished, timeout)
+            return self.events[seen:], self.finished
+
+
+class JobRequest:
+    """The form of a submitted audit, in the shape the audit view reads it from."""
+
+    method = "POST"
+
+    def __init__(self, data):
+        self.POST = data
+
+
+def executor():
+    global _executor
+    with _lock:
+        if _executor is None:
+            AuditJob.objects.filter(status__in=(AuditJob.QUEUED, AuditJob.RUNNING)).update(
+                status=AuditJob.FAILED, error="Interrupted by a restart of the server.", finished=timezone.now())
+            _executor = ThreadPoolExecutor(max_workers=getattr(settings, "AUDITIX_JOB_WORKERS", JOB_WORKERS),
+                                           thread_name_prefix="auditix-job")
+        return _executor
+
+
+def describe(data):
+    # What the job audits, without the credentials
+    if data.get("db_type") == "Oracle":
+        return data.get("dsn", "").strip()
+    return f"{data.get('server', '').strip()}/{data.get('database', '').strip()}"
+
+
+def submit(data, audit, event=None, runner=None):
+    """
+    Queue ``audit(request)`` over a copy of the form data and return its
+    AuditJob and whether it is new; the job of the same audit when one is
+    still queued or running.  ``event`` is the job's cancel event, a new
+    one unless given, and ``runner`` the executor running it instead of
+    the job workers.
+    """
+    data = data.copy()
+    key = fingerprint(*(data.get(field, "").strip() for field in AUDIT_FIELDS))
+    # Started first, so that the jobs left over from a previous process are settled before this one is added
+    workers = executor()
+    with _lock:
+        running = _submitted.get(key)
+        if running is not None:
+            return AuditJob.objects.get(pk=running), False
+        job = AuditJob.objects.create(db_type=data.get("db_type", ""), standard=data.get("audit_standard", ""),
+                                      target=describe(data))
+        if event is None:
+            event = threading.Event()
+        _active[job.pk] = (None, event)
+        _progress[job.pk] = Progress()
+        _submitted[key] = job.pk
+    future = (runner or workers).submit(run_job, job.pk, data, audit, event)
+    with _lock:
+        if job.pk in _active:
+            _active[job.pk] = (future, event)
+    return job, True
+
+
+def finish(job_id, status, **fields):
+    AuditJob.objects.filter(pk=job_id).update(status=status, finished=timezone.now(), **fields)
+
+
+def attachment_name(response, default):
+    match = re.search(r'filename="?([^";]+)"?', response.get("Content-Disposition", ""))
+    return match.group(1) if match else default
+
+
+def response_error(response):
+    # The message of the JSON error responses of the audit view
+    content = response.content.decode(errors="replace")
+    try:
+        return json.loads(content)["error"]
+    except (ValueError, KeyError, TypeError):
+        return content
+
+
+def run_job(job_id, data, audit, event):
+    with _lock:
+        progress = _progress.get(job_id) or Progress()
+    try:
+        started = AuditJob.objects.filter(pk=job_id, status=AuditJob.QUEUED).update(
+            status=AuditJob.RUNNING, started=timezone.now())
+        if not started:
+            # Cancelled while queued
+            return
+        try:
+            with cancellable(event), observing(progress):
+                response = audit(JobRequest(data))
+        except AuditCancelled:
+            response = None
+        except Exception as e:
+            finish(job_id, AuditJob.FAILED, error=str(e))
+            return
+        if event.is_set():
+            finish(job_id, AuditJob.CANCELLED)
+        elif response is None:
+            finish(job_id, AuditJob.FAILED, error="The audit returned no report.")
+        elif response.status_code != 200:
+            finish(job_id, AuditJob.FAILED, error=response_error(response))
+        else:
+            # The report stays in its artifact, the response is not read
+            response.close()
+            finish(job_id, AuditJob.DONE, report=response.get(ARTIFACT_HEADER, ""),
+                   file_name=attachment_name(response, f"{job_id}.html"))
+    finally:
+        forget(job_id)
+        close_old_connections()
+
+
+def forget(job_id):
+    # The job no longer runs: new submissions of its audit start a new job, its subscribers get its status
+    with _lock:
+        _active.pop(job_id, None)
+        progress = _progress.pop(job_id, None)
+        for key in [key for key, submitted in _submitted.items() if submitted == job_id]:
+            del _submitted[key]
+    if progress is not None:
+        progress.finish()
+
+
+def cancel(job):
+    """Cancel job if it has not finished; returns the job as it is now."""
+    with _lock:
+        future, event = _active.get(job.pk, (None, None))
+    if event is not None:
+        event.set()
+    if AuditJob.objects.filter(pk=job.pk, status=AuditJob.QUEUED).update(
+            status=AuditJob.CANCELLED, finished=timezone.now()) and future is not None and future.cancel():
+        forget(job.pk)
+    job.refresh_from_db()
+    return job
+
+
+def events(job, seen=0):
+    """
+    The Server-Sent Events of job: a ``progress`` event per check result
+    after the first ``seen`` ones, comments to keep the connection open
+    while none come, and a final ``status`` event once the job has ended.
+    """
+    with _lock:
+        progress = _progress.get(job.pk)
+    while progress is not None:
+        found, finished = progress.wait(seen, KEEPALIVE)
+        for event in found:
+            seen += 1
+            yield progress_message(seen, event)
+        if finished:
+            break
+        if not found:
+            yield KEEPALIVE_MESSAGE
+    job.refresh_from_db()
+    yield status_message(job)
+
+
+async def async_events(job, seen=0):
+    """events() for an ASGI response, polling the job's progress instead of holding a thread."""
+    with _lock:
+        progress = _progress.get(job.pk)
+    waited = 0.0
+    while progress is not None:
+        found, finished = progress.wait(seen, 0)
+        for event in found:
+            seen += 1
+            yield progress_message(seen, event)
+        if finished:
+            break
+        if found:
+            waited = 0.0
+            continue
+        await asyncio.sleep(EVENTS_POLL)
+        waited += EVENTS_POLL
+        if waited >= KEEPALIVE:
+            waited = 0.0
+            yield KEEPALIVE_MESSAGE
+    await job.arefresh_from_db()
+    yield status_message(job)
+
+
+def progress_message(seen, event):
+    return f"id: {seen}\nevent: progress\ndata: {json.dumps(event)}\n\n"
+
+
+def status_message(job):
+    return f"event: status\ndata: {json.dumps(job.as_dict())}\n\n"
@@ -0,0 +1,44 @@
+import json
+import os
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from auditix.fleet import FLEET_WORKERS, PER_HOST, InventoryError, load_inventory, run_fleet
+
+
+class Command(BaseCommand):
+    help = ("Audit every target of a CSV or JSON inventory and write the per-target results "
+            "and a fleet summary as JSON.  Targets without credentials in the inventory use "
+            "AUDITIX_USERNAME and AUDITIX_PASSWORD from the environment.")
+
+    def add_arguments(self, parser):
+        parser.add_argument("inventory", help="CSV or JSON file of db_type, host, port, dsn, database, standard")
+        parser.add_argument("--workers", type=int, default=FLEET_WORKERS, help="targets audited at once")
+        parser.add_argument("--per-host", type=int, default=PER_HOST, help="targets of one host audited at once")
+        parser.add_argument("--output", help="file the JSON results are written to instead of stdout")
+
+    def handle(self, *args, **options):
+        try:
+            targets = load_inventory(options["inventory"])
+        except (OSError, InventoryError, json.JSONDecodeError) as e:
+            raise CommandError(e)
+
+        def progress(result):
+            status = f"error: {result.error}" if result.error is not None else \
+                ", ".join(f"{status} {count}" for status, count in result.run.counts.items())
+            self.stderr.write(f"{result.target.name}: {status} ({result.elapsed:.1f}s)")
+
+        fleet = run_fleet(targets, os.environ.get("AUDITIX_USERNAME"), os.environ.get("AUDITIX_PASSWORD"),
+                          workers=options["workers"], per_host=options["per_host"], on_result=progress)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                json.dump(fleet.as_dict(), f, indent=2)
+        else:
+            json.dump(fleet.as_dict(), sys.stdout, indent=2)
+        summary = fleet.summary()
+        self.stderr.write(f"{summary['audited']} of {summary['targets']} targets audited, "
+                          f"{summary['unreachable']} unreachable: "
+                          + ", ".join(f"{status} {count}" for status, count in summary["counts"].items()))
+        for dialect, items in summary["not_run"].items():
+            self.stderr.write(f"Not run for {dialect} (audit views only): {', '.join(items)}")
@@ -1,3 +1,50 @@
+import uuid
+
 from django.db import models
 
-# Create your models here.
+
+class AuditJob(models.Model):
+    """An audit submitted to run in the background; the credentials are never stored."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (DONE, "Done"),
+        (FAILED, "Failed"),
+        (CANCELLED, "Cancelled"),
+    ]
+    FINISHED = (DONE, FAILED, CANCELLED)
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    db_type = models.CharField(max_length=20)
+    standard = models.CharField(max_length=20, blank=True)
+    target = models.CharField(max_length=255, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=QUEUED)
+    error = models.TextField(blank=True)
+    # Report artifact of a finished job (see artifacts) and the name it is downloaded as
+    report = models.CharField(max_length=255, blank=True)
+    file_name = models.CharField(max_length=100, blank=True)
+    created = models.DateTimeField(auto_now_add=True)
+    started = models.DateTimeField(null=True, blank=True)
+    finished = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created"]
+
+    def as_dict(self):
+        return {
+            "job_id": str(self.id),
+            "db_type": self.db_type,
+            "standard": self.standard,
+            "target": self.target,
+            "status": self.status,
+            "error": self.error or None,
+            "created": self.created.isoformat() if self.created else None,
+            "started": self.started.isoformat() if self.started else None,
+            "finished": self.finished.isoformat() if self.finished else None,
+        }
@@ -0,0 +1,231 @@
+"""
+Bounded pools of connections to the audited targets.
+
+Connections are opened on demand and handed back to the pool when a caller
+is done with them.  The checks of the audits of one target share ``size``
+of them, a check waiting while all of them are in use, and each audit runs
+on one more leased outside those, so the sessions on the audited server
+stay bounded by the pool size plus the audits running at once.
+
+Pools live for the whole process, one per target and login, so repeated
+audits of the same target reuse warm sessions instead of logging in again.
+A connection handed back is reset (its transaction rolled back) and kept
+idle; one idle longer than ``max_idle`` seconds is closed instead of reused,
+and one that no longer answers the health check is replaced by a new one.
+At most ``MAX_POOLS`` pools are kept, the least recently used of those no
+audit is using being closed when another one is needed.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+# Connections per target when the AUDITIX_POOL_SIZE setting is not set
+POOL_SIZE = 4
+
+# Seconds a connection may stay idle in a pool before it is closed
+MAX_IDLE = 300
+
+# Pools kept for the process, one per target and login
+MAX_POOLS = 16
+
+
+class ConnectionPool:
+    """
+    ``size`` connections for the checks of the audits of one target, and
+    the connections the audits themselves run on.
+
+    An audit's own connection is leased outside the ``size`` slots, so the
+    audits holding theirs never leave their checks waiting for a slot that
+    only they could free.  ``in_use`` counts both kinds.
+    """
+
+    def __init__(self, connect, size, max_idle=MAX_IDLE, ping=None, reset=None):
+        self.connect = connect
+        self.size = max(1, int(size))
+        self.max_idle = max_idle
+        self.ping = ping
+        self.reset = reset
+        self.closed = False
+        self.in_use = 0
+        self._slots = threading.BoundedSemaphore(self.size)
+        self._lock = threading.Lock()
+        # (connection, handed back at), most recently used last
+        self._idle = deque()
+
+    def acquire(self):
+        """A connection of one of the pool's slots, waiting while all of them are in use."""
+        self._slots.acquire()
+        try:
+            return self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def release(self, connection, slot=True):
+        try:
+            self._checkin(connection)
+        finally:
+            if slot:
+                self._slots.release()
+
+    def _checkout(self):
+        # Counted in use before it is taken, so that closing the pool meanwhile waits for it
+        with self._lock:
+            self.in_use += 1
+        try:
+            return self.take()
+        except BaseException:
+            self._done()
+            raise
+
+    def _checkin(self, connection):
+        try:
+            self.give(connection)
+        finally:
+            self._done()
+
+    def _done(self):
+        with self._lock:
+            self.in_use -= 1
+            drained = self.closed and not self.in_use
+        if drained:
+            self.shut()
+
+    def take(self):
+        # An idle connection still fresh and healthy, else a new one
+        while True:
+            with self._lock:
+                connection, since = self._idle.pop() if self._idle else (None, None)
+            if connection is None:
+                return self.connect()
+            if self.expired(since) or not self.healthy(connection):
+                self.discard(connection)
+                continue
+            return connection
+
+    def give(self, connection):
+        if self.closed:
+            self.discard(connection)
+            return
+        try:
+            if self.reset is not None:
+                self.reset(connection)
+            with self._lock:
+                self._idle.append((connection, time.monotonic()))
+        except Exception:
+            # A connection that cannot be reset is not handed out again
+            self.discard(connection)
+
+    @contextmanager
+    def connection(self):
+        """A connection of the pool for the duration of the with block."""
+        connection = self.acquire()
+        try:
+            yield connection
+        finally:
+            self.release(connection)
+
+    def lease(self):
+        """
+        A connection for an audit to run on, outside the pool's slots, whose
+        ``close()`` hands it back to the pool.
+        """
+        return PooledConnection(self, self._checkout(), slot=False)
+
+    def expired(self, since):
+        return self.max_idle is not None and time.monotonic() - since > self.max_idle
+
+    def healthy(self, connection):
+        if self.ping is None:
+            return True
+        try:
+            self.ping(connection)
+        except Exception:
+            return False
+        return True
+
+    def discard(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+    def evict(self):
+        # Close the connections idle for longer than max_idle, oldest first
+        while True:
+            with self._lock:
+                if not self._idle or not self.expired(self._idle[0][1]):
+                    return
+                connection, since = self._idle.popleft()
+            self.discard(connection)
+
+    def close(self):
+        """
+        Close the idle connections now and the ones in use as they are
+        handed back.  A caller still holding the pool gets connections that
+        are closed, not kept, when it is done with them.
+        """
+        with self._lock:
+            self.closed = True
+            drained = not self.in_use
+            idle, self._idle = self._idle, deque()
+        for connection, since in idle:
+            self.discard(connection)
+        if drained:
+            self.shut()
+
+    def shut(self):
+        # The pool is closed and none of its connections is in use any more
+        pass
+
+
+class PooledConnection:
+    """A connection leased from a pool, used like the connection itself."""
+
+    def __init__(self, pool, connection, slot=True):
+        self._pool = pool
+        self._connection = connection
+        self._slot = slot
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise AttributeError(f"{name}: the connection was handed back to its pool")
+        return getattr(self._connection, name)
+
+    def close(self):
+        if self._connection is not None:
+            connection, self._connection = self._connection, None
+            self._pool.release(connection, slot=self._slot)
+
+
+def fingerprint(*parts):
+    """A key for a target and its credentials that does not hold the password itself."""
+    return hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+
+_pools = OrderedDict()
+_pools_lock = threading.Lock()
+
+
+def shared_pool(key, factory, limit=MAX_POOLS):
+    """
+    The process-wide pool for key, made by ``factory()`` the first time.
+
+    Every call also evicts the idle connections of all pools that outlived
+    their ``max_idle``, so an unused target does not keep its sessions open.
+    """
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.evict()
+        pool = _pools.get(key)
+        if pool is None:
+            pool = _pools[key] = factory()
+        _pools.move_to_end(key)
+        # The least recently used pools none of whose connections is in use; an
+        # audit's pool stays while it runs, even when that leaves more than limit
+        unused = [other for other, oldest in _pools.items() if other != key and not oldest.in_use]
+        for other in unused[:max(0, len(_pools) - limit)]:
+            _pools.pop(other).close()
+        return pool
@@ -0,0 +1,260 @@
+"""
+HTML fragments for the audit reports.
+
+These reproduce the markup the views have always written by hand so that
+sections produced by the engine sit seamlessly next to the rest of a report.
+
+A report is written to an artifact of its own under MEDIA_ROOT (see
+``artifacts``), or, when the thread writing it is bound to a
+``ReportStream``, handed chunk by chunk to the thread serving the response
+as it is written.
+"""
+import asyncio
+import os
+import queue
+import threading
+from contextlib import contextmanager
+
+from django.http import FileResponse, JsonResponse
+
+from .artifacts import ARTIFACT_HEADER, ArtifactWriter
+from .checks import FAILED, MANUAL, NO_PERMISSION, PASSED
+from .engine import AuditCancelled
+
+# Chunks a report stream holds for a slow reader before the writer waits
+STREAM_CHUNKS = 64
+
+# Seconds between polls of an ASGI reader waiting for the next chunk, doubling up to the maximum
+STREAM_POLL = 0.05
+STREAM_POLL_MAX = 0.5
+
+STATUS_CLASSES = {
+    PASSED: "status-passed",
+    FAILED: "status-failed",
+    MANUAL: "status-manual",
+    NO_PERMISSION: "status-nopermission",
+}
+
+TABLE_OPEN = '''<table>
+                   <tr>
+                       <th>Check</th>
+                       <th>Status</th>
+                   </tr>'''
+
+TABLE_CLOSE = "</table>"
+
+
+def heading(text, size=20):
+    return f'''<p style="color: #00008B; font-size: {size}px; text-align: left; margin-top: {size}px;">
+                   <strong>{text}</strong>
+               </p>'''
+
+
+def section_open(section):
+    # The first heading is the top-level one, any further ones are sub-headings
+    parts = [heading(text, 20 if i == 0 else 19) for i, text in enumerate(section.headings)]
+    parts.append(TABLE_OPEN)
+    return "".join(parts)
+
+
+def result_row(result):
+    return f'''<tr>
+                   <td>{result.label}</td>
+                   <td class="{STATUS_CLASSES[result.status]}">{result.status}</td>
+               </tr>'''
+
+
+class RunWriter:
+    """
+    Writes the sections of a run to f as its results arrive, as the
+    ``on_result`` of ``run_plan``.  Results arrive in report order, so a
+    section is opened at its first result and closed when the next section
+    starts; ``close()`` closes the last one.
+    """
+
+    def __init__(self, f, plan):
+        self.f = f
+        self.sections = {check.check_id: section for section, checks in plan.sections for check in checks}
+        self.current = None
+
+    def __call__(self, result):
+        section = self.sections[result.check.check_id]
+        if section is not self.current:
+            self.close()
+            self.f.write(section_open(section))
+            self.current = section
+        self.f.write(result_row(result))
+
+    def close(self):
+        if self.current is not None:
+            self.f.write(TABLE_CLOSE)
+            self.current = None
+
+
+def write_run(f, run):
+    writer = RunWriter(f, run.plan)
+    for result in run.results:
+        writer(result)
+    writer.close()
+
+
+_END = object()
+
+
+class ReportStream:
+    """
+    A report written by one thread and read as chunks by another.
+
+    At most STREAM_CHUNKS chunks wait for the reader, so memory stays flat
+    whatever the size of the report.  When the reader stops (the client
+    went away) the next write raises AuditCancelled into the writer; when
+    the writer is cancelled the reader stops once it has read what was
+    written.  The report is also kept as an artifact, for ``response()``.
+    """
+
+    def __init__(self, maxsize=STREAM_CHUNKS):
+        self.chunks = queue.Queue(maxsize)
+        self.opened = threading.Event()
+        self.cancelled = threading.Event()
+        self.file_name = None
+        self.copy = None
+        self.error = None
+
+    def open(self, file_path):
+        self.file_name = os.path.basename(file_path)
+        self.copy = ArtifactWriter(file_path)
+        self.opened.set()
+        return self
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.copy.close()
+        return False
+
+    def response(self):
+        """The streamed report as a download from its artifact, None when none was written."""
+        if self.copy is None:
+            return None
+        return artifact_response(self.copy, self.file_name)
+
+    def put(self, chunk):
+        while not self.cancelled.is_set():
+            try:
+                self.chunks.put(chunk, timeout=0.5)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def write(self, text):
+        if not self.put(text):
+            raise AuditCancelled()
+        self.copy.write(text)
+
+    def finish(self, error=None):
+        """End the stream, with the error that stopped the writer if any."""
+        self.error = error
+        self.opened.set()
+        self.put(_END)
+
+    def __iter__(self):
+        try:
+            while True:
+                try:
+                    chunk = self.chunks.get(timeout=STREAM_POLL_MAX)
+                except queue.Empty:
+                    if self.cancelled.is_set():
+                        return
+                    continue
+                if chunk is _END:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                yield chunk
+        finally:
+            self.cancelled.set()
+
+    async def async_chunks(self):
+        """The chunks for an ASGI response, polled so that no thread waits on a slow audit."""
+        delay = STREAM_POLL
+        try:
+            while True:
+                try:
+                    chunk = self.chunks.get_nowait()
+                except queue.Empty:
+                    if self.cancelled.is_set():
+                        return
+                    await asyncio.sleep(delay)
+                    delay = min(delay * 2, STREAM_POLL_MAX)
+                    continue
+                delay = STREAM_POLL
+                if chunk is _END:
+                    if self.error is not None:
+                        raise self.error
+                    return
+                yield chunk
+        finally:
+            self.cancelled.set()
+
+
+_stream = threading.local()
+
+
+class _Written(threading.local):
+    def __init__(self):
+        # file_path -> ArtifactWriter of the reports written by this thread and not served yet
+        self.artifacts = {}
+
+
+_written = _Written()
+
+
+@contextmanager
+def streaming(stream):
+    """Send the report this thread writes within the with block to stream instead of its file."""
+    _stream.stream = stream
+    try:
+        yield stream
+    finally:
+        _stream.stream = None
+
+
+def reset_written():
+    """Forget the reports this thread wrote and did not serve; their artifacts are kept."""
+    _written.artifacts.clear()
+
+
+def report_file(file_path):
+    """
+    The file a report is written to: a new artifact downloaded as the base
+    name of file_path, or the stream this thread is bound to.
+    """
+    stream = getattr(_stream, "stream", None)
+    if stream is not None:
+        return stream.open(file_path)
+    _written.artifacts[file_path] = ArtifactWriter(file_path)
+    return _written.artifacts[file_path]
+
+
+def report_response(file_path, file_name):
+    """
+    The report this thread last wrote to file_path as a download, served
+    from its artifact; None when it was streamed, the stream being the
+    response.
+    """
+    if getattr(_stream, "stream", None) is not None:
+        return None
+    writer = _written.artifacts.pop(file_path, None)
+    if writer is None:
+        return JsonResponse({"error": "The report was not written."}, status=500)
+    return artifact_response(writer, file_name)
+
+
+def artifact_response(writer, file_name):
+    writer.close()
+    response = FileResponse(open(writer.path, "rb"), as_attachment=True, filename=file_name,
+                            content_type="text/html")
+    response[ARTIFACT_HEADER] = writer.artifact_id
+    return response
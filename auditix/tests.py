@@ -1,3 +1,1539 @@
-from django.test import TestCase
+import asyncio
+import json
+import os
+import re
+import subprocess
+import tempfile
+import threading
+import time
+import uuid
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future
+from unittest import mock
 
-# Create your tests here.
+from django.conf import settings
+from django.test import RequestFactory, SimpleTestCase, TransactionTestCase, override_settings
+
+from . import artifacts, connections, jobs, report, views
+from .batching import JsonBatcher, fetch_batch
+from .checks import FAILED, MANUAL, NO_PERMISSION, PASSED, Check, Section, load
+from .checks.oracle import one_of, parameter_rule
+from .collectors import netconfig
+from .collectors import mssql as mssql_collectors
+from .collectors import postgres as postgres_collectors
+from .collectors.oracle import (VIEWS, ContainerMode, OracleSnapshot, parameters, privileges, profile_limits,
+                                snapshot)
+from .collectors.postgres import roles, row_security, via
+from .engine import (AuditCancelled, AuditContext, AuditPlan, CheckResult, announce, check_cancelled, execute_check,
+                     observing, run_plan)
+from .fleet import InventoryError, Target, TargetResult, load_inventory, run_fleet
+from .models import AuditJob
+from .pool import ConnectionPool, shared_pool
+
+
+class FakeCursor:
+    def close(self):
+        pass
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    def cursor(self):
+        return FakeCursor()
+
+    def close(self):
+        self.closed = True
+
+
+def collector_check(check_id, status, delay=0.0, section="1"):
+    def collect(ctx):
+        ctx.cursor()
+        time.sleep(delay)
+        return status
+    return Check("test", check_id, f"Check {check_id}", section, lambda data: data, collector=collect)
+
+
+class RunPlanTests(SimpleTestCase):
+    def plan(self, checks):
+        return AuditPlan("test", "CIS", [(Section("test", "1", ("Section 1",)), checks)])
+
+    def test_concurrent_results_keep_report_order_and_totals(self):
+        # The first checks take longest, so they finish last
+        statuses = [PASSED, FAILED, MANUAL, PASSED, FAILED, PASSED]
+        checks = [collector_check(f"1.{i}", status, delay=0.02 * (len(statuses) - i))
+                  for i, status in enumerate(statuses)]
+        seen = []
+        pool = ConnectionPool(FakeConnection, 3)
+        run = run_plan(self.plan(checks), AuditContext(FakeConnection(), "test"), on_result=seen.append, pool=pool)
+        self.assertEqual([result.check.check_id for result in run.results], [check.check_id for check in checks])
+        self.assertEqual(seen, run.results)
+        self.assertEqual([result.status for result in run.results], statuses)
+        self.assertEqual(run.counts, {PASSED: 3, FAILED: 2, MANUAL: 1, "NoPermission": 0})
+
+    def test_checks_of_built_collectors_stay_on_the_calling_thread(self):
+        ctx = AuditContext(FakeConnection(), "test")
+        ctx.cached("snapshot", lambda ctx: {"users": PASSED})
+        threads = []
+
+        def from_snapshot(ctx):
+            threads.append(threading.current_thread())
+            return ctx.cached("snapshot", None)["users"]
+
+        checks = [Check("test", f"1.{i}", "From the snapshot", "1", lambda data: data, collector=from_snapshot)
+                  for i in range(4)]
+        pool = ConnectionPool(FakeConnection, 3)
+        run = run_plan(self.plan(checks), ctx, pool=pool)
+        self.assertEqual(run.counts[PASSED], 4)
+        self.assertEqual(set(threads), {threading.current_thread()})
+        self.assertEqual(len(pool._idle), 0)
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_idle_connections_past_max_idle_are_closed(self):
+        pool = ConnectionPool(FakeConnection, 2, max_idle=0.01)
+        with pool.connection() as first:
+            pass
+        time.sleep(0.02)
+        pool.evict()
+        self.assertTrue(first.closed)
+        with pool.connection() as second:
+            self.assertIsNot(second, first)
+
+    def test_fresh_idle_connection_is_reused(self):
+        pool = ConnectionPool(FakeConnection, 2)
+        with pool.connection() as first:
+            pass
+        with pool.connection() as second:
+            self.assertIs(second, first)
+
+    def test_connection_failing_health_check_is_replaced(self):
+        def ping(connection):
+            if not connection.healthy:
+                raise ConnectionError("gone")
+
+        pool = ConnectionPool(FakeConnection, 2, ping=ping)
+        with pool.connection() as first:
+            first.healthy = False
+        with pool.connection() as second:
+            self.assertIsNot(second, first)
+        self.assertTrue(first.closed)
+
+    def test_connection_released_after_close_is_closed(self):
+        pool = ConnectionPool(FakeConnection, 2)
+        leased = pool.lease()
+        connection = leased._connection
+        with pool.connection() as idle:
+            pass
+        pool.close()
+        self.assertTrue(idle.closed)
+        self.assertFalse(connection.closed)
+        leased.close()
+        self.assertTrue(connection.closed)
+        self.assertEqual(pool.in_use, 0)
+
+    def test_leases_leave_the_slots_to_the_checks(self):
+        pool = ConnectionPool(FakeConnection, 4)
+        leases = [pool.lease() for i in range(4)]
+        done = threading.Event()
+
+        def check():
+            with pool.connection():
+                done.set()
+
+        threading.Thread(target=check, daemon=True).start()
+        self.assertTrue(done.wait(1))
+        for lease in leases:
+            lease.close()
+
+    def test_pools_in_use_are_not_evicted(self):
+        busy = shared_pool("test-busy", lambda: ConnectionPool(FakeConnection, 1), limit=1)
+        leased = busy.lease()
+        other = shared_pool("test-other", lambda: ConnectionPool(FakeConnection, 1), limit=1)
+        self.assertFalse(busy.closed)
+        leased.close()
+        shared_pool("test-third", lambda: ConnectionPool(FakeConnection, 1), limit=1)
+        self.assertTrue(busy.closed)
+        self.assertTrue(other.closed)
+
+
+class FleetTests(SimpleTestCase):
+    def inventory(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_csv_inventory(self):
+        path = self.inventory(".csv", "db_type,host,port,dsn,database,standard\n"
+                                      "Postgresql,db1,,,sales,\n"
+                                      "MS SQL,db2,1444,,hr,CIS\n"
+                                      "Oracle,,,db3:1521/orcl,,\n")
+        targets = load_inventory(path)
+        self.assertEqual([target.dialect for target in targets], ["postgres", "mssql", "oracle"])
+        self.assertEqual([target.name for target in targets], ["db1:5432/sales", "db2:1444/hr", "db3:1521/orcl"])
+        self.assertEqual(targets[2].host, "db3")
+        self.assertEqual(targets[0].standard, "CIS")
+
+    def test_json_inventory(self):
+        path = self.inventory(".json", json.dumps({"targets": [
+            {"db_type": "Postgres", "host": "db1", "database": "sales", "username": "auditor"}]}))
+        [target] = load_inventory(path)
+        self.assertEqual((target.dialect, target.port, target.username), ("postgres", 5432, "auditor"))
+
+    def test_bad_row_names_the_file_and_target(self):
+        path = self.inventory(".csv", "db_type,host,database\nPostgresql,db1,sales\nSybase,db2,hr\n")
+        with self.assertRaisesRegex(InventoryError, r"target 2: unknown db_type 'Sybase'"):
+            load_inventory(path)
+
+    def test_row_without_host_or_dsn(self):
+        path = self.inventory(".csv", "db_type,host,database\nOracle,,orcl\n")
+        with self.assertRaisesRegex(InventoryError, r"target 1: Oracle target without host or dsn"):
+            load_inventory(path)
+
+    def test_standard_without_checks_is_rejected(self):
+        path = self.inventory(".csv", "db_type,host,dsn,database,standard\n"
+                                      "Postgresql,db1,,sales,CIS\n"
+                                      "Oracle,,db3:1521/orcl,,DISA_STIG\n")
+        with self.assertRaisesRegex(InventoryError, r"target 2: no DISA_STIG checks for Oracle targets"):
+            load_inventory(path)
+        with self.assertRaises(InventoryError):
+            Target("Postgresql", host="db1", database="sales", standard="DISA_STIG")
+
+    def test_bad_port(self):
+        path = self.inventory(".csv", "db_type,host,port,database\nPostgresql,db1,five,sales\n")
+        with self.assertRaisesRegex(InventoryError, r"target 1: "):
+            load_inventory(path)
+
+    def test_at_most_per_host_audits_run_at_once_on_a_host(self):
+        targets = [Target("Postgresql", host=f"db{i % 2}", database=f"d{i}") for i in range(10)]
+        lock = threading.Lock()
+        running = {"db0": 0, "db1": 0}
+        most = {"db0": 0, "db1": 0}
+
+        def audit(target, username, password):
+            with lock:
+                running[target.host] += 1
+                most[target.host] = max(most[target.host], running[target.host])
+            time.sleep(0.02)
+            with lock:
+                running[target.host] -= 1
+            return TargetResult(target)
+
+        fleet = run_fleet(targets, workers=8, per_host=2, audit=audit)
+        self.assertEqual(most, {"db0": 2, "db1": 2})
+        self.assertEqual([result.target for result in fleet.results], targets)
+        self.assertEqual(fleet.summary()["audited"], 10)
+
+    def test_workers_bound_the_whole_fleet(self):
+        targets = [Target("Postgresql", host=f"db{i}", database="d") for i in range(6)]
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def audit(target, username, password):
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            time.sleep(0.02)
+            with lock:
+                running[0] -= 1
+            return TargetResult(target)
+
+        run_fleet(targets, workers=3, per_host=2, audit=audit)
+        self.assertEqual(running[1], 3)
+
+
+class DriverError(Exception):
+    pass
+
+
+class ScriptedCursor:
+    """A cursor answering each statement with its rows, or raising for the ones in ``failing``."""
+
+    def __init__(self, rows, failing=(), description=None):
+        self.rows = rows
+        self.failing = failing
+        self.executed = []
+        self.description = description
+        self.connection = self
+        self.dsn = "host=db1 dbname=sales"
+        self.rolled_back = 0
+
+    def execute(self, statement, params=None):
+        self.executed.append(statement)
+        if "SET NOCOUNT ON" in statement or any(bad in statement for bad in self.failing):
+            raise DriverError(statement)
+        self.result = self.rows[statement]
+
+    def fetchall(self):
+        return self.result
+
+    def rollback(self):
+        self.rolled_back += 1
+
+    def close(self):
+        pass
+
+
+class BatchingTests(SimpleTestCase):
+    def test_failed_batch_runs_statements_one_at_a_time(self):
+        cursor = ScriptedCursor({"SELECT 1": [(1,)], "SELECT 3": [(3,)]}, failing=("SELECT 2",))
+        results = fetch_batch("mssql", cursor, [("SELECT 1", None), ("SELECT 2", None), ("SELECT 3", None)],
+                              (DriverError,))
+        self.assertEqual(len(cursor.executed), 4)
+        self.assertEqual(results[0].fetch(), [(1,)])
+        with self.assertRaises(DriverError):
+            results[1].fetch()
+        self.assertEqual(results[2].fetch(), [(3,)])
+
+    def test_dialect_without_batcher_runs_one_at_a_time(self):
+        cursor = ScriptedCursor({"SELECT 1": [(1,)], "SELECT 2": [(2,)]})
+        results = fetch_batch("sqlite", cursor, [("SELECT 1", None), ("SELECT 2", None)], (DriverError,))
+        self.assertEqual(cursor.executed, ["SELECT 1", "SELECT 2"])
+        self.assertEqual([result.fetch() for result in results], [[(1,)], [(2,)]])
+
+    def test_postgres_statements_are_batched_once_their_columns_are_known(self):
+        batcher = JsonBatcher()
+        cursor = ScriptedCursor({}, description=[("name", 25), ("setting", 25)])
+        batcher.described(cursor, "SELECT name, setting FROM pg_settings")
+        self.assertTrue(batcher.batchable(cursor, "SELECT name, setting FROM pg_settings;"))
+        self.assertFalse(batcher.batchable(cursor, "SELECT rolname FROM pg_roles"))
+
+    def test_postgres_statements_with_repeated_or_unnamed_columns_are_not_batched(self):
+        batcher = JsonBatcher()
+        cursor = ScriptedCursor({}, description=[("?column?", 23), ("?column?", 23)])
+        batcher.described(cursor, "SELECT 1, 2")
+        cursor.description = [("oid", 26), ("oid", 26)]
+        batcher.described(cursor, "SELECT a.oid, b.oid FROM a, b")
+        self.assertEqual(batcher.columns, {})
+
+
+def temporary_media(test, **overrides):
+    """Point MEDIA_ROOT at a directory of its own, and apply any further overrides, for the duration of test."""
+    media = tempfile.TemporaryDirectory()
+    test.addCleanup(media.cleanup)
+    overridden = override_settings(MEDIA_ROOT=media.name, **overrides)
+    overridden.enable()
+    test.addCleanup(overridden.disable)
+
+
+class ArtifactTests(SimpleTestCase):
+    def setUp(self):
+        temporary_media(self, AUDITIX_REPORT_MAX_AGE=3600, AUDITIX_REPORT_MAX_BYTES=10000)
+
+    def artifact(self, content, name="Postgres_SQL_results.htm"):
+        with artifacts.ArtifactWriter(name) as writer:
+            writer.write(content)
+        return writer.artifact_id
+
+    def used(self, artifact_id, when):
+        directory = os.path.join(artifacts.root(), artifact_id)
+        os.utime(directory, (when, when))
+
+    def test_same_report_under_two_names_is_two_artifacts(self):
+        first = self.artifact("<html></html>", "Oracle_Results.html")
+        second = self.artifact("<html></html>", "Oracle_Audit_Report.htm")
+        self.assertNotEqual(first, second)
+        self.assertEqual(os.path.basename(artifacts.find(first)), "Oracle_Results.html")
+        self.assertEqual(os.path.basename(artifacts.find(second)), "Oracle_Audit_Report.htm")
+
+    def test_prune_removes_artifacts_past_max_age(self):
+        now = time.time()
+        old, fresh = self.artifact("old"), self.artifact("fresh")
+        self.used(old, now - 7200)
+        self.used(fresh, now - 600)
+        self.assertEqual(artifacts.prune(now=now), [old])
+        self.assertIsNone(artifacts.find(old))
+        self.assertIsNotNone(artifacts.find(fresh))
+
+    def test_prune_removes_least_recently_used_above_max_bytes(self):
+        now = time.time()
+        ids = [self.artifact(str(i) * 4000) for i in range(4)]
+        for i, artifact_id in enumerate(ids):
+            self.used(artifact_id, now - 1000 + i * 100)
+        self.assertEqual(artifacts.prune(now=now), ids[:2])
+        self.assertEqual([artifacts.find(artifact_id) is not None for artifact_id in ids], [False, False, True, True])
+
+    def test_prune_spares_recently_used_and_kept_artifacts(self):
+        now = time.time()
+        kept, recent = self.artifact("k" * 6000), self.artifact("r" * 6000)
+        self.used(kept, now - 7200)
+        self.used(recent, now - 1)
+        self.assertEqual(artifacts.prune(keep=kept, now=now), [])
+        self.assertIsNotNone(artifacts.find(kept))
+        self.assertIsNotNone(artifacts.find(recent))
+
+    def test_unknown_or_malformed_ids_are_not_found(self):
+        self.assertIsNone(artifacts.open_artifact("0" * 64))
+        self.assertIsNone(artifacts.open_artifact("../settings"))
+
+
+class OracleReportTests(SimpleTestCase):
+    def setUp(self):
+        temporary_media(self)
+
+    def test_disa_stig_run_leaves_one_artifact(self):
+        cursor = ScriptedCursor({"SELECT banner AS version FROM v$version": [("Oracle Database 19c",)]})
+        connection = mock.Mock(cursor=mock.Mock(return_value=cursor))
+        pool = mock.Mock(lease=mock.Mock(return_value=connection))
+        request = RequestFactory().post("/audit/", {"db_type": "Oracle", "audit_standard": "DISA_STIG",
+                                                    "username": "auditor", "password": "secret",
+                                                    "dsn": "db1:1521/orcl"})
+        with mock.patch.object(views, "oracle_pool", return_value=pool):
+            response = views.audit_database(request)
+        self.addCleanup(response.close)
+        self.assertIn('filename="Oracle_Audit_Report.htm"', response["Content-Disposition"])
+        self.assertEqual(os.listdir(artifacts.root()), [response[artifacts.ARTIFACT_HEADER]])
+        report = b"".join(response.streaming_content).decode()
+        self.assertEqual(report.count("<html"), 1)
+        self.assertIn("Oracle Database 19c", report)
+
+
+POSTGRES_FORM = {"db_type": "Postgresql", "audit_standard": "CIS", "username": "auditor", "password": "secret",
+                 "server": "db1,5432", "database": "sales"}
+
+
+def patch(test, target, name, value):
+    patcher = mock.patch.object(target, name, value)
+    patcher.start()
+    test.addCleanup(patcher.stop)
+
+
+def fake_postgres(test):
+    """Send the Postgres audits of test to a server whose every statement answers no rows."""
+    cursor = ScriptedCursor(defaultdict(list))
+    connection = mock.Mock(cursor=mock.Mock(return_value=cursor))
+    pool = mock.Mock(lease=mock.Mock(return_value=connection))
+    # The OS-level probes find nothing
+    probed = Future()
+    probed.set_result(subprocess.CompletedProcess("", 0, "", ""))
+    patch(test, views, "postgres_pool", mock.Mock(return_value=pool))
+    patch(test, views, "probe", mock.Mock(return_value=probed))
+
+
+class PostgresReportTests(SimpleTestCase):
+    def setUp(self):
+        temporary_media(self)
+        fake_postgres(self)
+
+    def post(self, **fields):
+        return RequestFactory().post("/audit/", dict(POSTGRES_FORM, **fields))
+
+    def test_failure_to_list_the_cluster_databases_returns_the_report(self):
+        denied = views.psycopg2.Error("permission denied for table pg_database")
+        with mock.patch.object(views, "databases", side_effect=denied):
+            response = views.audit_database(self.post(scope="cluster"))
+        self.addCleanup(response.close)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('filename="Postgres_SQL_results.htm"', response["Content-Disposition"])
+        self.assertIn("Audit Date:", b"".join(response.streaming_content).decode())
+
+    def test_cancelled_audit_is_not_returned_as_a_report(self):
+        with mock.patch.object(views, "run_plan", side_effect=AuditCancelled):
+            with self.assertRaises(AuditCancelled):
+                views.audit_database(self.post())
+
+
+class JobTests(TransactionTestCase):
+    """The job endpoints, over an audit that runs until it is released and is cancelled at its next check."""
+
+    def setUp(self):
+        temporary_media(self, AUDITIX_JOB_WORKERS=1)
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.audit_database = views.audit_database
+        patch(self, views, "audit_database", self.audit)
+        # Job workers of their own, started afresh by the first submission
+        patch(self, jobs, "_executor", None)
+        self.addCleanup(self.stop_workers)
+
+    def stop_workers(self):
+        self.release.set()
+        if jobs._executor is not None:
+            jobs._executor.shutdown(wait=True)
+
+    def audit(self, request):
+        self.started.set()
+        while not self.release.wait(0.01):
+            check_cancelled()
+        file_path = os.path.join(settings.MEDIA_ROOT, "Stub_Results.htm")
+        with report.report_file(file_path) as f:
+            f.write(f"<html>{request.POST['database']}</html>")
+        return report.report_response(file_path, "Stub_Results.htm")
+
+    def submit(self, **fields):
+        return self.client.post("/audit/jobs/", dict(POSTGRES_FORM, **fields))
+
+    def wait_finished(self, job_id):
+        deadline = time.monotonic() + 5
+        while time.monotonic() < deadline:
+            job = AuditJob.objects.get(pk=job_id)
+            if job.status in AuditJob.FINISHED:
+                return job
+            time.sleep(0.01)
+        self.fail(f"job {job_id} did not finish")
+
+    def test_submitted_job_reports_its_status_then_its_result(self):
+        response = self.submit()
+        self.assertEqual(response.status_code, 202)
+        job_id = response.json()["job_id"]
+        self.assertFalse(response.json()["attached"])
+        self.assertTrue(self.started.wait(5))
+        self.assertEqual(self.client.get(f"/audit/jobs/{job_id}/").json()["status"], AuditJob.RUNNING)
+        pending = self.client.get(f"/audit/jobs/{job_id}/result/")
+        self.assertEqual(pending.status_code, 409)
+        self.assertEqual(pending.json()["error"], "The report is not ready.")
+        self.release.set()
+        self.assertEqual(self.wait_finished(job_id).status, AuditJob.DONE)
+        result = self.client.get(f"/audit/jobs/{job_id}/result/")
+        self.assertEqual(result.status_code, 200)
+        self.assertIn('filename="Stub_Results.htm"', result["Content-Disposition"])
+        self.assertEqual(b"".join(result.streaming_content), b"<html>sales</html>")
+
+    def test_same_audit_submitted_again_attaches_to_its_job(self):
+        job_id = self.submit().json()["job_id"]
+        again = self.submit()
+        self.assertEqual(again.status_code, 200)
+        self.assertEqual((again.json()["job_id"], again.json()["attached"]), (job_id, True))
+        # Other credentials make another audit
+        other = self.submit(password="other")
+        self.assertEqual(other.status_code, 202)
+        self.assertNotEqual(other.json()["job_id"], job_id)
+        self.release.set()
+        self.wait_finished(job_id)
+        # Once the job has ended the same audit starts a new one
+        self.assertEqual(self.submit().status_code, 202)
+
+    def test_invalid_form_is_not_queued(self):
+        response = self.submit(server="db1;drop")
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(AuditJob.objects.exists())
+
+    def test_cancel_a_queued_job(self):
+        running = self.submit().json()["job_id"]
+        self.assertTrue(self.started.wait(5))
+        # The one worker is busy, so this audit of another database waits
+        queued = self.submit(database="hr").json()["job_id"]
+        response = self.client.post(f"/audit/jobs/{queued}/cancel/")
+        self.assertEqual(response.json()["status"], AuditJob.CANCELLED)
+        self.release.set()
+        self.assertEqual(self.wait_finished(running).status, AuditJob.DONE)
+        self.assertEqual(self.wait_finished(queued).status, AuditJob.CANCELLED)
+        self.assertIsNone(AuditJob.objects.get(pk=queued).started)
+
+    def test_cancel_a_running_job(self):
+        job_id = self.submit().json()["job_id"]
+        self.assertTrue(self.started.wait(5))
+        self.client.post(f"/audit/jobs/{job_id}/cancel/")
+        job = self.wait_finished(job_id)
+        self.assertEqual(job.status, AuditJob.CANCELLED)
+        self.assertEqual(job.report, "")
+        self.assertEqual(self.client.get(f"/audit/jobs/{job_id}/result/").status_code, 409)
+
+    def test_cancel_a_running_postgres_audit(self):
+        fake_postgres(self)
+        patch(self, views, "audit_database", self.audit_database)
+        checking = threading.Event()
+
+        def run_plan(plan, ctx, **options):
+            # The first check of the run waits for the cancellation
+            checking.set()
+            while True:
+                check_cancelled()
+                time.sleep(0.01)
+
+        patch(self, views, "run_plan", run_plan)
+        job_id = self.submit().json()["job_id"]
+        self.assertTrue(checking.wait(5))
+        self.client.post(f"/audit/jobs/{job_id}/cancel/")
+        job = self.wait_finished(job_id)
+        self.assertEqual((job.status, job.report), (AuditJob.CANCELLED, ""))
+
+    def test_jobs_left_queued_or_running_are_failed_when_the_workers_start(self):
+        stale = [AuditJob.objects.create(db_type="Postgresql", status=status)
+                 for status in (AuditJob.QUEUED, AuditJob.RUNNING, AuditJob.DONE)]
+        jobs.executor()
+        statuses = [AuditJob.objects.get(pk=job.pk) for job in stale]
+        self.assertEqual([job.status for job in statuses], [AuditJob.FAILED, AuditJob.FAILED, AuditJob.DONE])
+        self.assertEqual(statuses[0].error, "Interrupted by a restart of the server.")
+
+    def test_unknown_job(self):
+        self.assertEqual(self.client.get(f"/audit/jobs/{uuid.uuid4()}/").status_code, 404)
+        self.assertEqual(self.client.post(f"/audit/jobs/{uuid.uuid4()}/cancel/").status_code, 404)
+
+
+class JobEventTests(TransactionTestCase):
+    """The Server-Sent Events of a job, fed by a Progress driven directly."""
+
+    def setUp(self):
+        self.job = AuditJob.objects.create(db_type="Postgresql", standard="CIS", status=AuditJob.RUNNING)
+        self.progress = jobs.Progress()
+        patch(self, jobs, "_progress", {self.job.pk: self.progress})
+        self.checks = [Check("test", f"1.{i}", f"Check 1.{i}", "1", lambda data: data) for i in range(3)]
+        self.plan = AuditPlan("test", "CIS", [(Section("test", "1", ("Section 1",)), self.checks)])
+
+    def finish(self, status=AuditJob.DONE):
+        AuditJob.objects.filter(pk=self.job.pk).update(status=status)
+        self.progress.finish()
+
+    def parse(self, message):
+        fields = dict(line.split(": ", 1) for line in message.rstrip("\n").split("\n"))
+        return fields.get("id"), fields["event"], json.loads(fields["data"])
+
+    def test_progress_events_then_the_final_status(self):
+        self.progress.planned(self.plan, 3)
+        self.progress.result(CheckResult(self.checks[0], PASSED, elapsed=0.5))
+        self.progress.result(CheckResult(self.checks[1], FAILED, database="sales"))
+        self.finish()
+        messages = list(jobs.events(self.job))
+        self.assertTrue(all(message.endswith("\n\n") for message in messages))
+        [first, second, status] = [self.parse(message) for message in messages]
+        self.assertEqual(first[:2], ("1", "progress"))
+        self.assertEqual({key: first[2][key] for key in ("check_id", "status", "elapsed", "done", "total")},
+                         {"check_id": "1.0", "status": PASSED, "elapsed": 0.5, "done": 1, "total": 3})
+        self.assertEqual((second[0], second[2]["database"], second[2]["done"]), ("2", "sales", 2))
+        self.assertEqual(status[:2], (None, "status"))
+        self.assertEqual((status[2]["job_id"], status[2]["status"]), (str(self.job.pk), AuditJob.DONE))
+
+    def test_events_resume_after_the_last_one_seen(self):
+        for check in self.checks:
+            self.progress.result(CheckResult(check, PASSED))
+        self.finish()
+        ids = [self.parse(message)[0] for message in jobs.events(self.job, seen=2)]
+        self.assertEqual(ids, ["3", None])
+
+    def test_event_stream_resumes_from_last_event_id(self):
+        for check in self.checks:
+            self.progress.result(CheckResult(check, PASSED))
+        self.finish(AuditJob.CANCELLED)
+        response = self.client.get(f"/audit/jobs/{self.job.pk}/events/", HTTP_LAST_EVENT_ID="1")
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        body = b"".join(response.streaming_content).decode()
+        self.assertTrue(body.startswith("id: 2\nevent: progress\n"))
+        self.assertTrue(body.endswith(f"event: status\ndata: {json.dumps(AuditJob.objects.get().as_dict())}\n\n"))
+
+    def test_keep_alive_while_no_event_comes(self):
+        patch(self, jobs, "KEEPALIVE", 0.01)
+        events = jobs.events(self.job)
+        self.assertEqual(next(events), jobs.KEEPALIVE_MESSAGE)
+        self.finish()
+        self.assertEqual(self.parse(next(events))[1], "status")
+
+    def test_finished_job_sends_only_its_status(self):
+        self.finish()
+        patch(self, jobs, "_progress", {})
+        [message] = jobs.events(self.job)
+        self.assertEqual(self.parse(message)[1:], ("status", self.job.as_dict() | {"status": AuditJob.DONE}))
+
+    def test_announced_plans_count_in_the_total_from_the_first_result(self):
+        other = AuditPlan("test", "CIS", [(Section("test", "2", ("Section 2",)), [collector_check("2.1", PASSED)])])
+        ctx = AuditContext(FakeConnection(), "test")
+        with observing(self.progress):
+            announce((self.plan, other))
+            run_plan(self.plan, ctx)
+            run_plan(other, ctx)
+        self.assertEqual([event["total"] for event in self.progress.events], [4, 4, 4, 4])
+
+
+class AsyncAuditTests(TransactionTestCase):
+    """The ASGI paths: audits in the bounded pool of threads, reports and events read without holding one."""
+
+    def setUp(self):
+        temporary_media(self)
+        self.threads = []
+        patch(self, views, "audit_database", self.audit)
+        patch(self, jobs, "_executor", None)
+        self.addCleanup(self.stop_workers)
+
+    def stop_workers(self):
+        if jobs._executor is not None:
+            jobs._executor.shutdown(wait=True)
+
+    def audit(self, request):
+        self.threads.append(threading.current_thread().name)
+        file_path = os.path.join(settings.MEDIA_ROOT, "Stub_Results.htm")
+        with report.report_file(file_path) as f:
+            for section in ("<html>", "<h2>1</h2>", "<h2>2</h2>", "</html>"):
+                f.write(section)
+        return report.report_response(file_path, "Stub_Results.htm")
+
+    async def read(self, response):
+        return b"".join([chunk async for chunk in response.streaming_content]).decode()
+
+    async def finished(self):
+        for i in range(500):
+            job = await AuditJob.objects.aget()
+            if job.status in AuditJob.FINISHED:
+                return job
+            await asyncio.sleep(0.01)
+        self.fail("the job did not finish")
+
+    async def test_audit_runs_in_the_bounded_pool(self):
+        response = await self.async_client.post("/audit/", POSTGRES_FORM)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), b"<html><h2>1</h2><h2>2</h2></html>")
+        self.assertTrue(self.threads[0].startswith("auditix-audit"))
+
+    async def test_streamed_report_is_read_as_it_is_written(self):
+        response = await self.async_client.post("/audit/", dict(POSTGRES_FORM, delivery="stream"))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('filename="Stub_Results.htm"', response["Content-Disposition"])
+        self.assertTrue(response.is_async)
+        self.assertEqual(await self.read(response), "<html><h2>1</h2><h2>2</h2></html>")
+        # The stream ends before the job records its report
+        job = await self.finished()
+        self.assertEqual((job.status, job.file_name), (AuditJob.DONE, "Stub_Results.htm"))
+        self.assertIsNotNone(artifacts.find(job.report))
+
+    async def test_event_stream_is_polled_until_the_job_ends(self):
+        job = await AuditJob.objects.acreate(db_type="Postgresql", status=AuditJob.RUNNING)
+        progress = jobs.Progress()
+        patch(self, jobs, "_progress", {job.pk: progress})
+        patch(self, jobs, "EVENTS_POLL", 0.01)
+        check = Check("test", "1.1", "Check 1.1", "1", lambda data: data)
+
+        def run():
+            time.sleep(0.05)
+            progress.result(CheckResult(check, PASSED))
+            AuditJob.objects.filter(pk=job.pk).update(status=AuditJob.DONE)
+            progress.finish()
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        self.addCleanup(worker.join)
+        response = await self.async_client.get(f"/audit/jobs/{job.pk}/events/")
+        self.assertTrue(response.is_async)
+        body = await self.read(response)
+        self.assertTrue(body.startswith("id: 1\nevent: progress\n"))
+        self.assertIn('"status": "done"', body.split("event: status\n")[1])
+
+
+class ReportStreamTests(SimpleTestCase):
+    def setUp(self):
+        temporary_media(self)
+
+    def test_writer_waits_for_a_slow_reader(self):
+        stream = report.ReportStream(maxsize=2).open("Stub_Results.htm")
+        written = []
+
+        def write():
+            with stream:
+                for i in range(5):
+                    stream.write(str(i))
+                    written.append(i)
+            stream.finish()
+
+        writer = threading.Thread(target=write)
+        writer.start()
+        self.addCleanup(writer.join)
+        time.sleep(0.05)
+        # Two chunks wait in the queue, the third write waits for room
+        self.assertEqual(written, [0, 1])
+        self.assertEqual("".join(stream), "01234")
+        writer.join()
+        with open(stream.copy.path) as copy:
+            self.assertEqual(copy.read(), "01234")
+
+    def test_write_after_the_reader_stopped_is_cancelled(self):
+        stream = report.ReportStream().open("Stub_Results.htm")
+        stream.write("<html>")
+        chunks = iter(stream)
+        self.assertEqual(next(chunks), "<html>")
+        # The client went away
+        chunks.close()
+        self.assertTrue(stream.cancelled.is_set())
+        with self.assertRaises(AuditCancelled):
+            stream.write("<table>")
+
+    def test_writer_error_is_raised_to_the_reader(self):
+        stream = report.ReportStream().open("Stub_Results.htm")
+        stream.write("<html>")
+        stream.finish(DriverError("lost connection"))
+        chunks = iter(stream)
+        self.assertEqual(next(chunks), "<html>")
+        with self.assertRaisesRegex(DriverError, "lost connection"):
+            next(chunks)
+
+    def test_reader_stops_once_a_cancelled_writer_was_read(self):
+        stream = report.ReportStream().open("Stub_Results.htm")
+        stream.write("<html>")
+        stream.cancelled.set()
+        self.assertEqual(list(stream), ["<html>"])
+
+    def test_sections_open_at_their_first_result_and_close_at_the_next(self):
+        checks = [collector_check("1.1", PASSED), collector_check("1.2", FAILED), collector_check("2.1", MANUAL)]
+        plan = AuditPlan("test", "CIS", [(Section("test", "1", ("Section 1", "Section 1.1")), checks[:2]),
+                                         (Section("test", "2", ("Section 2",)), checks[2:])])
+        chunks = []
+        rows = report.RunWriter(mock.Mock(write=chunks.append), plan)
+        rows(CheckResult(checks[0], PASSED))
+        self.assertEqual(len(chunks), 2)
+        self.assertIn("Section 1.1", chunks[0])
+        rows(CheckResult(checks[1], FAILED))
+        rows(CheckResult(checks[2], MANUAL, note="ask the DBA"))
+        rows.close()
+        rows.close()
+        kinds = ["close" if chunk == report.TABLE_CLOSE else "open" if "<th>" in chunk else "row" for chunk in chunks]
+        self.assertEqual(kinds, ["open", "row", "row", "close", "open", "row", "close"])
+        self.assertIn('class="status-failed"', chunks[2])
+        self.assertIn("Check 2.1 - ask the DBA", chunks[5])
+
+
+PARAMETERS = "SELECT UPPER(NAME), UPPER(VALUE), CON_ID FROM V$SYSTEM_PARAMETER"
+
+
+class ParameterCursor(ScriptedCursor):
+    """A ScriptedCursor answering the hidden parameter query as "X$"."""
+
+    def execute(self, statement, params=None, **binds):
+        super().execute("X$" if "X_$KSPPI" in statement else statement, params)
+
+
+class ParameterMatrixTests(SimpleTestCase):
+    def context(self, rows, failing=()):
+        self.cursor = ParameterCursor({PARAMETERS: rows, "X$": [("FALSE", 3)]}, failing=failing)
+        ctx = AuditContext(mock.Mock(cursor=mock.Mock(return_value=self.cursor)), "oracle", db_errors=(DriverError,))
+        ctx.cache["oracle.container_mode"] = ContainerMode(True, "ORCL", [(1, "CDB$ROOT"), (3, "PDB1")])
+        return ctx
+
+    def test_whole_cdb_and_root_are_kept_apart(self):
+        ctx = self.context([("AUDIT_TRAIL", "DB", 0), ("AUDIT_TRAIL", "NONE", 1), ("AUDIT_TRAIL", "DB", 3),
+                            ("OS_ROLES", "FALSE", 0)])
+        matrix = parameters(ctx)
+        self.assertEqual(matrix.values("audit_trail"), {0: "DB", 1: "NONE", 3: "DB"})
+        self.assertEqual(matrix.values("OS_ROLES"), {0: "FALSE"})
+        self.assertEqual(matrix.values("REMOTE_OS_ROLES"), {})
+        self.assertEqual(matrix.names([3, 1, 0]), ["ORCL", "PDB1"])
+
+    def test_rule_names_the_failing_containers(self):
+        ctx = self.context([("AUDIT_TRAIL", "NONE", 1), ("AUDIT_TRAIL", "DB", 0), ("AUDIT_TRAIL", "NONE", 3)])
+        collect, evaluate = parameter_rule("AUDIT_TRAIL", one_of("DB", "OS"))
+        self.assertEqual(evaluate(collect(ctx)), (FAILED, "ORCL, PDB1"))
+        collect, evaluate = parameter_rule("OS_ROLES", one_of("FALSE"), required=False)
+        self.assertEqual(evaluate(collect(ctx)), PASSED)
+
+    def test_hidden_parameter_is_read_once_for_every_thread(self):
+        ctx = self.context([])
+        found = []
+        readers = [threading.Thread(target=lambda: found.append(parameters(ctx).values("_trace_files_public")))
+                   for i in range(4)]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        self.assertEqual(found, [{3: "FALSE"}] * 4)
+        self.assertEqual(self.cursor.executed.count("X$"), 1)
+
+    def test_unreadable_hidden_parameter_raises_to_every_reader(self):
+        ctx = self.context([], failing=("X$",))
+        for i in range(2):
+            with self.assertRaises(DriverError):
+                parameters(ctx).values("_TRACE_FILES_PUBLIC")
+        self.assertEqual(self.cursor.executed.count("X$"), 1)
+
+
+def run_check(dialect, check_id, ctx):
+    # The status and note of one registered check over ctx
+    result = execute_check(load(dialect).get(dialect, check_id), ctx)
+    return result.status, result.note
+
+
+PG_SETTINGS = "SELECT name, setting, unit, source, context FROM pg_settings"
+
+
+def setting(name, value, unit=None, context="sighup"):
+    return name, value, unit, "configuration file", context
+
+
+class PostgresSettingsTests(SimpleTestCase):
+    """The setting rules over a fake pg_settings snapshot."""
+
+    def context(self, *rows, failing=()):
+        self.cursor = ScriptedCursor({PG_SETTINGS: list(rows)}, failing=failing)
+        connection = mock.Mock(cursor=mock.Mock(return_value=self.cursor))
+        return AuditContext(connection, "postgres", db_errors=(DriverError,))
+
+    def test_log_rotation_age_is_read_in_minutes(self):
+        self.assertEqual(run_check("postgres", "3.1.8", self.context(setting("log_rotation_age", "1440", "min"))),
+                         (PASSED, None))
+        self.assertEqual(run_check("postgres", "3.1.8", self.context(setting("log_rotation_age", "60", "min"))),
+                         (FAILED, None))
+
+    def test_missing_setting_fails(self):
+        self.assertEqual(run_check("postgres", "3.1.3", self.context()), (FAILED, None))
+
+    def test_every_rule_reads_the_one_snapshot(self):
+        ctx = self.context(setting("logging_collector", "on"), setting("log_connections", "on", context="backend"))
+        self.assertEqual(run_check("postgres", "3.1.3", ctx)[0], PASSED)
+        self.assertEqual(run_check("postgres", "3.1.20", ctx)[0], PASSED)
+        self.assertEqual(self.cursor.executed, [PG_SETTINGS])
+
+    def test_unreadable_settings_are_no_permission(self):
+        ctx = self.context(failing=("pg_settings",))
+        self.assertEqual(run_check("postgres", "3.1.3", ctx)[0], NO_PERMISSION)
+        self.assertEqual(run_check("postgres", "6.2", ctx)[0], NO_PERMISSION)
+
+    def test_backend_parameters_name_the_wrong_ones(self):
+        ctx = self.context(setting("log_connections", "off", context="superuser-backend"),
+                           setting("log_disconnections", "on", context="superuser-backend"),
+                           setting("post_auth_delay", "5", context="backend"),
+                           # Not a backend parameter on this server, so not judged by 6.2
+                           setting("jit_debugging_support", "on", context="superuser"))
+        self.assertEqual(run_check("postgres", "6.2", ctx), (FAILED, "log_connections, post_auth_delay"))
+
+    def test_wal_archiving_accepts_always_and_an_archive_library(self):
+        self.assertEqual(run_check("postgres", "7.4", self.context(
+            setting("archive_mode", "always"), setting("archive_command", ""),
+            setting("archive_library", "basic_archive")))[0], PASSED)
+        self.assertEqual(run_check("postgres", "7.4", self.context(
+            setting("archive_mode", "on"), setting("archive_command", "(disabled)"),
+            setting("archive_library", "")))[0], FAILED)
+        self.assertEqual(run_check("postgres", "7.4", self.context(
+            setting("archive_mode", "off"), setting("archive_command", "cp %p /archive/%f")))[0], FAILED)
+
+    def test_subdirectory_locations(self):
+        rows = (setting("log_directory", "log"), setting("data_directory", "C:/Program Files/PostgreSQL/16/data"),
+                setting("allow_in_place_tablespaces", "off"), setting("temp_tablespaces", ""))
+        self.assertEqual(run_check("postgres", "8.1", self.context(
+            *rows, setting("temp_file_limit", "1048576", "kB")))[0], PASSED)
+        self.assertEqual(run_check("postgres", "8.1", self.context(*rows, setting("temp_file_limit", "0", "kB")))[0],
+                         FAILED)
+        self.assertEqual(run_check("postgres", "8.1", self.context(
+            *rows[:3], setting("temp_tablespaces", "temp_space"), setting("temp_file_limit", "0", "kB")))[0], PASSED)
+
+
+class CatalogCursor:
+    """A cursor answering each statement with the rows of the first key found in it, iterated itersize at a time."""
+
+    def __init__(self, answers, name=None):
+        self.answers = answers
+        self.name = name
+        self.itersize = 1
+        self.executed = []
+        self.batches = []
+        self.closed = False
+
+    def execute(self, statement, params=None):
+        self.executed.append(statement)
+        self.result = next(rows for key, rows in self.answers.items() if key in statement)
+        if isinstance(self.result, Exception):
+            raise self.result
+
+    def fetchall(self):
+        return list(self.result)
+
+    def __iter__(self):
+        for start in range(0, len(self.result), self.itersize):
+            batch = self.result[start:start + self.itersize]
+            self.batches.append(len(batch))
+            yield from batch
+
+    def close(self):
+        self.closed = True
+
+
+class CatalogConnection:
+    def __init__(self, answers):
+        self.answers = answers
+        self.cursors = []
+
+    def cursor(self, name=None):
+        self.cursors.append(CatalogCursor(self.answers, name))
+        return self.cursors[-1]
+
+
+def postgres_catalog(**answers):
+    """A Postgres AuditContext over a CatalogConnection answering statements mentioning each key."""
+    return AuditContext(CatalogConnection(answers), "postgres", db_errors=(DriverError,))
+
+
+def pg_role(name, login=True, superuser=False, replication=False, bypassrls=False):
+    return "role", name, None, login, superuser, replication, bypassrls
+
+
+def pg_member(name, group):
+    return "member", name, group, None, None, None, None
+
+
+RLS_TABLES = [("public.orders", 2), ("public.invoices", 0), ("public.audit", 1), ("hr.salaries", 0), ("hr.staff", 3)]
+
+
+class RowSecurityTests(SimpleTestCase):
+    def test_tables_are_streamed_itersize_rows_at_a_time(self):
+        patch(self, postgres_collectors, "ITERSIZE", 2)
+        ctx = postgres_catalog(pg_policy=RLS_TABLES)
+        rls = row_security(ctx)
+        [cursor] = ctx.main_connection.cursors
+        self.assertEqual((cursor.name, cursor.itersize, cursor.batches), ("auditix_rls", 2, [2, 2, 1]))
+        self.assertTrue(cursor.closed)
+        self.assertEqual(rls.uncovered(), ["hr.salaries", "public.invoices"])
+        self.assertEqual(len(rls.policies), 5)
+
+    def test_unreadable_policies_raise_to_every_reader(self):
+        rls = row_security(postgres_catalog(pg_policy=DriverError("permission denied for table pg_policy")))
+        with self.assertRaises(DriverError):
+            rls.uncovered()
+
+    def test_rls_lists_uncovered_tables_and_logins_bypassing_it_except_superusers(self):
+        ctx = postgres_catalog(pg_policy=RLS_TABLES, pg_auth_members=[
+            pg_role("app", bypassrls=True), pg_role("postgres", superuser=True, bypassrls=True),
+            pg_role("rls_bypass", login=False, bypassrls=True), pg_role("reporter"),
+            pg_member("reporter", "rls_bypass"),
+            # A superuser through membership is reported by 4.6 rather than here as well
+            pg_role("dba", login=False, superuser=True), pg_role("ops"), pg_member("ops", "dba"),
+            pg_member("ops", "rls_bypass")])
+        status, note = run_check("postgres", "4.5", ctx)
+        self.assertEqual(status, FAILED)
+        self.assertTrue(note.startswith("tables without a policy: hr.salaries, public.invoices; "
+                                        "logins with BYPASSRLS: app, reporter (via rls_bypass). "))
+
+    def test_rls_without_any_enabled_table_fails(self):
+        ctx = postgres_catalog(pg_policy=[], pg_auth_members=[pg_role("app")])
+        status, note = run_check("postgres", "4.5", ctx)
+        self.assertEqual(status, FAILED)
+        self.assertTrue(note.startswith("No table has row level security enabled."))
+
+    def test_rls_passes_when_covered_and_not_bypassed(self):
+        ctx = postgres_catalog(pg_policy=[("public.orders", 1)],
+                               pg_auth_members=[pg_role("app"), pg_role("postgres", superuser=True, bypassrls=True)])
+        self.assertEqual(run_check("postgres", "4.5", ctx)[0], PASSED)
+
+
+class RoleGraphTests(SimpleTestCase):
+    def context(self, *rows, extensions=()):
+        return postgres_catalog(pg_auth_members=list(rows), pg_available_extensions=list(extensions))
+
+    def graph(self):
+        return roles(self.context(
+            pg_role("app"), pg_role("app_admin", login=False), pg_role("app_owner", login=False, bypassrls=True),
+            pg_member("app", "app_admin"), pg_member("app_admin", "app_owner"),
+            # A membership cycle
+            pg_member("app_owner", "app_admin"),
+            pg_role("dba", login=False, superuser=True), pg_role("ops"), pg_member("ops", "dba"),
+            pg_role("postgres", superuser=True), pg_role("reporter")))
+
+    def test_membership_is_closed_over_despite_cycles(self):
+        graph = self.graph()
+        self.assertEqual(graph.reachable("app"), {"app", "app_admin", "app_owner"})
+        self.assertEqual(graph.reachable("app_owner"), {"app_owner", "app_admin"})
+        self.assertEqual(graph.reachable("reporter"), {"reporter"})
+
+    def test_attributes_are_held_through_membership(self):
+        graph = self.graph()
+        self.assertEqual(graph.effective("app"), {"superuser": [], "replication": [], "bypassrls": ["app_owner"]})
+        self.assertEqual(graph.holding("superuser"), {"ops": ["dba"], "postgres": ["postgres"]})
+        # Only logins are listed
+        self.assertEqual(sorted(graph.logins()), ["app", "ops", "postgres", "reporter"])
+
+    def test_via_names_the_roles_granting_an_inherited_attribute(self):
+        self.assertEqual(via("postgres", ["postgres"]), "postgres")
+        self.assertEqual(via("ops", ["dba"]), "ops (via dba)")
+        self.assertEqual(via("app", ["app", "app_owner"]), "app")
+
+    def test_unreadable_catalog_raises_to_every_reader(self):
+        graph = roles(postgres_catalog(pg_auth_members=DriverError("permission denied for table pg_authid")))
+        with self.assertRaises(DriverError):
+            graph.logins()
+
+    def test_replication_user_must_not_be_a_superuser(self):
+        ctx = self.context(pg_role("replicator", replication=True),
+                           pg_role("postgres", superuser=True, replication=True))
+        self.assertEqual(run_check("postgres", "7.1", ctx)[0], PASSED)
+        ctx = self.context(pg_role("replicator", replication=True), pg_role("dba", login=False, superuser=True),
+                           pg_member("replicator", "dba"))
+        self.assertEqual(run_check("postgres", "7.1", ctx)[0], FAILED)
+        # REPLICATION held through a role counts
+        ctx = self.context(pg_role("replicator"), pg_role("replication", login=False, replication=True),
+                           pg_member("replicator", "replication"))
+        self.assertEqual(run_check("postgres", "7.1", ctx)[0], PASSED)
+
+    def test_set_user_fails_for_an_admin_with_inherited_superuser(self):
+        installed = [("set_user",)]
+        ctx = self.context(pg_role("postgres", superuser=True), pg_role("reporter"), extensions=installed)
+        self.assertEqual(run_check("postgres", "4.6", ctx)[0], PASSED)
+        ctx = self.context(pg_role("dbadmin"), pg_role("dba", login=False, superuser=True),
+                           pg_member("dbadmin", "dba"), extensions=installed)
+        self.assertEqual(run_check("postgres", "4.6", ctx)[0], FAILED)
+        self.assertEqual(run_check("postgres", "4.6", self.context(pg_role("reporter")))[0], FAILED)
+
+
+class InstanceCursor:
+    """
+    A cursor on a SQL Server instance whose ``databases`` map each key of QUERIES
+    to its rows there, or to the error reading them raises.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.database = connection.database
+        self.description = [("column",)]
+
+    def execute(self, statement, params=None):
+        databases = self.connection.databases
+        if statement.startswith("USE "):
+            name = statement[5:-1].replace("]]", "]")
+            if name not in databases:
+                raise DriverError(f"cannot open database {name}")
+            self.database = name
+            return
+        if statement == "SELECT DB_NAME()":
+            self.sets = [[(self.database,)]]
+        elif statement == "SELECT 1":
+            self.sets = [[(1,)]]
+        elif "sys.databases" in statement:
+            self.sets = [[(name,) for name in sorted(databases) + self.connection.unreadable]]
+        else:
+            parts = statement.split(";\n")
+            parts = parts[1:] if parts[0] == "SET NOCOUNT ON" else parts
+            answers = databases[self.database]
+            self.sets = []
+            for part in parts:
+                key = next(key for key, query in mssql_collectors.QUERIES.items()
+                           if query.query.strip() == part.strip())
+                self.connection.visits.append((self.database, key))
+                rows = answers.get(key, [])
+                if isinstance(rows, Exception):
+                    raise rows
+                self.sets.append(rows)
+
+    def fetchone(self):
+        return self.sets[0][0]
+
+    def fetchall(self):
+        return self.sets[0]
+
+    def nextset(self):
+        self.sets = self.sets[1:]
+        return bool(self.sets)
+
+    def close(self):
+        pass
+
+
+class InstanceConnection:
+    def __init__(self, databases, database="master", unreadable=(), visits=None):
+        self.databases = databases
+        self.database = database
+        self.unreadable = list(unreadable)
+        self.visits = [] if visits is None else visits
+        self.cursors = []
+        self.closed = False
+
+    def cursor(self):
+        self.cursors.append(InstanceCursor(self))
+        return self.cursors[-1]
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+INSTANCE = {
+    "master": {},
+    "msdb": {"proxy_public": [("ssis_proxy",)]},
+    "sales": {"guest_connect": [("sales", "guest", "CONNECT", "GRANT")],
+              "unsafe_assemblies": [("Reports.Clr", "UNSAFE_ACCESS")]},
+    "hr": {"orphaned_users": DriverError("permission denied")},
+}
+
+
+class DatabasePassTests(SimpleTestCase):
+    def test_use_fallback_visits_every_database_on_the_run_connection(self):
+        connection = InstanceConnection(INSTANCE, unreadable=["archive"])
+        databases = mssql_collectors.DatabasePass(AuditContext(connection, "mssql", db_errors=(DriverError,)))
+        rows, errors = databases.findings("guest_connect")
+        self.assertEqual(rows, {"hr": [], "sales": [("sales", "guest", "CONNECT", "GRANT")]})
+        self.assertEqual(set(errors), {"archive"})
+        self.assertEqual(databases.findings("proxy_public"), ({"msdb": [("ssis_proxy",)]}, {}))
+        self.assertEqual(databases.findings("unsafe_assemblies")[0]["sales"], [("Reports.Clr", "UNSAFE_ACCESS")])
+        self.assertIsInstance(databases.findings("orphaned_users")[1]["hr"], DriverError)
+        self.assertEqual(databases.findings("orphaned_users")[0]["master"], [])
+        # The cursor of the run is switched back to the database it started in
+        self.assertEqual([cursor.database for cursor in connection.cursors], ["master"])
+
+    def test_parallel_visits_each_database_once_over_its_own_connection(self):
+        visits, opened = [], []
+
+        def connect(name):
+            if name not in INSTANCE:
+                raise DriverError(f"cannot open database {name}")
+            opened.append(InstanceConnection(INSTANCE, name, visits=visits))
+            return opened[-1]
+
+        ctx = AuditContext(InstanceConnection(INSTANCE, unreadable=["archive"]), "mssql", db_errors=(DriverError,),
+                           connect=connect, workers=4)
+        databases = mssql_collectors.DatabasePass(ctx)
+        self.assertEqual(sorted(connection.database for connection in opened), sorted(INSTANCE))
+        self.assertTrue(all(connection.closed for connection in opened))
+        self.assertEqual({database for database, key in visits}, set(INSTANCE))
+        self.assertEqual(databases.findings("proxy_public"), ({"msdb": [("ssis_proxy",)]}, {}))
+        self.assertEqual(set(databases.findings("guest_connect")[1]), {"archive"})
+        self.assertIsInstance(databases.findings("orphaned_users")[1]["hr"], DriverError)
+
+    def test_parallel_connections_are_leased_from_the_database_pools(self):
+        opened = []
+
+        def connect(connection_string):
+            database = connection_string.split("DATABASE=")[1].split(";")[0]
+            opened.append(InstanceConnection(INSTANCE, database))
+            return opened[-1]
+
+        patch(self, connections.pyodbc, "connect", connect)
+        pools = OrderedDict()
+        patcher = mock.patch("auditix.pool._pools", pools)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        connect_database = connections.mssql_database_connect("db1,1433", "auditor", "secret")
+        for _ in range(2):
+            ctx = AuditContext(InstanceConnection(INSTANCE), "mssql", db_errors=(DriverError,),
+                               connect=connect_database, workers=4)
+            mssql_collectors.DatabasePass(ctx)
+        # The second pass reuses the connections the first one handed back
+        self.assertEqual(sorted(connection.database for connection in opened), sorted(INSTANCE))
+        self.assertFalse(any(connection.closed for connection in opened))
+        self.assertEqual(len(pools), len(INSTANCE))
+
+
+def sqlserver(answers):
+    """A SQL Server AuditContext over a CatalogConnection answering statements mentioning each key of answers."""
+    return AuditContext(CatalogConnection(answers), "mssql", db_errors=(DriverError,))
+
+
+def sql_configurations(*options, clustered=0, registry=("1433", 0, None)):
+    # Answers for the configuration snapshot, the cluster property and the registry batch
+    return {"sys.configurations": list(options), "IsClustered": [(clustered,)],
+            "xp_instance_regread": [registry]}
+
+
+class SqlServerConfigurationTests(SimpleTestCase):
+    """The configuration and registry rules over fake sys.configurations and registry rows."""
+
+    def test_clr_enabled_passes_when_off_or_under_strict_security(self):
+        def clr(enabled, strict):
+            return run_check("mssql", "2.2", sqlserver(sql_configurations(
+                ("clr enabled",) + enabled, ("clr strict security",) + strict)))[0]
+
+        self.assertEqual(clr((0, 0), (0, 0)), PASSED)
+        self.assertEqual(clr((1, 1), (1, 1)), PASSED)
+        self.assertEqual(clr((1, 1), (0, 0)), FAILED)
+        # Configured off, but not reconfigured yet
+        self.assertEqual(clr((0, 1), (1, 0)), FAILED)
+
+    def test_remote_admin_connections_are_allowed_on_a_cluster(self):
+        self.assertEqual(run_check("mssql", "2.7", sqlserver(sql_configurations(
+            ("remote admin connections", 1, 1), clustered=1)))[0], PASSED)
+        self.assertEqual(run_check("mssql", "2.7", sqlserver(sql_configurations(
+            ("remote admin connections", 1, 1))))[0], FAILED)
+        self.assertEqual(run_check("mssql", "2.7", sqlserver(sql_configurations(
+            ("remote admin connections", 0, 0))))[0], PASSED)
+
+    def test_every_option_reads_the_one_snapshot(self):
+        ctx = sqlserver(sql_configurations(("Ad Hoc Distributed Queries", 0, 0), ("remote access", 1, 1),
+                                           ("default trace enabled", 1, 1)))
+        self.assertEqual(run_check("mssql", "2.1", ctx)[0], PASSED)
+        self.assertEqual(run_check("mssql", "2.6", ctx)[0], FAILED)
+        self.assertEqual(run_check("mssql", "5.2", ctx)[0], PASSED)
+        # An option missing from the snapshot fails
+        self.assertEqual(run_check("mssql", "2.8", ctx)[0], FAILED)
+        statements = [cursor.executed for cursor in ctx.main_connection.cursors]
+        self.assertEqual(sum("sys.configurations" in statement for executed in statements for statement in executed),
+                         1)
+
+    def test_unreadable_configurations_are_no_permission(self):
+        ctx = sqlserver({"sys.configurations": DriverError("permission denied"), "IsClustered": [(0,)]})
+        self.assertEqual(run_check("mssql", "2.2", ctx)[0], NO_PERMISSION)
+        self.assertEqual(run_check("mssql", "2.7", ctx)[0], NO_PERMISSION)
+
+    def test_registry_values_are_read_in_one_batch(self):
+        ctx = sqlserver(sql_configurations(registry=("1433", 1, None)))
+        self.assertEqual(run_check("mssql", "2.11", ctx)[0], FAILED)
+        self.assertEqual(run_check("mssql", "2.12", ctx)[0], PASSED)
+        # Not set in the registry: the default of 6 error logs
+        self.assertEqual(run_check("mssql", "5.1", ctx)[0], FAILED)
+        self.assertEqual(len(ctx.main_connection.cursors[0].executed), 1)
+        ctx = sqlserver(sql_configurations(registry=("51433", 0, 12)))
+        self.assertEqual(run_check("mssql", "2.11", ctx)[0], PASSED)
+        self.assertEqual(run_check("mssql", "2.12", ctx)[0], FAILED)
+        self.assertEqual(run_check("mssql", "5.1", ctx)[0], PASSED)
+
+    def test_unreadable_registry_is_no_permission(self):
+        ctx = sqlserver({"xp_instance_regread": DriverError("EXECUTE permission denied")})
+        self.assertEqual(run_check("mssql", "2.11", ctx)[0], NO_PERMISSION)
+        self.assertEqual(run_check("mssql", "5.1", ctx)[0], NO_PERMISSION)
+
+    def test_unsafe_assemblies_are_read_from_sys_assemblies_of_every_database(self):
+        connection = InstanceConnection(INSTANCE)
+        ctx = AuditContext(connection, "mssql", db_errors=(DriverError,))
+        self.assertEqual(run_check("mssql", "6.2", ctx), (FAILED, "sales"))
+        self.assertEqual({database for database, key in connection.visits if key == "unsafe_assemblies"},
+                         set(INSTANCE))
+        unreadable = dict(INSTANCE, hr={"unsafe_assemblies": DriverError("permission denied")}, sales={})
+        self.assertEqual(run_check("mssql", "6.2", AuditContext(InstanceConnection(unreadable), "mssql",
+                                                                db_errors=(DriverError,))),
+                         (NO_PERMISSION, "Could not read hr"))
+
+
+class DictionaryCursor:
+    """
+    An Oracle cursor answering each statement from the rows of the view it
+    selects from, with the selected columns; a ref cursor batch opens each
+    of its cursors on its statement.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.arraysize = 100
+
+    def execute(self, statement, params=None):
+        self.connection.executed.append(statement)
+        if statement.startswith("BEGIN"):
+            for index, query in re.findall(r"OPEN :batch_cursor(\d+) FOR (.*);", statement):
+                params[f"batch_cursor{index}"].answer(query)
+        else:
+            self.answer(statement)
+
+    def answer(self, statement):
+        columns, view = re.match(r"SELECT (.*?) FROM ([\w$]+)", statement).groups()
+        rows = self.connection.views.get(view, [])
+        if isinstance(rows, Exception):
+            raise rows
+        self.description = [(column,) for column in columns.split(", ")]
+        self.rows = rows
+
+    def fetchone(self):
+        return self.rows[0]
+
+    def fetchall(self):
+        return self.rows
+
+    def close(self):
+        pass
+
+
+class DictionaryConnection:
+    def __init__(self, views):
+        self.views = views
+        self.executed = []
+
+    def cursor(self):
+        return DictionaryCursor(self)
+
+
+def dictionary(views):
+    """An Oracle AuditContext over a server holding the rows of the given views, or raising their error."""
+    return AuditContext(DictionaryConnection(views), "oracle", db_errors=(DriverError,))
+
+
+class OracleSnapshotTests(SimpleTestCase):
+    def test_container_database_is_read_through_the_cdb_views(self):
+        ctx = dictionary({"V$DATABASE": [("YES", "ORCL")], "V$CONTAINERS": [(1, "CDB$ROOT"), (3, "PDB1")],
+                          "CDB_USERS": [("SYS", "OPEN", "DEFAULT", "PASSWORD", "Y", 1),
+                                        ("APP", "OPEN", "APP_PROFILE", "PASSWORD", "N", 3),
+                                        ("C##AUDIT", "OPEN", "DEFAULT", "PASSWORD", "N", 0)]})
+        catalog = snapshot(ctx)
+        self.assertEqual((catalog.mode.cdb, catalog.mode.family), (True, "CDB"))
+        self.assertEqual([(row["USERNAME"], row["CON_ID"], row["CON_NAME"]) for row in catalog.rows("USERS")],
+                         [("SYS", 1, "ORCL"), ("APP", 3, "PDB1"), ("C##AUDIT", 0, "ORCL")])
+        self.assertIn("SELECT USERNAME, ACCOUNT_STATUS, PROFILE, AUTHENTICATION_TYPE, ORACLE_MAINTAINED, CON_ID "
+                      "FROM CDB_USERS", ctx.main_connection.executed[-1])
+
+    def test_non_container_database_is_read_through_the_dba_views(self):
+        ctx = dictionary({"V$DATABASE": [("NO", "ORCL")], "DBA_USERS": [("APP", "OPEN", "DEFAULT", "PASSWORD", "N")]})
+        catalog = snapshot(ctx)
+        self.assertEqual((catalog.mode.cdb, catalog.mode.family), (False, "DBA"))
+        self.assertEqual(catalog.rows("USERS"), [{"USERNAME": "APP", "ACCOUNT_STATUS": "OPEN", "PROFILE": "DEFAULT",
+                                                  "AUTHENTICATION_TYPE": "PASSWORD", "ORACLE_MAINTAINED": "N",
+                                                  "CON_ID": None, "CON_NAME": "ORCL"}])
+        # V$CONTAINERS is read only for a container database
+        self.assertEqual(ctx.main_connection.executed[0], "SELECT CDB, NAME FROM V$DATABASE")
+        self.assertFalse(any("V$CONTAINERS" in statement for statement in ctx.main_connection.executed))
+        self.assertIn("FROM DBA_USERS", ctx.main_connection.executed[-1])
+
+    def test_unreadable_v_database_falls_back_to_the_dba_views(self):
+        mode = ContainerMode.probe(dictionary({"V$DATABASE": DriverError("ORA-00942")}))
+        self.assertEqual((mode.cdb, mode.family, mode.name(3)), (False, "DBA", None))
+
+    def test_every_view_is_fetched_in_one_batch_and_keeps_its_error(self):
+        ctx = dictionary({"V$DATABASE": [("YES", "ORCL")], "V$CONTAINERS": [(3, "PDB1")],
+                          "CDB_ROLES": [("DBA", "Y", 1)], "CDB_PROXIES": DriverError("ORA-01031")})
+        catalog = snapshot(ctx).collect()
+        batches = [statement for statement in ctx.main_connection.executed if statement.startswith("BEGIN")]
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].count("OPEN :batch_cursor"), len(VIEWS))
+        self.assertEqual(catalog.rows("ROLES"), [{"ROLE": "DBA", "ORACLE_MAINTAINED": "Y", "CON_ID": 1,
+                                                  "CON_NAME": "ORCL"}])
+        with self.assertRaises(DriverError):
+            catalog.rows("PROXIES")
+        # Nothing is fetched again once collected
+        executed = len(ctx.main_connection.executed)
+        catalog.rows("USERS")
+        self.assertEqual(len(ctx.main_connection.executed), executed)
+
+
+class NetConfigTests(SimpleTestCase):
+    def write(self, directory, name, text):
+        path = os.path.join(directory, name)
+        with open(path, "w") as f:
+            f.write(text)
+        return path
+
+    def test_parse_nested_values_word_lists_and_comments(self):
+        parsed = netconfig.parse(
+            "# listener.ora\n"
+            "LISTENER =\n"
+            "  (DESCRIPTION_LIST =\n"
+            "    (DESCRIPTION = (ADDRESS = (PROTOCOL = TCP)(HOST = db1)(PORT = 1521)))\n"
+            "  )\n"
+            "admin_restrictions_listener = ON  # set by the DBA\n"
+            "SQLNET.ALLOWED_LOGON_VERSION_SERVER = 12\n"
+            "SQLNET.AUTHENTICATION_SERVICES = (BEQ, TCPS)\n"
+            'SQLNET.WALLET_OVERRIDE = "TRUE"\n')
+        self.assertEqual(parsed, [
+            ("LISTENER", [("DESCRIPTION_LIST", [("DESCRIPTION", [("ADDRESS", [
+                ("PROTOCOL", "TCP"), ("HOST", "db1"), ("PORT", "1521")])])])]),
+            ("ADMIN_RESTRICTIONS_LISTENER", "ON"),
+            ("SQLNET.ALLOWED_LOGON_VERSION_SERVER", "12"),
+            ("SQLNET.AUTHENTICATION_SERVICES", ("BEQ", "TCPS")),
+            ("SQLNET.WALLET_OVERRIDE", "TRUE"),
+        ])
+
+    def test_parse_error(self):
+        with self.assertRaises(netconfig.NetConfigError):
+            netconfig.parse("LISTENER = (DESCRIPTION = (ADDRESS = (HOST = db1)")
+
+    def test_ifile_is_included_in_place(self):
+        with tempfile.TemporaryDirectory() as directory:
+            self.write(directory, "common.ora", "SECURE_REGISTER_LISTENER = (TCP)\nADMIN_RESTRICTIONS_LISTENER = OFF\n")
+            path = self.write(directory, "listener.ora",
+                              "ADMIN_RESTRICTIONS_LISTENER = ON\nIFILE = common.ora\n"
+                              "LISTENER = (DESCRIPTION = (ADDRESS = (PROTOCOL = TCP)(HOST = db1)))\n")
+            config = netconfig.load(path)
+            self.assertEqual(config.names(), ["ADMIN_RESTRICTIONS_LISTENER", "SECURE_REGISTER_LISTENER",
+                                              "ADMIN_RESTRICTIONS_LISTENER", "LISTENER"])
+            # The last setting of a name wins, as with the Net services
+            self.assertEqual(config.get("admin_restrictions_listener"), "OFF")
+            self.assertEqual(config.listeners(), ["LISTENER"])
+            self.assertEqual(set(config.files), {path, os.path.join(directory, "common.ora")})
+
+    def test_model_is_cached_until_the_file_or_an_include_changes(self):
+        with tempfile.TemporaryDirectory() as directory:
+            common = self.write(directory, "common.ora", "ADMIN_RESTRICTIONS_LISTENER = OFF\n")
+            path = self.write(directory, "listener.ora", "IFILE = common.ora\n")
+            first = netconfig.load(path)
+            self.assertIs(netconfig.load(path), first)
+            self.write(directory, "common.ora", "ADMIN_RESTRICTIONS_LISTENER = ON\n")
+            later = os.stat(common).st_mtime_ns + 1_000_000_000
+            os.utime(common, ns=(later, later))
+            second = netconfig.load(path)
+            self.assertIsNot(second, first)
+            self.assertEqual(second.get("ADMIN_RESTRICTIONS_LISTENER"), "ON")
+
+    def test_admin_file_reports_a_missing_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            config, reason = netconfig.admin_file("sqlnet.ora", oracle_home=directory)
+        self.assertIsNone(config)
+        self.assertIn("sqlnet.ora path not found", reason)
+
+
+def oracle_context(**views):
+    """An Oracle AuditContext whose snapshot holds the given view rows, never reaching a server."""
+    ctx = AuditContext(FakeConnection(), "oracle")
+    ctx.cache["oracle.container_mode"] = ContainerMode(True, "ORCL", [(3, "PDB1")])
+    catalog = OracleSnapshot(ctx)
+    for name, rows in views.items():
+        catalog.data[name] = [dict(row, CON_NAME=catalog.mode.name(row["CON_ID"])) for row in rows]
+    ctx.cache["oracle.snapshot"] = catalog
+    return ctx
+
+
+def user(name, con_id=3, profile="DEFAULT", maintained="N"):
+    return {"USERNAME": name, "PROFILE": profile, "ORACLE_MAINTAINED": maintained, "CON_ID": con_id}
+
+
+def role_grant(grantee, role, con_id=3):
+    return {"GRANTEE": grantee, "GRANTED_ROLE": role, "ADMIN_OPTION": "NO", "CON_ID": con_id}
+
+
+def sys_grant(grantee, privilege, con_id=3):
+    return {"GRANTEE": grantee, "PRIVILEGE": privilege, "ADMIN_OPTION": "NO", "CON_ID": con_id}
+
+
+class PrivilegeGraphTests(SimpleTestCase):
+    def graph(self):
+        return privileges(oracle_context(
+            USERS=[user("APP"), user("REPORTS"), user("CLERK"), user("APP", con_id=1)],
+            ROLES=[{"ROLE": "DBA", "ORACLE_MAINTAINED": "Y", "CON_ID": 3}],
+            ROLE_PRIVS=[role_grant("APP", "APP_ADMIN"), role_grant("APP_ADMIN", "APP_OWNER"),
+                        role_grant("APP_OWNER", "APP_ADMIN"), role_grant("REPORTS", "APP_READ"),
+                        role_grant("PUBLIC", "EVERYONE"), role_grant("APP", "OTHER_PDB_ROLE", con_id=1)],
+            SYS_PRIVS=[sys_grant("APP_OWNER", "CREATE ANY TABLE"), sys_grant("EVERYONE", "CREATE SESSION"),
+                       sys_grant("APP_READ", "SELECT ANY TABLE")],
+        ))
+
+    def test_roles_are_closed_over_the_hierarchy_despite_cycles(self):
+        graph = self.graph()
+        self.assertEqual(graph.roles(3, "APP"), {"APP_ADMIN", "APP_OWNER"})
+        self.assertEqual(graph.roles(3, "REPORTS"), {"APP_READ"})
+        self.assertEqual(graph.roles(3, "CLERK"), set())
+
+    def test_grants_are_kept_per_container(self):
+        graph = self.graph()
+        self.assertEqual(graph.roles(1, "APP"), {"OTHER_PDB_ROLE"})
+        self.assertEqual(graph.holders(1, "OTHER_PDB_ROLE"), {"APP"})
+
+    def test_holders_reach_every_user_through_roles_and_public(self):
+        graph = self.graph()
+        self.assertEqual(graph.holders(3, "APP_OWNER"), {"APP"})
+        self.assertEqual(graph.holders(3, "EVERYONE"), {"APP", "REPORTS", "CLERK"})
+        self.assertEqual(graph.who_holds("SELECT ANY TABLE"), {3: {"REPORTS"}})
+
+    def test_effective_system_privileges_include_the_roles_of_public(self):
+        graph = self.graph()
+        self.assertEqual(graph.sys_privileges(3, "APP"), {"CREATE ANY TABLE", "CREATE SESSION"})
+        self.assertEqual(graph.sys_privileges(3, "CLERK"), {"CREATE SESSION"})
+        self.assertEqual(graph.sys_privileges(1, "APP"), set())
+
+    def test_grants_to_oracle_maintained_grantees_are_left_out(self):
+        graph = self.graph()
+        rows = [sys_grant("DBA", "CREATE ANY TABLE"), sys_grant("APP_OWNER", "CREATE ANY TABLE")]
+        found = graph.grants(rows, lambda row: "ANY" in row["PRIVILEGE"])
+        self.assertEqual([(row["GRANTEE"], row["HOLDERS"]) for row in found], [("APP_OWNER", {"APP"})])
+
+
+def profile_row(profile, resource, limit, con_id=3):
+    return {"PROFILE": profile, "RESOURCE_NAME": resource, "LIMIT": limit, "CON_ID": con_id}
+
+
+class ProfileLimitsTests(SimpleTestCase):
+    def limits(self):
+        return profile_limits(oracle_context(
+            USERS=[user("APP", profile="APP_PROFILE"), user("CLERK"), user("BATCH", con_id=1, profile="APP_PROFILE")],
+            PROFILES=[profile_row("DEFAULT", "FAILED_LOGIN_ATTEMPTS", "10"),
+                      profile_row("APP_PROFILE", "FAILED_LOGIN_ATTEMPTS", "DEFAULT"),
+                      profile_row("APP_PROFILE", "PASSWORD_LIFE_TIME", "90"),
+                      profile_row("UNUSED", "FAILED_LOGIN_ATTEMPTS", "UNLIMITED"),
+                      profile_row("DEFAULT", "FAILED_LOGIN_ATTEMPTS", "5", con_id=1),
+                      profile_row("APP_PROFILE", "FAILED_LOGIN_ATTEMPTS", "DEFAULT", con_id=1)],
+        ))
+
+    def test_default_is_resolved_per_container(self):
+        limits = self.limits()
+        self.assertEqual(limits.limit(3, "APP_PROFILE", "FAILED_LOGIN_ATTEMPTS"), "10")
+        self.assertEqual(limits.limit(1, "APP_PROFILE", "FAILED_LOGIN_ATTEMPTS"), "5")
+        self.assertEqual(limits.limit(3, "APP_PROFILE", "PASSWORD_LIFE_TIME"), "90")
+
+    def test_profiles_no_user_is_assigned_are_left_out(self):
+        limits = self.limits()
+        self.assertIsNone(limits.limit(3, "UNUSED", "FAILED_LOGIN_ATTEMPTS"))
+        # The DEFAULT profile of container 1 resolves the others there but no user there uses it
+        self.assertIsNone(limits.limit(1, "DEFAULT", "FAILED_LOGIN_ATTEMPTS"))
+
+    def test_resource_lists_the_effective_limits_of_every_profile(self):
+        rows = self.limits().resource("FAILED_LOGIN_ATTEMPTS")
+        self.assertEqual(sorted((row["CON_ID"], row["PROFILE"], row["LIMIT"]) for row in rows),
+                         [(1, "APP_PROFILE", "5"), (3, "APP_PROFILE", "10"), (3, "DEFAULT", "10")])
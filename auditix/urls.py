@@ -4,7 +4,13 @@ from . import views
 
 urlpatterns = [
     path('', views.home, name='home'),  # Home page
-    path('audit/', views.audit_database, name='audit_database'),  # Audit endpoint
-    path('audit_database/', views.audit_database, name='audit_database'),
+    path('audit/', views.audit_database_async, name='audit_database'),  # Audit endpoint
+    path('audit_database/', views.audit_database_async, name='audit_database'),
+    path('audit/jobs/', views.submit_audit, name='submit_audit'),  # Queue an audit, returns its job id
+    path('audit/jobs/<uuid:job_id>/', views.job_status, name='job_status'),
+    path('audit/jobs/<uuid:job_id>/events/', views.job_events, name='job_events'),  # Server-Sent Events
+    path('audit/jobs/<uuid:job_id>/result/', views.job_result, name='job_result'),
+    path('audit/jobs/<uuid:job_id>/cancel/', views.cancel_job, name='cancel_job'),
+    path('audit/reports/<str:artifact_id>/', views.report_artifact, name='report_artifact'),  # A report by its id
 ]
 